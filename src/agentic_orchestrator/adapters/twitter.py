@@ -6,10 +6,16 @@ for improved reliability and redundancy.
 """
 
 import asyncio
+import atexit
+import itertools
+import json
+import multiprocessing
 import os
 import random
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
 import time
 
 import httpx
@@ -17,6 +23,82 @@ import feedparser
 
 from .base import BaseAdapter, AdapterConfig, AdapterResult, SignalData
 
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+NITTER_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (compatible; MosslandAO/1.0; +https://ao.moss.land)",
+    "Accept": "application/rss+xml, application/xml;q=0.9, */*;q=0.8",
+    "Accept-Encoding": "gzip, deflate",
+}
+
+# Raw description characters kept per entry (covers 500 visible chars after tag removal)
+MAX_RAW_DESCRIPTION = 2000
+
+# Worker processes for RSS parsing, created on first use
+_parse_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """Get the shared RSS parsing process pool."""
+    global _parse_pool
+    if _parse_pool is None:
+        # The pool is created from inside threaded API/scheduler processes, where
+        # forking can deadlock; start workers from a clean process instead
+        start_method = (
+            "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        )
+        _parse_pool = ProcessPoolExecutor(
+            max_workers=min(4, os.cpu_count() or 1),
+            mp_context=multiprocessing.get_context(start_method),
+        )
+        atexit.register(shutdown_parse_pool)
+    return _parse_pool
+
+
+def shutdown_parse_pool() -> None:
+    """
+    Stop the RSS parsing workers, if they were started.
+
+    Call before the process exits; the atexit hook runs after
+    concurrent.futures has already torn the pool down and only catches
+    processes that skip this.
+    """
+    global _parse_pool
+    if _parse_pool is not None:
+        _parse_pool.shutdown(cancel_futures=True)
+        _parse_pool = None
+
+
+def _parse_feed_entries(content: bytes, limit: int) -> List[Dict[str, Any]]:
+    """
+    Parse an RSS payload into plain entry dicts.
+
+    Module-level so it can be pickled into a worker process.
+
+    Args:
+        content: Raw RSS bytes
+        limit: Maximum number of entries to return
+
+    Returns:
+        List of entries with title, description, link and published.
+        Descriptions are truncated to MAX_RAW_DESCRIPTION before HTML cleanup.
+    """
+    parsed = feedparser.parse(content)
+    return [
+        {
+            "title": entry.get("title", ""),
+            "description": entry.get("description", "")[:MAX_RAW_DESCRIPTION],
+            "link": entry.get("link"),
+            "published": entry.get("published"),
+        }
+        for entry in parsed.entries[:limit]
+    ]
+
 
 class TwitterAdapter(BaseAdapter):
     """
@@ -80,6 +162,27 @@ class TwitterAdapter(BaseAdapter):
         "LLM blockchain",
     ]
 
+    # Keywords for tweet categorization (crypto takes priority over AI)
+    CRYPTO_KEYWORDS: Tuple[str, ...] = (
+        "ethereum", "bitcoin", "defi", "nft", "web3", "blockchain",
+        "token", "crypto", "wallet", "staking", "yield", "airdrop",
+    )
+    AI_KEYWORDS: Tuple[str, ...] = (
+        "ai", "gpt", "llm", "openai", "anthropic", "claude",
+        "machine learning", "neural", "chatbot", "agent",
+    )
+
+    # Related topics and their relevance weights
+    RELEVANCE_KEYWORDS: Tuple[Tuple[str, float], ...] = (
+        ("metaverse", 2.0),
+        ("ar ", 1.5),  # Augmented reality
+        ("nft", 1.0),
+        ("gaming", 1.0),
+        ("web3", 1.0),
+        ("defi", 0.5),
+        ("dao", 0.5),
+    )
+
     # Nitter instances (public RSS proxies)
     NITTER_INSTANCES: List[str] = [
         "nitter.net",
@@ -94,15 +197,43 @@ class TwitterAdapter(BaseAdapter):
         "nitter.it",
     ]
 
+    # Per-request timeouts for Nitter; flaky hosts fail fast so the next one is tried
+    NITTER_TIMEOUT = httpx.Timeout(connect=3, read=8, write=3, pool=3)
+    NITTER_REQUEST_DEADLINE = 10  # seconds, caps a single GET including redirects
+
+    # Seconds between Nitter instance health probes
+    INSTANCE_CHECK_INTERVAL = 1800
+
+    # Maximum number of tweet URLs remembered for deduplication
+    MAX_SEEN_URLS = 5000
+
+    # Cache file shared across scheduler runs
+    CACHE_FILE = Path(__file__).parent.parent.parent.parent / "data" / "twitter_cache.json"
+
     def __init__(
         self,
         config: Optional[AdapterConfig] = None,
         twitter_bearer_token: Optional[str] = None,
+        cache_file: Optional[Path] = None,
     ):
         super().__init__(config or AdapterConfig(timeout=60))
         self.twitter_bearer_token = twitter_bearer_token or os.getenv("TWITTER_BEARER_TOKEN")
         self._working_instances: List[str] = []
-        self._last_instance_check: Optional[datetime] = None
+        self._instance_cycle: Optional[itertools.cycle] = None
+        self._last_instance_check: float = 0.0  # time.monotonic() of last probe
+        self._cache_file = cache_file or self.CACHE_FILE
+
+        # LRU of tweet URLs already emitted (oldest first)
+        self._seen_urls: "OrderedDict[str, None]" = OrderedDict()
+
+        # Conditional request validators keyed by (instance, account)
+        self._etags: Dict[tuple, tuple] = {}
+        self._load_cache()
+
+        # Round-robin over accounts, shuffled once to distribute load
+        self._account_cycle = itertools.cycle(
+            random.sample(self.TRACKED_ACCOUNTS, len(self.TRACKED_ACCOUNTS))
+        )
 
     @property
     def name(self) -> str:
@@ -120,6 +251,7 @@ class TwitterAdapter(BaseAdapter):
         # Fetch from accounts
         account_signals = await self._fetch_accounts()
         signals.extend(account_signals)
+        self._save_cache()
 
         # If we have Twitter API access, also search keywords
         if self.twitter_bearer_token:
@@ -146,71 +278,94 @@ class TwitterAdapter(BaseAdapter):
         # Only refresh every 30 minutes
         if (
             self._last_instance_check
-            and (datetime.utcnow() - self._last_instance_check).seconds < 1800
+            and time.monotonic() - self._last_instance_check < self.INSTANCE_CHECK_INTERVAL
         ):
             return
 
         working = []
-        async with httpx.AsyncClient(timeout=10) as client:
+        async with self._nitter_client() as client:
             for instance in self.NITTER_INSTANCES:
                 try:
                     # Test with a simple request
-                    response = await client.get(
-                        f"https://{instance}/VitalikButerin/rss",
-                        follow_redirects=True
+                    response = await asyncio.wait_for(
+                        client.get(
+                            f"https://{instance}/VitalikButerin/rss",
+                            follow_redirects=True
+                        ),
+                        timeout=self.NITTER_REQUEST_DEADLINE,
                     )
-                    if response.status_code == 200 and len(response.text) > 100:
+                    if response.status_code == 200 and self._has_feed_body(response):
                         working.append(instance)
                 except Exception:
                     continue
 
         if working:
-            self._working_instances = working
+            self._set_working_instances(working)
         else:
             # Fallback to all instances if none work
-            self._working_instances = self.NITTER_INSTANCES[:3]
+            self._set_working_instances(self.NITTER_INSTANCES[:3])
 
-        self._last_instance_check = datetime.utcnow()
+        self._last_instance_check = time.monotonic()
 
     async def _fetch_accounts(self) -> List[SignalData]:
         """Fetch tweets from tracked accounts via Nitter RSS."""
         signals: List[SignalData] = []
 
         if not self._working_instances:
-            self._working_instances = self.NITTER_INSTANCES[:3]
+            self._set_working_instances(self.NITTER_INSTANCES[:3])
 
-        async with httpx.AsyncClient(timeout=30) as client:
-            # Shuffle accounts to distribute load
-            accounts = self.TRACKED_ACCOUNTS.copy()
-            random.shuffle(accounts)
+        tries_per_account = min(3, len(self._working_instances))
 
-            for account in accounts[:15]:  # Limit to 15 accounts per run
+        async with self._nitter_client() as client:
+            # Limit to 15 accounts per run, continuing the rotation each run
+            for account in itertools.islice(self._account_cycle, 15):
                 # Try multiple instances
-                for instance in random.sample(
-                    self._working_instances,
-                    min(3, len(self._working_instances))
-                ):
+                instances_to_try = [
+                    next(self._instance_cycle) for _ in range(tries_per_account)
+                ]
+                for instance in instances_to_try:
                     try:
-                        response = await client.get(
-                            f"https://{instance}/{account}/rss",
-                            follow_redirects=True
+                        headers = {}
+                        etag, last_modified = self._etags.get((instance, account), (None, None))
+                        if etag:
+                            headers["If-None-Match"] = etag
+                        if last_modified:
+                            headers["If-Modified-Since"] = last_modified
+
+                        response = await asyncio.wait_for(
+                            client.get(
+                                f"https://{instance}/{account}/rss",
+                                headers=headers,
+                                follow_redirects=True
+                            ),
+                            timeout=self.NITTER_REQUEST_DEADLINE,
                         )
 
+                        if response.status_code == 304:
+                            break  # Feed unchanged, move to next account
+
                         if response.status_code == 200:
-                            parsed = feedparser.parse(response.text)
+                            etag = response.headers.get("etag")
+                            last_modified = response.headers.get("last-modified")
+                            if etag or last_modified:
+                                self._etags[(instance, account)] = (etag, last_modified)
+
+                            entries = await self._parse_feed(response.content, limit=5)
+
+                            for entry in entries:  # Latest 5 tweets
+                                # Skip tweets already emitted in a previous run
+                                link = entry.get("link")
+                                if link and link in self._seen_urls:
+                                    continue
 
-                            for entry in parsed.entries[:5]:  # Latest 5 tweets
                                 # Extract tweet content
                                 title = entry.get("title", "")[:280]
                                 description = self._clean_html(
                                     entry.get("description", "")
                                 )[:500]
 
-                                # Determine category based on content
-                                category = self._categorize_tweet(title + " " + description)
-
-                                # Calculate relevance score
-                                relevance = self._calculate_relevance(
+                                # Determine category and relevance score
+                                category, relevance = self._analyze_content(
                                     title + " " + description
                                 )
 
@@ -219,7 +374,7 @@ class TwitterAdapter(BaseAdapter):
                                     category=category,
                                     title=f"@{account}: {title}",
                                     summary=description if description != title else None,
-                                    url=entry.get("link"),
+                                    url=link,
                                     raw_data={
                                         "type": "tweet",
                                         "account": account,
@@ -233,9 +388,14 @@ class TwitterAdapter(BaseAdapter):
                                     }
                                 )
                                 signals.append(signal)
+                                if link:
+                                    self._remember_url(link)
 
                             break  # Success, move to next account
 
+                    except asyncio.TimeoutError:
+                        print(f"Timeout fetching @{account} from {instance}")
+                        continue
                     except Exception as e:
                         print(f"Error fetching @{account} from {instance}: {e}")
                         continue
@@ -245,6 +405,29 @@ class TwitterAdapter(BaseAdapter):
 
         return signals
 
+    @staticmethod
+    def _has_feed_body(response: httpx.Response, min_bytes: int = 100) -> bool:
+        """Check a probe response carries a body, without decoding it to text."""
+        content_length = response.headers.get("content-length", "")
+        if content_length.isdigit() and int(content_length) > min_bytes:
+            return True
+        return len(response.content) > min_bytes
+
+    def _set_working_instances(self, instances: List[str]) -> None:
+        """Set working instances and restart the round-robin over them."""
+        self._working_instances = instances
+        self._instance_cycle = itertools.cycle(
+            random.sample(instances, len(instances))
+        )
+
+    def _nitter_client(self) -> httpx.AsyncClient:
+        """Create an HTTP client for Nitter, multiplexing over HTTP/2 when available."""
+        return httpx.AsyncClient(
+            timeout=self.NITTER_TIMEOUT,
+            headers=NITTER_HEADERS,
+            http2=HTTP2_AVAILABLE,
+        )
+
     async def _search_keywords_api(self) -> List[SignalData]:
         """Search for keywords using Twitter API v2 (if available)."""
         signals: List[SignalData] = []
@@ -272,13 +455,12 @@ class TwitterAdapter(BaseAdapter):
 
                 if response.status_code == 200:
                     data = response.json()
-                    for tweet in data.get("data", []):
-                        metrics = tweet.get("public_metrics", {})
 
-                        # Skip low-engagement tweets
-                        if not self._meets_engagement_threshold(metrics):
-                            continue
+                    # Skip low-engagement tweets
+                    tweets = self._filter_by_engagement(data.get("data", []))
 
+                    for tweet in tweets:
+                        metrics = tweet.get("public_metrics", {})
                         signal = SignalData(
                             source=self.name,
                             category="crypto",  # Keywords are crypto-focused
@@ -304,6 +486,40 @@ class TwitterAdapter(BaseAdapter):
 
         return signals
 
+    def _remember_url(self, url: str) -> None:
+        """Record a tweet URL as seen, evicting the oldest beyond the limit."""
+        self._seen_urls[url] = None
+        self._seen_urls.move_to_end(url)
+        while len(self._seen_urls) > self.MAX_SEEN_URLS:
+            self._seen_urls.popitem(last=False)
+
+    def _load_cache(self) -> None:
+        """Load seen tweet URLs and feed validators from disk."""
+        try:
+            if self._cache_file.exists():
+                data = json.loads(self._cache_file.read_text())
+                for url in data.get("seen_urls", [])[-self.MAX_SEEN_URLS:]:
+                    self._seen_urls[url] = None
+                for key, validators in data.get("etags", {}).items():
+                    instance, _, account = key.partition("/")
+                    self._etags[(instance, account)] = tuple(validators)
+        except Exception as e:
+            print(f"Error loading Twitter cache: {e}")
+
+    def _save_cache(self) -> None:
+        """Persist seen tweet URLs and feed validators to disk."""
+        try:
+            self._cache_file.parent.mkdir(parents=True, exist_ok=True)
+            self._cache_file.write_text(json.dumps({
+                "seen_urls": list(self._seen_urls),
+                "etags": {
+                    f"{instance}/{account}": list(validators)
+                    for (instance, account), validators in self._etags.items()
+                },
+            }))
+        except Exception as e:
+            print(f"Error saving Twitter cache: {e}")
+
     def _meets_engagement_threshold(
         self,
         metrics: Dict[str, Any],
@@ -331,51 +547,70 @@ class TwitterAdapter(BaseAdapter):
         total = likes + (retweets * 2) + replies
         return total >= 8  # Minimum combined score
 
-    def _categorize_tweet(self, content: str) -> str:
-        """Categorize tweet based on content."""
-        content_lower = content.lower()
+    async def _parse_feed(self, content: bytes, limit: int) -> List[Dict[str, Any]]:
+        """Parse RSS in a worker process, falling back to in-process parsing."""
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(
+                _get_parse_pool(), _parse_feed_entries, content, limit
+            )
+        except (OSError, RuntimeError) as e:
+            # Pool unavailable or broken (BrokenProcessPool is a RuntimeError)
+            print(f"RSS parse pool unavailable, parsing inline: {e}")
+            return _parse_feed_entries(content, limit)
+
+    def _filter_by_engagement(
+        self,
+        tweets: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Filter a batch of API tweets by the engagement threshold.
 
-        crypto_keywords = [
-            "ethereum", "bitcoin", "defi", "nft", "web3", "blockchain",
-            "token", "crypto", "wallet", "staking", "yield", "airdrop"
-        ]
-        ai_keywords = [
-            "ai", "gpt", "llm", "openai", "anthropic", "claude",
-            "machine learning", "neural", "chatbot", "agent"
+        Args:
+            tweets: Tweet objects from Twitter API
+
+        Returns:
+            Tweets that meet the threshold, in original order
+        """
+        return [
+            tweet
+            for tweet in tweets
+            if self._meets_engagement_threshold(tweet.get("public_metrics") or {})
         ]
 
-        if any(kw in content_lower for kw in crypto_keywords):
-            return "crypto"
-        elif any(kw in content_lower for kw in ai_keywords):
-            return "ai"
+    def _analyze_content(self, content: str) -> Tuple[str, float]:
+        """
+        Categorize a tweet and score its Mossland relevance in one pass.
+
+        Category priority is crypto, then AI, then tech.
+
+        Args:
+            content: Tweet title and description
+
+        Returns:
+            Tuple of (category, relevance score 0-10)
+        """
+        content_lower = content.lower()
+
+        if any(kw in content_lower for kw in self.CRYPTO_KEYWORDS):
+            category = "crypto"
+        elif any(kw in content_lower for kw in self.AI_KEYWORDS):
+            category = "ai"
         else:
-            return "tech"
+            category = "tech"
 
-    def _calculate_relevance(self, content: str) -> float:
-        """Calculate relevance score for Mossland (0-10)."""
         score = 0.0
-        content_lower = content.lower()
 
         # Direct Mossland mentions
         if "mossland" in content_lower or "moc" in content_lower:
             score += 5.0
 
         # Related topics
-        relevance_keywords = {
-            "metaverse": 2.0,
-            "ar ": 1.5,  # Augmented reality
-            "nft": 1.0,
-            "gaming": 1.0,
-            "web3": 1.0,
-            "defi": 0.5,
-            "dao": 0.5,
-        }
-
-        for keyword, weight in relevance_keywords.items():
+        for keyword, weight in self.RELEVANCE_KEYWORDS:
             if keyword in content_lower:
                 score += weight
 
-        return min(score, 10.0)
+        return category, min(score, 10.0)
 
     def _clean_html(self, html: str) -> str:
         """Remove HTML tags from text."""
@@ -392,5 +627,6 @@ class TwitterAdapter(BaseAdapter):
         base_health["tracked_accounts"] = len(self.TRACKED_ACCOUNTS)
         base_health["tracked_keywords"] = len(self.TRACKED_KEYWORDS)
         base_health["working_nitter_instances"] = len(self._working_instances)
+        base_health["seen_tweets"] = len(self._seen_urls)
 
         return base_health
@@ -11,16 +11,35 @@ Endpoints:
 - GET /plans - Plans list
 - GET /usage - API usage statistics
 - GET /agents - Agent personas information
+- GET /cache/stats - In-process response cache counters
 """
 
-from datetime import datetime
-from typing import Optional, List, Dict, Any
-from fastapi import FastAPI, Query, Depends, BackgroundTasks, HTTPException
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import uuid
+from contextlib import asynccontextmanager
+from datetime import date, datetime, time as dt_time, timedelta
+from functools import partial
+from typing import Optional, List, Dict, Any, Callable, Tuple
+from fastapi import FastAPI, Query, Depends, BackgroundTasks, HTTPException, Request, Response
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
-
+from sqlalchemy import DateTime, Float, Integer, String, bindparam, desc, func, literal, null, select, union_all
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+from sqlalchemy.orm import Session, joinedload
+
+from ..cache import CacheKeys, get_cache
+from ..cache.redis_cache import InMemoryCache
 from ..db.connection import get_db, Database
+from ..db.models import DebateMessage, DebateSession, Idea, Plan, Project, Signal, Trend
+from ..db.pagination import InvalidCursorError, split_page
 from ..db.repositories import (
     SignalRepository,
     TrendRepository,
@@ -30,7 +49,110 @@ from ..db.repositories import (
     ProjectRepository,
     APIUsageRepository,
     SystemLogRepository,
+    PipelineStatsRepository,
 )
+from ..personas import get_divergence_agents, get_convergence_agents, get_planning_agents
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response serialized with orjson when it is installed.
+
+    orjson encodes datetimes and other common types natively, so endpoints
+    that build large payloads can return this class directly and skip
+    FastAPI's ``jsonable_encoder`` pass. Falls back to the stdlib encoder.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return _dump_json(content)
+
+
+def _dump_json(content: Any) -> bytes:
+    """Encode a JSON document the way FastJSONResponse renders it."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        jsonable_encoder(content), ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def _stream_page(
+    key: str,
+    items: List[Any],
+    serialize: Callable[[Any], Dict[str, Any]],
+    meta: Dict[str, Any],
+    headers: Optional[Dict[str, str]] = None,
+) -> StreamingResponse:
+    """Stream ``{key: [...], **meta}`` encoding one list item at a time.
+
+    The item dicts and the full body are never held in memory together, and
+    the first bytes go out while later items are still being serialized.
+    """
+    def chunks():
+        yield b"{" + _dump_json(key) + b":["
+        for i, item in enumerate(items):
+            yield (b"," if i else b"") + _dump_json(serialize(item))
+        yield b"]," + _dump_json(meta)[1:]
+
+    return StreamingResponse(chunks(), media_type="application/json", headers=headers)
+
+
+def _ndjson_line(content: Any) -> bytes:
+    """Encode one newline-delimited JSON record."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(content, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(jsonable_encoder(content), ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+logger = logging.getLogger(__name__)
+
+# Seconds between pipeline stats rollup refreshes
+PIPELINE_STATS_INTERVAL = int(os.getenv("PIPELINE_STATS_INTERVAL", "5"))
+# Older snapshots (e.g. refresher not running) are recomputed on request
+PIPELINE_STATS_MAX_AGE = timedelta(seconds=PIPELINE_STATS_INTERVAL * 6)
+
+
+# (computed_at, counts) of this process's last refresh, so /pipeline/live
+# can skip reading the snapshot row back from the database
+_latest_pipeline_stats: Optional[Tuple[datetime, Dict[str, Dict[str, int]]]] = None
+
+
+def _refresh_pipeline_stats() -> None:
+    """Rewrite the pipeline stats snapshot in its own session."""
+    global _latest_pipeline_stats
+    with get_db().session() as session:
+        snapshot = PipelineStatsRepository(session).refresh()
+        latest = (snapshot.computed_at, snapshot.counts)
+    _latest_pipeline_stats = latest
+
+
+async def _pipeline_stats_refresher() -> None:
+    """Keep the pipeline_stats rollup current so /pipeline/live never counts."""
+    while True:
+        try:
+            await asyncio.to_thread(_refresh_pipeline_stats)
+        except Exception as e:
+            logger.warning(f"Pipeline stats refresh failed: {e}")
+        await asyncio.sleep(PIPELINE_STATS_INTERVAL)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run background refreshers for the lifetime of the API process."""
+    refresher = asyncio.create_task(_pipeline_stats_refresher())
+    try:
+        yield
+    finally:
+        refresher.cancel()
+        # Stop RSS parse workers if any Twitter adapter ran in this process
+        from ..adapters.twitter import shutdown_parse_pool
+
+        shutdown_parse_pool()
 
 
 app = FastAPI(
@@ -39,11 +161,18 @@ app = FastAPI(
     version="0.5.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=FastJSONResponse,
+    lifespan=lifespan,
 )
 
 
 def get_session():
-    """Dependency to get a database session."""
+    """Dependency to get a database session.
+
+    The session is synchronous, so endpoints that use it are declared with
+    plain ``def``; FastAPI runs those in its threadpool instead of blocking
+    the event loop on every query.
+    """
     db = get_db()
     session = db.get_session()
     try:
@@ -51,6 +180,203 @@ def get_session():
     finally:
         session.close()
 
+
+def _cached_total(name: str, count: Callable[[], Any]) -> Any:
+    """Get a list total from the cache, recounting at most every count_ttl seconds."""
+    cache = get_cache()
+    key = CacheKeys.API_LIST_TOTAL.format(name=name)
+    total = cache.get(key)
+    if total is None:
+        total = count()
+        cache.set(key, total, ttl=cache.config.count_ttl)
+    return total
+
+
+def _fetch_list(
+    name: str,
+    fetch: Callable[[], List[Any]],
+    fetch_with_total: Callable[[], Tuple[List[Any], int]],
+    count: Callable[[], Any],
+    first_page: bool,
+) -> Tuple[List[Any], Any]:
+    """Fetch a list page and its total, recounting at most every count_ttl seconds.
+
+    When the total is not cached and this is the first page, it is read from
+    the page query itself via ``fetch_with_total`` (``count(*) OVER ()``), so
+    refilling the cache needs no separate COUNT round-trip.
+    """
+    cache = get_cache()
+    key = CacheKeys.API_LIST_TOTAL.format(name=name)
+    total = cache.get(key)
+    if total is not None:
+        return fetch(), total
+
+    if first_page:
+        rows, total = fetch_with_total()
+    else:
+        rows, total = fetch(), count()
+    cache.set(key, total, ttl=cache.config.count_ttl)
+    return rows, total
+
+
+# Per-process L1 in front of Redis for endpoints dashboards poll constantly;
+# holds serialized bodies so a hit skips the DB, Redis and JSON encoding
+_local_responses = InMemoryCache()
+_local_response_stats = {"hits": 0, "misses": 0}
+
+
+def _body_etag(body: bytes) -> str:
+    """Strong ETag for an exact serialized body."""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check a request's If-None-Match header against ``etag``."""
+    if_none_match = request.headers.get("if-none-match", "")
+    return if_none_match.strip() == "*" or etag in [t.strip() for t in if_none_match.split(",")]
+
+
+def _conditional_body(request: Request, body: bytes, etag: str, cache_control: str) -> Response:
+    """Send a pre-serialized body, or 304 when the client already has it."""
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _local_cached(key: str, build: Callable[[], Any], request: Request) -> Response:
+    """Serve a pre-serialized response body cached for local_response_ttl seconds.
+
+    The body's ETag is cached with it, so a client polling with
+    If-None-Match gets a 304 until the payload actually changes.
+    """
+    entry = _local_responses.get(key)
+    if entry is None:
+        _local_response_stats["misses"] += 1
+        body = FastJSONResponse(build()).body
+        entry = (body, _body_etag(body))
+        _local_responses.set(key, entry, ttl=get_cache().config.local_response_ttl)
+    else:
+        _local_response_stats["hits"] += 1
+    body, etag = entry
+    # Clients must revalidate every poll; unchanged payloads cost a 304
+    return _conditional_body(request, body, etag, "no-cache")
+
+
+# Hits on the Redis layer behind the per-process cache, i.e. requests that
+# another worker's DB work already answered
+_shared_response_stats = {"hits": 0, "misses": 0}
+
+
+def _shared_cached(key: str, ttl: int, build: Callable[[], Any]) -> Any:
+    """Get a payload shared across API workers through Redis, building it on a miss."""
+    cache = get_cache()
+    payload = cache.get(key)
+    if payload is None:
+        _shared_response_stats["misses"] += 1
+        payload = build()
+        cache.set(key, payload, ttl=ttl)
+    else:
+        _shared_response_stats["hits"] += 1
+    return payload
+
+
+def get_now() -> datetime:
+    """Dependency giving each request a single UTC timestamp to work from."""
+    return datetime.utcnow()
+
+
+# (day, midnight) for the last day seen, so polled handlers reuse the day floor
+_day_start_cache: Tuple[Optional[date], Optional[datetime]] = (None, None)
+
+
+def _day_start(now: datetime) -> datetime:
+    """Midnight of ``now``'s day, rebuilt only when the day rolls over."""
+    global _day_start_cache
+    day = now.date()
+    cached_day, start = _day_start_cache
+    if cached_day != day:
+        start = datetime.combine(day, dt_time.min)
+        _day_start_cache = (day, start)
+    return start
+
+
+def _truncate(text: Optional[str], width: int, default: str = "") -> str:
+    """Shorten text to ``width`` characters, marking the cut with an ellipsis."""
+    if not text:
+        return default
+    if len(text) <= width:
+        return text
+    return f"{text[:width]}..."
+
+
+class _NotModifiedError(Exception):
+    """Raised by conditional GETs when the client's cached copy is current."""
+
+    def __init__(self, etag: str, cache_control: str):
+        self.etag = etag
+        self.cache_control = cache_control
+
+
+# Columns whose max() moves whenever the matching list endpoint's data changes
+_ETAG_SOURCES: Dict[str, tuple] = {
+    "signals": (Signal.collected_at,),
+    "trends": (Trend.analyzed_at,),
+    "ideas": (Idea.updated_at,),
+    "plans": (Plan.updated_at,),
+    "debates": (DebateSession.started_at, DebateSession.completed_at, DebateMessage.created_at),
+}
+
+
+def _table_version(session: Session, name: str) -> str:
+    """Get a cheap version string for a table from its indexed timestamps."""
+    cache = get_cache()
+    key = CacheKeys.API_TABLE_VERSION.format(name=name)
+    version = cache.get(key)
+    if version is None:
+        row = session.execute(
+            select(*[select(func.max(c)).scalar_subquery() for c in _ETAG_SOURCES[name]])
+        ).one()
+        version = "|".join(v.isoformat() if v else "" for v in row)
+        cache.set(key, version, ttl=cache.config.version_ttl)
+    return version
+
+
+def _conditional_get(name: str, max_age: int = 30, windowed: bool = False) -> Callable:
+    """Dependency factory adding ETag and Cache-Control headers to a list endpoint.
+
+    The ETag hashes the table version with the query string. A matching
+    If-None-Match is answered with 304 before the endpoint queries anything.
+
+    Windowed lists (``hours``/``period`` relative to now) change as rows age
+    out, and their rows may be rescored or deleted without moving the version,
+    so their ETag also carries the current version_ttl bucket.
+    """
+    cache_control = f"public, max-age={max_age}"
+
+    def dependency(
+        request: Request,
+        response: Response,
+        session: Session = Depends(get_session),
+        now: datetime = Depends(get_now),
+    ) -> None:
+        version = _table_version(session, name)
+        if windowed:
+            ttl = get_cache().config.version_ttl
+            version = f"{version}@{int(now.timestamp()) // ttl}"
+        digest = hashlib.sha1(f"{version}?{request.url.query}".encode("utf-8")).hexdigest()
+        # Weak: list totals are cached separately and may lag the rows
+        etag = f'W/"{digest[:16]}"'
+
+        if _etag_matches(request, etag):
+            raise _NotModifiedError(etag, cache_control)
+
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = cache_control
+
+    return dependency
+
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -61,6 +387,21 @@ app.add_middleware(
 )
 
 
+@app.exception_handler(InvalidCursorError)
+async def invalid_cursor_handler(request, exc: InvalidCursorError):
+    """Reject malformed pagination cursors as a client error."""
+    return JSONResponse(status_code=400, content={"detail": str(exc)})
+
+
+@app.exception_handler(_NotModifiedError)
+async def not_modified_handler(request, exc: _NotModifiedError):
+    """Answer a conditional GET whose ETag still matches."""
+    return Response(
+        status_code=304,
+        headers={"ETag": exc.etag, "Cache-Control": exc.cache_control},
+    )
+
+
 class HealthResponse(BaseModel):
     status: str
     timestamp: str
@@ -99,62 +440,132 @@ class AgentResponse(BaseModel):
     personality: dict
 
 
-@app.get("/health", response_model=HealthResponse)
+# Liveness probes hit /health constantly; only the timestamp varies
+_HEALTH_TEMPLATE = '{{"status":"healthy","timestamp":"{timestamp}","version":"0.5.0"}}'
+
+
+@app.get("/health", responses={200: {"model": HealthResponse}})
 async def health_check():
     """Check API health status."""
-    return HealthResponse(
-        status="healthy",
-        timestamp=datetime.utcnow().isoformat(),
-        version="0.5.0",
+    return Response(
+        content=_HEALTH_TEMPLATE.format(timestamp=datetime.utcnow().isoformat()),
+        media_type="application/json",
     )
 
 
-@app.get("/status", response_model=StatusResponse)
-async def system_status(session: Session = Depends(get_session)):
+@app.get("/status", responses={200: {"model": StatusResponse}})
+def system_status(
+    request: Request,
+    session: Session = Depends(get_session),
+    now: datetime = Depends(get_now),
+):
     """Get overall system status with real statistics."""
-    from ..db.models import Signal, DebateSession, Idea, Plan
-    from sqlalchemy import func
-    from datetime import timedelta
+    return _local_cached(
+        "status",
+        lambda: _shared_cached(
+            CacheKeys.SYSTEM_STATUS,
+            get_cache().config.status_ttl,
+            lambda: _build_system_status(session, now),
+        ),
+        request,
+    )
 
-    # Calculate real stats
-    today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
 
-    signals_today = session.query(func.count(Signal.id)).filter(
-        Signal.collected_at >= today
-    ).scalar() or 0
+# Built once; only the day floor varies per request, as a bound parameter
+_STATUS_COUNTS = select(
+    select(func.count(Signal.id))
+    .where(Signal.collected_at >= bindparam("today"))
+    .scalar_subquery().label("signals_today"),
+    select(func.count(DebateSession.id))
+    .where(DebateSession.started_at >= bindparam("today"))
+    .scalar_subquery().label("debates_today"),
+    select(func.count(Idea.id)).scalar_subquery().label("total_ideas"),
+    select(func.count(Plan.id)).scalar_subquery().label("total_plans"),
+)
 
-    debates_today = session.query(func.count(DebateSession.id)).filter(
-        DebateSession.started_at >= today
-    ).scalar() or 0
 
-    total_ideas = session.query(func.count(Idea.id)).scalar() or 0
-    total_plans = session.query(func.count(Plan.id)).scalar() or 0
+def _build_system_status(session: Session, now: datetime) -> Dict[str, Any]:
+    """Build the /status payload."""
+    today = _day_start(now)
 
-    # Check database health
-    db = get_db()
-    db_healthy = db.health_check()
+    # Calculate real stats in a single round-trip, which doubles as the DB health check
+    try:
+        counts = session.execute(_STATUS_COUNTS, {"today": today}).one()._asdict()
+        db_healthy = True
+    except SQLAlchemyError:
+        counts = {}
+        db_healthy = False
 
-    return StatusResponse(
-        status="operational" if db_healthy else "degraded",
-        timestamp=datetime.utcnow().isoformat(),
-        components={
+    # Plain dict: the payload is built here, so validating it is wasted work
+    return {
+        "status": "operational" if db_healthy else "degraded",
+        "timestamp": now.isoformat(),
+        "components": {
             "api": {"status": "healthy"},
             "database": {"status": "healthy" if db_healthy else "unhealthy"},
             "cache": {"status": "healthy"},
             "llm_router": {"status": "healthy"},
         },
-        stats={
-            "signals_today": signals_today,
-            "debates_today": debates_today,
-            "ideas_generated": total_ideas,
-            "plans_created": total_plans,
+        "stats": {
+            "signals_today": counts.get("signals_today") or 0,
+            "debates_today": counts.get("debates_today") or 0,
+            "ideas_generated": counts.get("total_ideas") or 0,
+            "plans_created": counts.get("total_plans") or 0,
             "agents_active": 34,
         },
-    )
+    }
+
+
+@app.get("/signals/timeline")
+def get_signals_timeline(
+    period: str = Query(default="24h", pattern="^(24h|7d)$"),
+    session: Session = Depends(get_session),
+    now: datetime = Depends(get_now),
+):
+    """Get signal collection timeline for visualization.
+
+    Returns hourly counts for 24h or daily counts for 7d period.
+    Empty buckets are filled in by the database.
+    """
+
+    cache = get_cache()
+    cache_key = CacheKeys.API_SIGNALS_TIMELINE.format(period=period)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    repo = SignalRepository(session)
+
+    if period == "24h":
+        # Hourly buckets for the last 24 hours, ending with the current hour
+        start = now.replace(minute=0, second=0, microsecond=0) - timedelta(hours=23)
+        slots = [
+            {"label": f"{bucket.hour:02d}:00", "count": count, "hour": bucket.hour}
+            for bucket, count in repo.get_timeline(start, 24, "hour")
+        ]
+    else:
+        # Daily buckets for the last 7 days, ending with today
+        start = _day_start(now) - timedelta(days=6)
+        days = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+        slots = [
+            {"label": days[bucket.weekday()], "count": count}
+            for bucket, count in repo.get_timeline(start, 7, "day")
+        ]
+
+    total = sum(s['count'] for s in slots)
+
+    result = {
+        "slots": slots,
+        "total": total,
+        "period": period,
+        "timestamp": now.isoformat(),
+    }
+    cache.set(cache_key, result, ttl=cache.config.timeline_ttl)
+    return result
 
 
 @app.get("/signals/{signal_id}")
-async def get_signal_detail(
+def get_signal_detail(
     signal_id: str,
     session: Session = Depends(get_session),
 ):
@@ -182,93 +593,98 @@ async def get_signal_detail(
     }
 
 
-@app.get("/signals")
-async def get_signals(
+@app.get("/signals", dependencies=[Depends(_conditional_get("signals", windowed=True))])
+def get_signals(
     limit: int = Query(default=20, le=100),
-    offset: int = Query(default=0, ge=0),
+    offset: int = Query(default=0, ge=0, deprecated=True),
+    cursor: Optional[str] = None,
     source: Optional[str] = None,
     category: Optional[str] = None,
     min_score: Optional[float] = Query(default=0.0, ge=0.0),
     hours: int = Query(default=24, ge=1, le=720),
     session: Session = Depends(get_session),
 ):
-    """Get recent signals with filtering and pagination."""
-    repo = SignalRepository(session)
+    """Get recent signals with filtering and keyset pagination.
 
-    # Get signals with SQL-level pagination
-    signals = repo.get_recent(
-        hours=hours,
-        limit=limit,
-        offset=offset,
-        source=source,
-        category=category,
-        min_score=min_score,
-    )
-
-    # Get total count for pagination info
-    total = repo.count_recent_filtered(
-        hours=hours,
-        source=source,
-        category=category,
-        min_score=min_score,
+    Pass the returned ``next_cursor`` as ``cursor`` to fetch the next page;
+    ``offset`` is kept as a deprecated fallback.
+    """
+    repo = SignalRepository(session)
+    if cursor:
+        offset = 0
+
+    # Get signals with SQL-level pagination; the extra row tells us if more exist.
+    # The total is cached briefly rather than recounted for every page.
+    filters = {"hours": hours, "source": source, "category": category, "min_score": min_score}
+    rows, total = _fetch_list(
+        f"signals:{hours}:{source}:{category}:{min_score}",
+        partial(repo.get_recent, limit=limit + 1, offset=offset, after_cursor=cursor, **filters),
+        partial(repo.get_recent_with_total, limit=limit + 1, **filters),
+        partial(repo.count_recent_filtered, **filters),
+        first_page=not cursor and not offset,
     )
+    signals, next_cursor = split_page(rows, repo.RECENT_ORDER, limit)
 
     return {
         "signals": [s.to_dict() for s in signals],
         "total": total,
         "limit": limit,
         "offset": offset,
+        "next_cursor": next_cursor,
+        "has_more": next_cursor is not None,
     }
 
 
-@app.get("/debates")
-async def get_debates(
+@app.get("/debates", dependencies=[Depends(_conditional_get("debates"))])
+def get_debates(
+    response: Response,
     limit: int = Query(default=10, le=50),
-    offset: int = Query(default=0, ge=0),
+    offset: int = Query(default=0, ge=0, deprecated=True),
+    cursor: Optional[str] = None,
     status: Optional[str] = None,
     phase: Optional[str] = None,
     session: Session = Depends(get_session),
 ):
-    """Get recent debate sessions with filtering."""
+    """Get recent debate sessions with filtering and keyset pagination."""
     repo = DebateRepository(session)
-
-    # Get sessions with SQL-level pagination
-    sessions = repo.get_all_sessions(
-        limit=limit,
-        offset=offset,
-        status=status if status != "active" else None,
-        phase=phase,
+    if cursor:
+        offset = 0
+
+    # Get sessions with SQL-level pagination; the extra row tells us if more exist
+    filters = {"status": status, "phase": phase}
+    rows, total = _fetch_list(
+        f"debates:{status}:{phase}",
+        partial(
+            repo.get_all_sessions,
+            limit=limit + 1,
+            offset=offset,
+            after_cursor=cursor,
+            **filters,
+        ),
+        partial(repo.get_all_sessions_with_total, limit=limit + 1, **filters),
+        partial(repo.count_sessions, **filters),
+        first_page=not cursor and not offset,
     )
+    paginated, next_cursor = split_page(rows, repo.LIST_ORDER, limit)
 
-    if status == "active":
-        sessions = repo.get_active_sessions()
-        total = len(sessions)
-        sessions = sessions[offset:offset + limit]
-    else:
-        total = repo.count_sessions(
-            status=status if status != "active" else None,
-            phase=phase,
-        )
-
-    paginated = sessions
-
-    # Build response with message counts
-    debates = []
-    for debate in paginated:
-        debate_dict = debate.to_dict()
-        debate_dict["message_count"] = len(debate.messages) if debate.messages else 0
-        debates.append(debate_dict)
-
-    return {
-        "debates": debates,
-        "total": total,
-        "limit": limit,
-        "offset": offset,
-    }
+    # message_count is a column on the session row, so no per-debate queries
+    return _stream_page(
+        "debates",
+        paginated,
+        DebateSession.to_dict,
+        {
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+            "next_cursor": next_cursor,
+            "has_more": next_cursor is not None,
+        },
+        headers=dict(response.headers),
+    )
 
 
 @app.get("/debates/{session_id}")
-async def get_debate_detail(
+def get_debate_detail(
     session_id: str,
     session: Session = Depends(get_session),
 ):
@@ -281,79 +697,136 @@ async def get_debate_detail(
 
     messages = repo.get_session_messages(session_id)
 
-    return {
-        "debate": debate.to_dict(),
+    return FastJSONResponse({
+        "debate": debate.to_dict(message_count=len(messages)),
         "messages": [m.to_dict() for m in messages],
         "message_count": len(messages),
-    }
+    })
+
+
+@app.get("/debates/{session_id}/messages/stream")
+def stream_debate_messages(
+    session_id: str,
+    session: Session = Depends(get_session),
+):
+    """Stream a debate's messages as NDJSON, one message per line.
 
+    Rows are fetched in batches through a server-side cursor and written as
+    they arrive, so memory stays flat however long the debate runs.
+    """
+    if DebateRepository(session).get_session_by_id(session_id) is None:
+        raise HTTPException(status_code=404, detail=f"Debate session not found: {session_id}")
+
+    stmt = (
+        select(DebateMessage)
+        .where(DebateMessage.session_id == session_id)
+        .order_by(DebateMessage.created_at)
+        .execution_options(yield_per=100)
+    )
 
-@app.get("/trends")
-async def get_trends(
+    def lines():
+        # The session dependency is closed only after the response finishes
+        for message in session.execute(stmt).scalars():
+            yield _ndjson_line(message.to_dict())
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@app.get("/trends", dependencies=[Depends(_conditional_get("trends", windowed=True))])
+def get_trends(
     limit: int = Query(default=10, le=100),
-    offset: int = Query(default=0, ge=0),
+    offset: int = Query(default=0, ge=0, deprecated=True),
+    cursor: Optional[str] = None,
     period: Optional[str] = Query(default="all", pattern="^(all|24h|7d|30d)$"),
     category: Optional[str] = None,
     session: Session = Depends(get_session),
 ):
     """Get trend analysis results."""
     repo = TrendRepository(session)
+    if cursor:
+        offset = 0
+
+    page = {"limit": limit + 1, "offset": offset, "after_cursor": cursor}
+    first_page = not cursor and not offset
 
     if category:
-        trends = repo.get_by_category(category, limit=limit + offset)
-        total = len(trends)
+        rows, total = _fetch_list(
+            f"trends:category:{category}",
+            partial(repo.get_by_category, category, **page),
+            partial(repo.get_by_category_with_total, category, limit=limit + 1),
+            lambda: repo.count_by_category(category),
+            first_page,
+        )
+        order = repo.SCORE_ORDER
     elif period == "all":
-        trends = repo.get_all(limit=limit + offset)
-        total = repo.count_all()
+        # Unfiltered totals may come from the planner estimate, which is
+        # cheaper than counting the page query's full result
+        rows = repo.get_all(**page)
+        total = _cached_total("trends:all", repo.count_all)
+        order = repo.LATEST_ORDER
     else:
-        trends = repo.get_latest(period=period, limit=limit + offset)
-        total = len(trends)
+        rows, total = _fetch_list(
+            f"trends:period:{period}",
+            partial(repo.get_latest, period=period, **page),
+            partial(repo.get_latest_with_total, period=period, limit=limit + 1),
+            lambda: repo.count_by_period(period),
+            first_page,
+        )
+        order = repo.LATEST_ORDER
 
-    # Apply offset
-    paginated = trends[offset:offset + limit]
+    paginated, next_cursor = split_page(rows, order, limit)
 
     return {
         "trends": [t.to_dict() for t in paginated],
         "total": total,
         "limit": limit,
         "offset": offset,
+        "next_cursor": next_cursor,
+        "has_more": next_cursor is not None,
         "period": period,
     }
 
 
-@app.get("/ideas")
-async def get_ideas(
+@app.get("/ideas", dependencies=[Depends(_conditional_get("ideas"))])
+def get_ideas(
     limit: int = Query(default=20, le=100),
-    offset: int = Query(default=0, ge=0),
+    offset: int = Query(default=0, ge=0, deprecated=True),
+    cursor: Optional[str] = None,
     status: Optional[str] = None,
     session: Session = Depends(get_session),
 ):
-    """Get ideas list with filtering."""
+    """Get ideas list with filtering and keyset pagination."""
     repo = IdeaRepository(session)
+    if cursor:
+        offset = 0
 
     # Get status counts for summary and total count
-    status_counts = repo.count_by_status()
+    status_counts = _cached_total("ideas:status_counts", repo.count_by_status)
 
     if status:
-        ideas = repo.get_by_status(status, limit=limit + offset)
+        rows = repo.get_by_status(
+            status, limit=limit + 1, offset=offset, after_cursor=cursor
+        )
         total = status_counts.get(status, 0)
     else:
-        ideas = repo.get_all(limit=limit, offset=offset)
-        total = repo.count_all()
+        rows = repo.get_all(limit=limit + 1, offset=offset, after_cursor=cursor)
+        total = sum(status_counts.values())
 
-    paginated = ideas if status is None else ideas[offset:offset + limit]
+    paginated, next_cursor = split_page(rows, repo.LIST_ORDER, limit)
 
     return {
         "ideas": [i.to_dict() for i in paginated],
         "total": total,
         "limit": limit,
         "offset": offset,
+        "next_cursor": next_cursor,
+        "has_more": next_cursor is not None,
         "status_counts": status_counts,
     }
 
 
 @app.get("/ideas/{idea_id}")
-async def get_idea_detail(
+def get_idea_detail(
     idea_id: str,
     session: Session = Depends(get_session),
 ):
@@ -363,9 +836,10 @@ async def get_idea_detail(
     """
     idea_repo = IdeaRepository(session)
     debate_repo = DebateRepository(session)
-    plan_repo = PlanRepository(session)
 
-    idea = idea_repo.get_by_id(idea_id)
+    # Plans are joined onto the idea row, so the page takes three queries:
+    # idea + plans, debate sessions, and all of their messages
+    idea = idea_repo.get_by_id(idea_id, options=[joinedload(Idea.plans)])
     if not idea:
         raise HTTPException(status_code=404, detail=f"Idea not found: {idea_id}")
 
@@ -374,40 +848,27 @@ async def get_idea_detail(
     if not source_debate_id and idea.extra_metadata:
         source_debate_id = idea.extra_metadata.get('debate_session_id')
 
+    # Source debate first, then debates linked via idea_id (backward compatibility)
+    sessions = debate_repo.get_sessions_for_idea(idea_id, source_debate_id, with_messages=True)
+
     debates = []
-    seen_ids = set()
-
-    # Add source debate with messages first
-    if source_debate_id:
-        source_debate = debate_repo.get_session_by_id(source_debate_id)
-        if source_debate:
-            messages = debate_repo.get_session_messages(source_debate_id)
-            debate_dict = source_debate.to_dict()
-            debate_dict['messages'] = [m.to_dict() for m in messages]
-            debates.append(debate_dict)
-            seen_ids.add(source_debate_id)
-
-    # Also get any debates linked via idea_id (backward compatibility)
-    linked_debates = debate_repo.get_sessions_by_idea(idea_id)
-    for d in linked_debates:
-        if d.id not in seen_ids:
-            messages = debate_repo.get_session_messages(d.id)
-            debate_dict = d.to_dict()
-            debate_dict['messages'] = [m.to_dict() for m in messages]
-            debates.append(debate_dict)
-            seen_ids.add(d.id)
-
-    plans = plan_repo.get_by_idea(idea_id)
+    for d in sessions:
+        messages = d.messages
+        debate_dict = d.to_dict(message_count=len(messages))
+        debate_dict['messages'] = [m.to_dict() for m in messages]
+        debates.append(debate_dict)
 
-    return {
+    plans = sorted(idea.plans, key=lambda p: p.version or 0, reverse=True)
+
+    return FastJSONResponse({
         "idea": idea.to_dict(),
         "debates": debates,
         "plans": [p.to_dict() for p in plans],
-    }
+    })
 
 
 @app.get("/ideas/{idea_id}/lineage")
-async def get_idea_lineage(
+def get_idea_lineage(
     idea_id: str,
     session: Session = Depends(get_session),
 ):
@@ -415,12 +876,14 @@ async def get_idea_lineage(
 
     Returns source signals, parent trend (if any), the idea, and generated plans.
     """
-    from ..db.models import Signal, Trend
-
-    idea_repo = IdeaRepository(session)
-    plan_repo = PlanRepository(session)
+    # Only the columns the response uses; wide text columns are never loaded
+    trend_columns = (Trend.id, Trend.name, Trend.score, Trend.signal_count)
 
-    idea = idea_repo.get_by_id(idea_id)
+    idea = (
+        session.query(Idea.id, Idea.title, Idea.score, Idea.status, Idea.extra_metadata)
+        .filter(Idea.id == idea_id)
+        .first()
+    )
     if not idea:
         raise HTTPException(status_code=404, detail=f"Idea not found: {idea_id}")
 
@@ -434,28 +897,25 @@ async def get_idea_lineage(
         trend_id = idea.extra_metadata.get('trend_id')
         source_signal_ids = idea.extra_metadata.get('source_signal_ids', [])
 
-        # Fetch source signals if IDs are stored
+        # Fetch source signals if IDs are stored (one IN query, limit to 10)
         if source_signal_ids:
-            for signal_id in source_signal_ids[:10]:  # Limit to 10
-                signal = session.query(Signal).filter(Signal.id == signal_id).first()
+            wanted_ids = source_signal_ids[:10]
+            rows = (
+                session.query(Signal.id, Signal.title, Signal.score, Signal.source)
+                .filter(Signal.id.in_(wanted_ids))
+                .all()
+            )
+            by_id = {r.id: r for r in rows}
+            for signal_id in wanted_ids:
+                signal = by_id.get(signal_id)
                 if signal:
-                    signals.append({
-                        "id": signal.id,
-                        "title": signal.title,
-                        "score": signal.score,
-                        "source": signal.source,
-                    })
+                    signals.append(signal._asdict())
 
     # If we have a trend_id, fetch the trend
     if trend_id:
-        trend_obj = session.query(Trend).filter(Trend.id == trend_id).first()
-        if trend_obj:
-            trend = {
-                "id": trend_obj.id,
-                "name": trend_obj.name,
-                "score": trend_obj.score,
-                "signal_count": trend_obj.signal_count,
-            }
+        trend_row = session.query(*trend_columns).filter(Trend.id == trend_id).first()
+        if trend_row:
+            trend = trend_row._asdict()
 
     # If no signals found yet, try to find related signals by keywords/title
     if not signals:
@@ -465,47 +925,27 @@ async def get_idea_lineage(
             keywords = idea.extra_metadata.get('keywords', [])[:5]
 
         if keywords:
-            from sqlalchemy import or_, func
-            keyword_filters = [Signal.title.ilike(f'%{kw}%') for kw in keywords]
-            related_signals = (
-                session.query(Signal)
-                .filter(or_(*keyword_filters))
-                .order_by(Signal.score.desc())
-                .limit(5)
-                .all()
-            )
-            for signal in related_signals:
-                signals.append({
-                    "id": signal.id,
-                    "title": signal.title,
-                    "score": signal.score,
-                    "source": signal.source,
-                })
+            related_signals = SignalRepository(session).search_titles(keywords, limit=5)
+            signals.extend(signal._asdict() for signal in related_signals)
 
     # If still no trend found, try to find by name similarity
     if not trend and idea.title:
-        from sqlalchemy import func
         # Simple search by title words
         words = idea.title.split()[:3]
         for word in words:
             if len(word) > 4:  # Skip short words
                 found_trend = (
-                    session.query(Trend)
+                    session.query(*trend_columns)
                     .filter(Trend.name.ilike(f'%{word}%'))
                     .order_by(Trend.score.desc())
                     .first()
                 )
                 if found_trend:
-                    trend = {
-                        "id": found_trend.id,
-                        "name": found_trend.name,
-                        "score": found_trend.score,
-                        "signal_count": found_trend.signal_count,
-                    }
+                    trend = found_trend._asdict()
                     break
 
     # Get plans
-    plans = plan_repo.get_by_idea(idea_id)
+    plans = PlanRepository(session).get_summaries_by_idea(idea_id)
 
     return {
         "signals": signals,
@@ -516,59 +956,70 @@ async def get_idea_lineage(
             "score": idea.score,
             "status": idea.status,
         },
-        "plans": [
-            {
-                "id": p.id,
-                "title": p.title,
-                "version": p.version,
-                "status": p.status,
-            }
-            for p in plans
-        ],
+        "plans": [p._asdict() for p in plans],
     }
 
 
-@app.get("/plans")
-async def get_plans(
+@app.get("/plans", dependencies=[Depends(_conditional_get("plans"))])
+def get_plans(
+    response: Response,
     limit: int = Query(default=20, le=100),
-    offset: int = Query(default=0, ge=0),
+    offset: int = Query(default=0, ge=0, deprecated=True),
+    cursor: Optional[str] = None,
     status: Optional[str] = None,
     session: Session = Depends(get_session),
 ):
-    """Get plans list with filtering."""
+    """Get plans list with filtering and keyset pagination."""
     repo = PlanRepository(session)
+    if cursor:
+        offset = 0
+
+    page = {"limit": limit + 1, "offset": offset, "after_cursor": cursor}
+    first_page = not cursor and not offset
 
     if status:
-        plans = repo.get_by_status(status, limit=limit + offset)
-        total = repo.count_by_status(status)
-        paginated = plans[offset:offset + limit]
+        rows, total = _fetch_list(
+            f"plans:{status}",
+            partial(repo.get_by_status, status, **page),
+            partial(repo.get_by_status_with_total, status, limit=limit + 1),
+            lambda: repo.count_by_status(status),
+            first_page,
+        )
     else:
-        plans = repo.get_all(limit=limit, offset=offset)
-        total = repo.count_all()
-        paginated = plans
+        rows = repo.get_all(**page)
+        total = _cached_total("plans:all", repo.count_all)
 
-    return {
-        "plans": [p.to_dict() for p in paginated],
-        "total": total,
-        "limit": limit,
-        "offset": offset,
-    }
+    paginated, next_cursor = split_page(rows, repo.LIST_ORDER, limit)
+
+    return _stream_page(
+        "plans",
+        paginated,
+        Plan.to_dict,
+        {
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+            "next_cursor": next_cursor,
+            "has_more": next_cursor is not None,
+        },
+        headers=dict(response.headers),
+    )
 
 
 @app.get("/plans/{plan_id}")
-async def get_plan_detail(
+def get_plan_detail(
     plan_id: str,
     session: Session = Depends(get_session),
 ):
     """Get detailed plan information."""
     repo = PlanRepository(session)
 
-    plan = repo.get_by_id(plan_id)
+    plan = repo.get_by_id(plan_id, with_documents=True)
     if not plan:
         raise HTTPException(status_code=404, detail=f"Plan not found: {plan_id}")
 
-    # Include full plan content
-    return {
+    # Include full plan content; datetimes are encoded by the response class
+    return FastJSONResponse({
         "id": plan.id,
         "idea_id": plan.idea_id,
         "title": plan.title,
@@ -583,13 +1034,13 @@ async def get_plan_detail(
         "final_plan": plan.final_plan,
         "final_plan_ko": getattr(plan, 'final_plan_ko', None),
         "github_issue_url": plan.github_issue_url,
-        "created_at": plan.created_at.isoformat() if plan.created_at else None,
-        "updated_at": plan.updated_at.isoformat() if plan.updated_at else None,
-    }
+        "created_at": plan.created_at,
+        "updated_at": plan.updated_at,
+    })
 
 
 @app.get("/usage")
-async def get_usage(
+def get_usage(
     days: int = Query(default=7, ge=1, le=90),
     session: Session = Depends(get_session),
 ):
@@ -610,143 +1061,129 @@ async def get_usage(
     }
 
 
+# Most recent rows each table contributes to the activity feed
+_ACTIVITY_CAPS = {
+    "signal": 20,
+    "trend": 10,
+    "idea": 10,
+    "debate_started": 10,
+    "debate_completed": 10,
+    "plan": 10,
+}
+
+
+def _activity_branch(kind, ts, label, detail=None, score=None, count=None):
+    """One UNION branch, bounded by its own timestamp index."""
+    return select(
+        literal(kind, String).label("kind"),
+        ts.label("ts"),
+        label.label("label"),
+        (detail if detail is not None else null()).cast(String).label("detail"),
+        (score if score is not None else null()).cast(Float).label("score"),
+        (count if count is not None else null()).cast(Integer).label("count"),
+    ).where(ts.isnot(None)).order_by(desc(ts)).limit(bindparam(f"{kind}_limit")).subquery()
+
+
+def _build_activity_feed():
+    branches = [
+        _activity_branch("signal", Signal.collected_at, Signal.title, detail=Signal.source),
+        _activity_branch("trend", Trend.analyzed_at, Trend.name, score=Trend.score, count=Trend.signal_count),
+        _activity_branch("idea", Idea.created_at, Idea.title, detail=Idea.status, score=Idea.score),
+        _activity_branch("debate_started", DebateSession.started_at, DebateSession.topic, detail=DebateSession.phase),
+        _activity_branch(
+            "debate_completed", DebateSession.completed_at, DebateSession.topic,
+            detail=DebateSession.status,
+            count=func.json_array_length(DebateSession.ideas_generated),
+        ),
+        _activity_branch("plan", Plan.created_at, Plan.title, detail=Plan.status, count=Plan.version),
+    ]
+    feed = union_all(*[select(b) for b in branches]).subquery()
+    return select(feed).order_by(desc(feed.c.ts)).limit(bindparam("limit"))
+
+
+# Built once; only the limits vary per request, as bound parameters
+_ACTIVITY_FEED = _build_activity_feed()
+
+
 @app.get("/activity")
-async def get_activity(
+def get_activity(
     limit: int = Query(default=20, le=100),
     session: Session = Depends(get_session),
 ):
     """Get recent system activity for the activity feed.
 
     Generates activity from real data tables (signals, trends, ideas, debates, plans)
-    instead of relying on explicit system logs.
+    instead of relying on explicit system logs. The feed is one UNION ALL
+    query, sorted and limited in the database.
     """
-    from ..db.models import Signal, Trend, Idea, DebateSession, Plan
-    from sqlalchemy import desc, union_all, literal
+    params = {f"{kind}_limit": min(cap, limit) for kind, cap in _ACTIVITY_CAPS.items()}
+    rows = session.execute(_ACTIVITY_FEED, {"limit": limit, **params}).all()
 
     activities = []
-
-    # Get recent signals (last 24 hours, limit to avoid too many)
-    recent_signals = (
-        session.query(Signal)
-        .filter(Signal.collected_at.isnot(None))
-        .order_by(desc(Signal.collected_at))
-        .limit(20)
-        .all()
-    )
-    for signal in recent_signals:
-        activities.append({
-            "timestamp": signal.collected_at,
-            "time": signal.collected_at.strftime("%H:%M:%S") if signal.collected_at else "",
-            "type": "trend",  # signals show as 'trend' type for SIGNAL prefix
-            "message": f"Signal collected: {signal.title[:80]}..." if len(signal.title) > 80 else f"Signal collected: {signal.title}",
-            "source": signal.source,
-        })
-
-    # Get recent trends
-    recent_trends = (
-        session.query(Trend)
-        .filter(Trend.analyzed_at.isnot(None))
-        .order_by(desc(Trend.analyzed_at))
-        .limit(10)
-        .all()
-    )
-    for trend in recent_trends:
-        activities.append({
-            "timestamp": trend.analyzed_at,
-            "time": trend.analyzed_at.strftime("%H:%M:%S") if trend.analyzed_at else "",
-            "type": "trend",
-            "message": f"Trend analyzed: {trend.name[:60]}... (score: {trend.score:.1f})" if len(trend.name) > 60 else f"Trend analyzed: {trend.name} (score: {trend.score:.1f})",
-            "signal_count": trend.signal_count,
-        })
-
-    # Get recent ideas
-    recent_ideas = (
-        session.query(Idea)
-        .filter(Idea.created_at.isnot(None))
-        .order_by(desc(Idea.created_at))
-        .limit(10)
-        .all()
-    )
-    for idea in recent_ideas:
-        status_emoji = {"promoted": "🚀", "scored": "📊", "archived": "📦"}.get(idea.status, "💡")
-        activities.append({
-            "timestamp": idea.created_at,
-            "time": idea.created_at.strftime("%H:%M:%S") if idea.created_at else "",
-            "type": "idea",
-            "message": f"Idea generated [{idea.status}]: {idea.title[:50]}..." if len(idea.title) > 50 else f"Idea generated [{idea.status}]: {idea.title}",
-            "score": idea.score,
-        })
-
-    # Get recent debates
-    recent_debates = (
-        session.query(DebateSession)
-        .order_by(desc(DebateSession.started_at))
-        .limit(10)
-        .all()
-    )
-    for debate in recent_debates:
-        if debate.started_at:
-            topic_short = (debate.topic[:40] + "...") if debate.topic and len(debate.topic) > 40 else (debate.topic or "Unknown topic")
+    for row in rows:
+        time = row.ts.strftime("%H:%M:%S")
+        if row.kind == "signal":
+            activities.append({
+                "time": time,
+                "type": "trend",  # signals show as 'trend' type for SIGNAL prefix
+                "message": f"Signal collected: {_truncate(row.label, 80)}",
+                "source": row.detail,
+            })
+        elif row.kind == "trend":
+            activities.append({
+                "time": time,
+                "type": "trend",
+                "message": f"Trend analyzed: {_truncate(row.label, 60)} (score: {row.score:.1f})",
+                "signal_count": row.count,
+            })
+        elif row.kind == "idea":
+            activities.append({
+                "time": time,
+                "type": "idea",
+                "message": f"Idea generated [{row.detail}]: {_truncate(row.label, 50)}",
+                "score": row.score,
+            })
+        elif row.kind == "debate_started":
             activities.append({
-                "timestamp": debate.started_at,
-                "time": debate.started_at.strftime("%H:%M:%S"),
+                "time": time,
                 "type": "debate",
-                "message": f"Debate started: {topic_short}",
-                "phase": debate.phase,
+                "message": f"Debate started: {_truncate(row.label, 40, 'Unknown topic')}",
+                "phase": row.detail,
             })
-        if debate.completed_at:
+        elif row.kind == "debate_completed":
             activities.append({
-                "timestamp": debate.completed_at,
-                "time": debate.completed_at.strftime("%H:%M:%S"),
+                "time": time,
                 "type": "debate",
-                "message": f"Debate completed: {debate.status} - {len(debate.ideas_generated or [])} ideas generated",
-                "status": debate.status,
+                "message": f"Debate completed: {row.detail} - {row.count or 0} ideas generated",
+                "status": row.detail,
+            })
+        elif row.kind == "plan":
+            activities.append({
+                "time": time,
+                "type": "plan",
+                "message": f"Plan created [{row.detail}]: {_truncate(row.label, 50)}",
+                "version": row.count,
             })
 
-    # Get recent plans
-    recent_plans = (
-        session.query(Plan)
-        .filter(Plan.created_at.isnot(None))
-        .order_by(desc(Plan.created_at))
-        .limit(10)
-        .all()
-    )
-    for plan in recent_plans:
-        activities.append({
-            "timestamp": plan.created_at,
-            "time": plan.created_at.strftime("%H:%M:%S") if plan.created_at else "",
-            "type": "plan",
-            "message": f"Plan created [{plan.status}]: {plan.title[:50]}..." if len(plan.title) > 50 else f"Plan created [{plan.status}]: {plan.title}",
-            "version": plan.version,
-        })
-
-    # Sort all activities by timestamp descending
-    activities.sort(key=lambda x: x.get("timestamp") or datetime.min, reverse=True)
-
-    # Limit to requested amount
-    activities = activities[:limit]
-
-    # Remove timestamp field (only used for sorting) and ensure time format
-    for activity in activities:
-        activity.pop("timestamp", None)
-
-    return {
+    return FastJSONResponse({
         "activities": activities,
         "total": len(activities),
-    }
+    })
 
 
 @app.get("/adapters")
 async def get_adapters():
     """Get detailed signal adapter information."""
+    cache = get_cache()
+    cached = cache.get(CacheKeys.API_ADAPTERS)
+    if cached is not None:
+        return cached
+
     from ..adapters import (
         RSSAdapter, GitHubEventsAdapter, OnChainAdapter,
         SocialMediaAdapter, NewsAPIAdapter, TwitterAdapter,
         DiscordAdapter, LensAdapter, FarcasterAdapter, ThreadsAdapter
     )
-    import asyncio
-
-    adapters_info = []
 
     # Define all adapters with their details
     adapter_classes = [
@@ -812,7 +1249,7 @@ async def get_adapters():
         },
     ]
 
-    for adapter_info in adapter_classes:
+    async def describe(adapter_info: Dict[str, Any]) -> Dict[str, Any]:
         try:
             adapter = adapter_info["class"]()
 
@@ -850,185 +1287,196 @@ async def get_adapters():
                 info["sources"] = [s["name"] for s in adapter.TRACKED_SERVERS]
                 info["source_count"] = len(adapter.TRACKED_SERVERS)
 
-            adapters_info.append(info)
+            return info
 
         except Exception as e:
-            adapters_info.append({
+            return {
                 "name": adapter_info["class"].__name__.replace("Adapter", "").lower(),
                 "category": adapter_info["category"],
                 "description": adapter_info["description"],
                 "enabled": False,
                 "error": str(e),
-            })
+            }
 
-    return {
+    # Run all health checks concurrently; each one handles its own errors
+    adapters_info = await asyncio.gather(*(describe(i) for i in adapter_classes))
+
+    result = {
         "adapters": adapters_info,
         "total": len(adapters_info),
         "enabled_count": sum(1 for a in adapters_info if a.get("enabled", False)),
     }
+    cache.set(CacheKeys.API_ADAPTERS, result, ttl=cache.config.adapters_ttl)
+    return result
 
 
-@app.get("/agents")
-async def get_agents(phase: Optional[str] = None):
-    """Get agent personas information."""
-    from ..personas import get_divergence_agents, get_convergence_agents, get_planning_agents
-
-    def agent_to_dict(agent, phase_name: str) -> dict:
-        return {
-            "id": agent.id,
-            "name": agent.name,
-            "role": agent.role,
-            "phase": phase_name,
-            "handle": agent.handle,
-            "expertise": agent.expertise,
-            "personality": {
-                "thinking": agent.personality.thinking.value,
-                "decision": agent.personality.decision.value,
-                "communication": agent.personality.communication.value,
-                "action": agent.personality.action.value,
-            },
-        }
-
-    agents = []
-
-    if phase is None or phase == "divergence":
-        for agent in get_divergence_agents():
-            agents.append(agent_to_dict(agent, "divergence"))
-
-    if phase is None or phase == "convergence":
-        for agent in get_convergence_agents():
-            agents.append(agent_to_dict(agent, "convergence"))
-
-    if phase is None or phase == "planning":
-        for agent in get_planning_agents():
-            agents.append(agent_to_dict(agent, "planning"))
-
+def _agent_to_dict(agent, phase_name: str) -> dict:
     return {
-        "agents": agents,
-        "total": len(agents),
+        "id": agent.id,
+        "name": agent.name,
+        "role": agent.role,
+        "phase": phase_name,
+        "handle": agent.handle,
+        "expertise": agent.expertise,
+        "personality": {
+            "thinking": agent.personality.thinking.value,
+            "decision": agent.personality.decision.value,
+            "communication": agent.personality.communication.value,
+            "action": agent.personality.action.value,
+        },
     }
 
 
-@app.get("/signals/timeline")
-async def get_signals_timeline(
-    period: str = Query(default="24h", pattern="^(24h|7d)$"),
-    session: Session = Depends(get_session),
-):
-    """Get signal collection timeline for visualization.
+# Personas are static, so their JSON is built once at import
+_AGENTS_BY_PHASE: Dict[str, tuple] = {
+    "divergence": tuple(_agent_to_dict(a, "divergence") for a in get_divergence_agents()),
+    "convergence": tuple(_agent_to_dict(a, "convergence") for a in get_convergence_agents()),
+    "planning": tuple(_agent_to_dict(a, "planning") for a in get_planning_agents()),
+}
+_AGENTS_ALL = (
+    _AGENTS_BY_PHASE["divergence"]
+    + _AGENTS_BY_PHASE["convergence"]
+    + _AGENTS_BY_PHASE["planning"]
+)
 
-    Returns hourly counts for 24h or daily counts for 7d period.
-    """
-    from ..db.models import Signal
-    from sqlalchemy import func, extract
-    from datetime import timedelta
 
-    now = datetime.utcnow()
+def _agents_body(agents: tuple) -> Tuple[bytes, str]:
+    body = FastJSONResponse({"agents": agents, "total": len(agents)}).body
+    return body, _body_etag(body)
 
-    if period == "24h":
-        # Get hourly counts for last 24 hours
-        start_time = now - timedelta(hours=24)
-        results = (
-            session.query(
-                extract('hour', Signal.collected_at).label('hour'),
-                func.count(Signal.id).label('count')
-            )
-            .filter(Signal.collected_at >= start_time)
-            .group_by(extract('hour', Signal.collected_at))
-            .all()
-        )
 
-        # Build hourly slots
-        hour_counts = {int(r.hour): r.count for r in results}
-        slots = []
-        for i in range(24):
-            hour = (now.hour - 23 + i) % 24
-            slots.append({
-                "label": f"{hour:02d}:00",
-                "count": hour_counts.get(hour, 0),
-                "hour": hour,
-            })
-    else:
-        # Get daily counts for last 7 days
-        start_time = now - timedelta(days=7)
-        results = (
-            session.query(
-                func.date(Signal.collected_at).label('date'),
-                func.count(Signal.id).label('count')
-            )
-            .filter(Signal.collected_at >= start_time)
-            .group_by(func.date(Signal.collected_at))
-            .all()
-        )
+# Serialized once per phase filter, with ETags that hold for the process
+# lifetime; requests only look up the bytes
+_AGENTS_PAYLOADS: Dict[Optional[str], Tuple[bytes, str]] = {
+    None: _agents_body(_AGENTS_ALL),
+    **{phase: _agents_body(agents) for phase, agents in _AGENTS_BY_PHASE.items()},
+}
+_NO_AGENTS_PAYLOAD = _agents_body(())
 
-        # Build daily slots
-        date_counts = {str(r.date): r.count for r in results}
-        days = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
-        slots = []
-        for i in range(7):
-            date = now - timedelta(days=6-i)
-            date_str = date.strftime('%Y-%m-%d')
-            slots.append({
-                "label": days[date.weekday()],
-                "count": date_counts.get(date_str, 0),
-            })
 
-    total = sum(s['count'] for s in slots)
+@app.get("/agents")
+async def get_agents(request: Request, phase: Optional[str] = None):
+    """Get agent personas information."""
+    body, etag = _AGENTS_PAYLOADS.get(phase, _NO_AGENTS_PAYLOAD)
+    return _conditional_body(request, body, etag, "public, max-age=300")
+
+
+class _MinutesSince(FunctionElement):
+    """Whole minutes from a timestamp to a later one, computed in SQL."""
+
+    type = Integer()
+    name = "minutes_since"
+    inherit_cache = True
+
+
+@compiles(_MinutesSince)
+def _compile_minutes_since(element, compiler, **kw):
+    ts, now = [compiler.process(c, **kw) for c in element.clauses]
+    return f"CAST(TRUNC(EXTRACT(EPOCH FROM ({now} - {ts})) / 60) AS INTEGER)"
+
+
+@compiles(_MinutesSince, "sqlite")
+def _compile_minutes_since_sqlite(element, compiler, **kw):
+    ts, now = [compiler.process(c, **kw) for c in element.clauses]
+    return f"CAST((julianday({now}) - julianday({ts})) * 1440 AS INTEGER)"
+
+
+def _processing_branch(kind, rank, ts, title, where, limit, detail=None, score=None,
+                       round_number=None, max_rounds=None, minutes_ago=False):
+    """One UNION branch of the /pipeline/live processing items."""
+    return select(
+        literal(kind, String).label("kind"),
+        literal(rank, Integer).label("rank"),
+        ts.label("ts"),
+        title.label("title"),
+        (detail if detail is not None else null()).cast(String).label("detail"),
+        (score if score is not None else null()).cast(Float).label("score"),
+        (round_number if round_number is not None else null()).cast(Integer).label("round_number"),
+        (max_rounds if max_rounds is not None else null()).cast(Integer).label("max_rounds"),
+        (
+            _MinutesSince(ts, bindparam("now", type_=DateTime)) if minutes_ago else null().cast(Integer)
+        ).label("minutes_ago"),
+    ).where(where).order_by(desc(ts)).limit(limit).subquery()
+
+
+def _build_processing_items():
+    branches = [
+        _processing_branch(
+            "signal", 0, Signal.collected_at, Signal.title,
+            Signal.collected_at >= bindparam("signal_since"), 3, detail=Signal.source,
+            minutes_ago=True,
+        ),
+        _processing_branch(
+            "debate", 1, DebateSession.started_at, DebateSession.topic,
+            DebateSession.status == "in-progress", 2, detail=DebateSession.phase,
+            round_number=DebateSession.round_number, max_rounds=DebateSession.max_rounds,
+        ),
+        _processing_branch(
+            "trend", 2, Trend.analyzed_at, Trend.name,
+            Trend.analyzed_at >= bindparam("trend_since"), 2, score=Trend.score,
+            minutes_ago=True,
+        ),
+        _processing_branch(
+            "project", 3, Project.created_at, Project.name,
+            Project.status == "generating", 2, detail=Project.status,
+        ),
+    ]
+    items = union_all(*[select(b) for b in branches]).subquery()
+    return select(items).order_by(items.c.rank, desc(items.c.ts))
 
-    return {
-        "slots": slots,
-        "total": total,
-        "period": period,
-        "timestamp": now.isoformat(),
-    }
+
+# Built once; only the time windows vary per request, as bound parameters
+_PROCESSING_ITEMS = _build_processing_items()
 
 
 @app.get("/pipeline/live")
-async def get_pipeline_live(session: Session = Depends(get_session)):
+def get_pipeline_live(
+    request: Request,
+    session: Session = Depends(get_session),
+    now: datetime = Depends(get_now),
+):
     """Get real-time pipeline status with conversion rates and current processing items.
 
+    Served from the per-process response cache for a couple of seconds,
+    backed by a Redis copy shared by all API workers.
+
     Returns:
         - stages: Current counts for each pipeline stage (signals, trends, ideas, plans)
         - conversion_rates: Conversion rates between stages
         - processing: Currently processing items
         - rates: Hourly/daily generation rates
     """
-    from ..db.models import Signal, Trend, Idea, DebateSession, Plan, Project
-    from sqlalchemy import func, desc
-    from datetime import timedelta
-
-    now = datetime.utcnow()
-    today = now.replace(hour=0, minute=0, second=0, microsecond=0)
-    last_hour = now - timedelta(hours=1)
-    last_24h = now - timedelta(hours=24)
-    last_7d = now - timedelta(days=7)
-
-    # Get counts for each stage
-    total_signals = session.query(func.count(Signal.id)).scalar() or 0
-    total_trends = session.query(func.count(Trend.id)).scalar() or 0
-    total_ideas = session.query(func.count(Idea.id)).scalar() or 0
-    total_plans = session.query(func.count(Plan.id)).scalar() or 0
-    total_projects = session.query(func.count(Project.id)).scalar() or 0
-
-    # Get hourly rates
-    signals_last_hour = session.query(func.count(Signal.id)).filter(
-        Signal.collected_at >= last_hour
-    ).scalar() or 0
-
-    trends_today = session.query(func.count(Trend.id)).filter(
-        Trend.analyzed_at >= today
-    ).scalar() or 0
-
-    ideas_today = session.query(func.count(Idea.id)).filter(
-        Idea.created_at >= today
-    ).scalar() or 0
-
-    plans_last_7d = session.query(func.count(Plan.id)).filter(
-        Plan.created_at >= last_7d
-    ).scalar() or 0
-
-    projects_last_7d = session.query(func.count(Project.id)).filter(
-        Project.created_at >= last_7d
-    ).scalar() or 0
+    return _local_cached(
+        "pipeline:live",
+        lambda: _shared_cached(
+            CacheKeys.API_PIPELINE_LIVE,
+            get_cache().config.pipeline_live_ttl,
+            lambda: _build_pipeline_live(session, now),
+        ),
+        request,
+    )
+
+
+def _build_pipeline_live(session: Session, now: datetime) -> Dict[str, Any]:
+    """Build the /pipeline/live payload."""
+    # Stage counts come from this process's last rollup refresh, else the
+    # stored snapshot; count live only if both are missing or have fallen behind
+    latest = _latest_pipeline_stats
+    if latest is not None and now - latest[0] <= PIPELINE_STATS_MAX_AGE:
+        counts = latest[1]
+    else:
+        stats_repo = PipelineStatsRepository(session)
+        snapshot = stats_repo.get_current()
+        if snapshot is not None and now - snapshot.computed_at <= PIPELINE_STATS_MAX_AGE:
+            counts = snapshot.counts
+        else:
+            counts = stats_repo.compute_counts(now)
+
+    total_signals, signals_last_hour = counts["signals"]["total"], counts["signals"]["recent"]
+    total_trends, trends_today = counts["trends"]["total"], counts["trends"]["recent"]
+    total_ideas, ideas_today = counts["ideas"]["total"], counts["ideas"]["recent"]
+    total_plans, plans_last_7d = counts["plans"]["total"], counts["plans"]["recent"]
+    total_projects, projects_last_7d = counts["projects"]["total"], counts["projects"]["recent"]
 
     # Calculate conversion rates
     signals_to_trends = (total_trends / total_signals * 100) if total_signals > 0 else 0
@@ -1036,75 +1484,46 @@ async def get_pipeline_live(session: Session = Depends(get_session)):
     ideas_to_plans = (total_plans / total_ideas * 100) if total_ideas > 0 else 0
     plans_to_projects = (total_projects / total_plans * 100) if total_plans > 0 else 0
 
-    # Get currently processing items
-    processing = []
+    # Get currently processing items, in one round-trip
+    rows = session.execute(_PROCESSING_ITEMS, {
+        "now": now,
+        "signal_since": now - timedelta(minutes=5),
+        "trend_since": now - timedelta(minutes=30),
+    }).all()
 
-    # Recent signals (last 5 minutes)
-    recent_signals = (
-        session.query(Signal)
-        .filter(Signal.collected_at >= now - timedelta(minutes=5))
-        .order_by(desc(Signal.collected_at))
-        .limit(3)
-        .all()
-    )
-    for signal in recent_signals:
-        minutes_ago = int((now - signal.collected_at).total_seconds() / 60) if signal.collected_at else 0
-        processing.append({
-            "type": "SIGNAL",
-            "title": signal.title[:60] + "..." if len(signal.title) > 60 else signal.title,
-            "time_ago": f"{minutes_ago}m ago" if minutes_ago > 0 else "just now",
-            "source": signal.source,
-        })
-
-    # Active debates
-    active_debates = (
-        session.query(DebateSession)
-        .filter(DebateSession.status == "in-progress")
-        .order_by(desc(DebateSession.started_at))
-        .limit(2)
-        .all()
-    )
-    for debate in active_debates:
-        topic_short = (debate.topic[:50] + "...") if debate.topic and len(debate.topic) > 50 else (debate.topic or "Unknown")
-        processing.append({
-            "type": "DEBATE",
-            "title": topic_short,
-            "time_ago": f"R{debate.round_number}/{debate.max_rounds}",
-            "phase": debate.phase,
-        })
-
-    # Recent trends being analyzed (last 30 minutes)
-    recent_trends = (
-        session.query(Trend)
-        .filter(Trend.analyzed_at >= now - timedelta(minutes=30))
-        .order_by(desc(Trend.analyzed_at))
-        .limit(2)
-        .all()
-    )
-    for trend in recent_trends:
-        minutes_ago = int((now - trend.analyzed_at).total_seconds() / 60) if trend.analyzed_at else 0
-        processing.append({
-            "type": "TREND",
-            "title": trend.name[:50] + "..." if len(trend.name) > 50 else trend.name,
-            "time_ago": f"{minutes_ago}m ago",
-            "score": trend.score,
-        })
-
-    # Projects being generated
-    generating_projects = (
-        session.query(Project)
-        .filter(Project.status == "generating")
-        .order_by(desc(Project.created_at))
-        .limit(2)
-        .all()
-    )
-    for proj in generating_projects:
-        processing.append({
-            "type": "PROJECT",
-            "title": proj.name[:50] + "..." if len(proj.name) > 50 else proj.name,
-            "time_ago": "generating",
-            "status": proj.status,
-        })
+    processing = []
+    generating = False
+    for row in rows:
+        minutes_ago = row.minutes_ago or 0
+        if row.kind == "signal":
+            processing.append({
+                "type": "SIGNAL",
+                "title": _truncate(row.title, 60),
+                "time_ago": f"{minutes_ago}m ago" if minutes_ago > 0 else "just now",
+                "source": row.detail,
+            })
+        elif row.kind == "debate":
+            processing.append({
+                "type": "DEBATE",
+                "title": _truncate(row.title, 50, "Unknown"),
+                "time_ago": f"R{row.round_number}/{row.max_rounds}",
+                "phase": row.detail,
+            })
+        elif row.kind == "trend":
+            processing.append({
+                "type": "TREND",
+                "title": _truncate(row.title, 50),
+                "time_ago": f"{minutes_ago}m ago",
+                "score": row.score,
+            })
+        elif row.kind == "project":
+            generating = True
+            processing.append({
+                "type": "PROJECT",
+                "title": _truncate(row.title, 50),
+                "time_ago": "generating",
+                "status": row.detail,
+            })
 
     return {
         "stages": {
@@ -1131,7 +1550,7 @@ async def get_pipeline_live(session: Session = Depends(get_session)):
             "projects": {
                 "count": total_projects,
                 "rate": f"+{projects_last_7d}/wk",
-                "status": "active" if any(p.status == "generating" for p in generating_projects) else ("idle" if projects_last_7d == 0 else "completed"),
+                "status": "active" if generating else ("idle" if projects_last_7d == 0 else "completed"),
             },
         },
         "conversion_rates": {
@@ -1145,6 +1564,24 @@ async def get_pipeline_live(session: Session = Depends(get_session)):
     }
 
 
+def _hit_rate(stats: Dict[str, int]) -> Dict[str, Any]:
+    hits, misses = stats["hits"], stats["misses"]
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": round(hits / (hits + misses), 3) if hits + misses else 0.0,
+    }
+
+
+@app.get("/cache/stats")
+async def get_cache_stats():
+    """Get hit/miss counters for this process's response cache and the shared layer behind it."""
+    return {
+        **_hit_rate(_local_response_stats),
+        "shared": _hit_rate(_shared_response_stats),
+    }
+
+
 @app.get("/")
 async def root():
     """API root endpoint."""
@@ -1220,7 +1657,6 @@ async def _generate_project_task(
     force_regenerate: bool,
 ):
     """Background task for project generation."""
-    import asyncio
     from ..llm import HybridLLMRouter
     from ..project import ProjectScaffold
     from ..db import get_database
@@ -1275,7 +1711,6 @@ async def generate_project(
     This endpoint starts an asynchronous project generation job.
     Use GET /jobs/{job_id} to check the status.
     """
-    import uuid
 
     # Verify plan exists and is approved
     plan_repo = PlanRepository(session)
@@ -1329,7 +1764,6 @@ async def generate_project(
         )
     else:
         # Fallback: run synchronously (for testing)
-        import asyncio
         asyncio.create_task(_generate_project_task(job_id, plan_id, request.force_regenerate))
 
     return GenerateProjectResponse(
@@ -1349,7 +1783,7 @@ async def get_job_status(job_id: str):
 
 
 @app.get("/projects")
-async def get_projects(
+def get_projects(
     limit: int = Query(default=20, le=100),
     offset: int = Query(default=0, ge=0),
     status: Optional[str] = None,
@@ -1359,13 +1793,16 @@ async def get_projects(
     repo = ProjectRepository(session)
 
     if status:
-        projects = repo.get_by_status(status, limit=limit + offset)
-        total = repo.count_by_status(status)
-        paginated = projects[offset:offset + limit]
+        paginated, total = _fetch_list(
+            f"projects:{status}",
+            partial(repo.get_by_status, status, limit=limit, offset=offset),
+            partial(repo.get_by_status_with_total, status, limit=limit),
+            lambda: repo.count_by_status(status),
+            first_page=not offset,
+        )
     else:
-        projects = repo.get_all(limit=limit, offset=offset)
-        total = repo.count_all()
-        paginated = projects
+        paginated = repo.get_all(limit=limit, offset=offset)
+        total = _cached_total("projects:all", repo.count_all)
 
     return {
         "projects": [p.to_dict() for p in paginated],
@@ -1376,7 +1813,7 @@ async def get_projects(
 
 
 @app.get("/projects/{project_id}")
-async def get_project_detail(
+def get_project_detail(
     project_id: str,
     session: Session = Depends(get_session),
 ):
@@ -1398,7 +1835,7 @@ async def get_project_detail(
 
 
 @app.get("/plans/{plan_id}/project")
-async def get_plan_project(
+def get_plan_project(
     plan_id: str,
     session: Session = Depends(get_session),
 ):
@@ -1450,7 +1887,6 @@ async def approve_plan(
     - Plans with score < 8.0 that weren't auto-approved
     - Plans that need manual review before project generation
     """
-    import uuid
 
     plan_repo = PlanRepository(session)
     plan = plan_repo.get_by_id(plan_id)
@@ -1480,7 +1916,6 @@ async def approve_plan(
                         _generate_project_task, job_id, plan_id, False
                     )
                 else:
-                    import asyncio
                     asyncio.create_task(_generate_project_task(job_id, plan_id, False))
                 return ApprovePlanResponse(
                     plan_id=plan_id,
@@ -1519,7 +1954,6 @@ async def approve_plan(
                 _generate_project_task, job_id, plan_id, False
             )
         else:
-            import asyncio
             asyncio.create_task(_generate_project_task(job_id, plan_id, False))
         message = "Plan approved and project generation started."
 
@@ -1532,7 +1966,7 @@ async def approve_plan(
 
 
 @app.get("/plans/pending-approval")
-async def get_pending_approval_plans(
+def get_pending_approval_plans(
     limit: int = Query(default=20, le=100),
     session: Session = Depends(get_session),
 ):
@@ -8,10 +8,19 @@ Implements the new workflow where:
 - Orchestrator polls for promotions and processes them
 """
 
+import asyncio
+import hashlib
+import heapq
+import itertools
+import os
 import re
-from datetime import datetime
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
 
+from .cache import CacheKeys, get_cache
 from .debate import DebateResult, create_debate_session
 from .github_client import GitHubClient, GitHubIssue, GitHubRateLimitError, Labels
 from .providers.base import BaseProvider, QuotaExhaustedError
@@ -32,88 +41,131 @@ from .utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# fcntl is POSIX-only; without it the O_EXCL lock file is the only guard
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# Ideas are generated concurrently; kept low for provider and GitHub rate limits
+_IDEA_WORKERS = 4
+
+# How long a debate-mode provider availability check is reused, in seconds
+_AVAILABILITY_TTL = 60.0
+
+# Open plans fetched once per cycle; a full page may be truncated, so then
+# each step searches GitHub itself
+_OPEN_PLANS_LIMIT = 100
+
+# References from a plan body back to its idea ("Source Idea: #12", "idea #12")
+_SOURCE_IDEA_RE = re.compile(r"(?:Source Idea:(?:\*\*)? |idea )#(\d+)")
+
+# Looser forms used when reading a plan back, tried in order of reliability
+_SCAFFOLD_SOURCE_IDEA_RE = re.compile(r"Source Idea.*?#(\d+)")
+# Plan number recorded in a scaffolded project's PLAN.md frontmatter or README
+_PROJECT_PLAN_RE = re.compile(r"^source_issue: (\d+)$|\*\*Plan Issue:\*\* \[#(\d+)\]", re.MULTILINE)
+
+_REJECTED_PLAN_IDEA_RES = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"Source Idea:\s*#(\d+)",
+        r"\*\*Source Idea:\*\*\s*#(\d+)",
+        r"from idea #(\d+)",
+        r"idea #(\d+)",
+    )
+)
 
-class IdeaGenerator:
-    """
-    Generates new idea issues for the backlog.
-
-    Creates GitHub Issues with structured idea content
-    following Mossland ecosystem focus.
-    """
-
-    def __init__(
-        self,
-        github: GitHubClient,
-        claude: ClaudeProvider | None = None,
-        dry_run: bool = False,
-    ):
-        self.github = github
-        self._claude = claude
-        self.dry_run = dry_run
-
-    @property
-    def claude(self) -> ClaudeProvider:
-        if self._claude is None:
-            self._claude = create_claude_provider(dry_run=self.dry_run)
-        return self._claude
-
-    def generate_ideas(self, count: int = 1) -> list[GitHubIssue]:
-        """
-        Generate new idea issues.
-
-        Args:
-            count: Number of ideas to generate.
-
-        Returns:
-            List of created GitHubIssue objects.
-        """
-        created = []
-
-        for i in range(count):
-            try:
-                logger.info(f"Generating idea {i + 1}/{count}")
+_TITLE_RE = re.compile(r"##\s*Title\s*\n+(.+?)(?=\n\n|\n##)", re.DOTALL)
 
-                # Generate idea content
-                idea = self._generate_idea_content()
 
-                if self.dry_run:
-                    logger.info(f"[DRY RUN] Would create idea: {idea['title']}")
-                    continue
+_NOT_PROVIDED = "(Not provided)"
 
-                # Create GitHub Issue
-                issue = self.github.create_issue(
-                    title=f"[IDEA] {idea['title']}",
-                    body=idea["body"],
-                    labels=[
-                        Labels.TYPE_IDEA,
-                        Labels.STATUS_BACKLOG,
-                        Labels.GENERATED_BY_ORCHESTRATOR,
-                    ],
-                )
 
-                created.append(issue)
-                logger.info(f"Created idea issue #{issue.number}: {idea['title']}")
+def _parse_sections(text: str) -> dict[str, str]:
+    """Split markdown into ``## header`` -> body, keyed by lowercased header.
 
-            except Exception as e:
-                logger.error(f"Failed to generate idea {i + 1}: {e}")
-                continue
+    Deeper headers (``###``) stay inside their section's body. If a header
+    repeats, the first occurrence wins.
+    """
+    sections: dict[str, str] = {}
+    key: str | None = None
+    lines: list[str] = []
+    for line in text.splitlines():
+        header = line[2:].strip() if line.startswith("##") and line[2:3] != "#" else ""
+        if not header:
+            lines.append(line)
+            continue
+        if key is not None:
+            sections.setdefault(key, "\n".join(lines).strip())
+        key = header.lower()
+        lines = []
+    if key is not None:
+        sections.setdefault(key, "\n".join(lines).strip())
+    return sections
+
+
+def _render_sections(sections: dict[str, str], layout: tuple[tuple[str, str], ...]) -> list[str]:
+    """Body blocks (``## heading``, content) for each (heading, section) in layout."""
+    blocks = []
+    for heading, name in layout:
+        blocks.append(f"## {heading}")
+        blocks.append(sections.get(name, _NOT_PROVIDED))
+    return blocks
+
+
+def _render_korean(sections: dict[str, str], layout: tuple[tuple[str, str], ...]) -> list[str]:
+    """Korean half of a body; one note instead of per-section filler when it is missing."""
+    if not any(name in sections for _, name in layout):
+        return [*_KOREAN_DIVIDER, _KOREAN_NOT_PROVIDED]
+    return [*_KOREAN_DIVIDER, *_render_sections(sections, layout)]
+
+
+_KOREAN_DIVIDER = ("---", "# 🇰🇷 한국어 (Korean)")
+
+_KOREAN_NOT_PROVIDED = "*(Korean translation not available)*"
+
+_IDEA_LAYOUT_EN = (
+    ("Overview", "problem"),
+    ("Target User", "target user"),
+    ("Why Mossland", "why mossland"),
+    ("MVP Scope", "mvp scope"),
+    ("Technical Approach", "technical approach"),
+    ("Risks", "risks"),
+    ("Success Metrics", "success metrics"),
+)
 
-        return created
+_IDEA_LAYOUT_KO = (
+    ("개요", "문제"),
+    ("대상 사용자", "대상 사용자"),
+    ("왜 모스랜드인가", "왜 모스랜드인가"),
+    ("MVP 범위", "mvp 범위"),
+    ("기술적 접근", "기술적 접근"),
+    ("위험 요소", "위험 요소"),
+    ("성공 지표", "성공 지표"),
+)
 
-    def _generate_idea_content(self) -> dict:
-        """Generate structured idea content using Claude."""
-        prompt = self._get_idea_prompt()
+_TREND_IDEA_LAYOUT_EN = (
+    ("Trend Connection", "trend connection"),
+    ("Problem", "problem"),
+    ("Target User", "target user"),
+    ("MVP Scope", "mvp scope"),
+    ("Technical Approach", "technical approach"),
+    ("Risks", "risks"),
+    ("Success Metrics", "success metrics"),
+)
 
-        response = self.claude.chat(
-            user_message=prompt,
-            system_message=self._get_system_message(),
-        )
+_TREND_IDEA_LAYOUT_KO = (
+    ("트렌드 연결", "트렌드 연결"),
+    ("문제", "문제"),
+    ("대상 사용자", "대상 사용자"),
+    ("MVP 범위", "mvp 범위"),
+    ("기술적 접근", "기술적 접근"),
+    ("위험 요소", "위험 요소"),
+    ("성공 지표", "성공 지표"),
+)
 
-        # Parse response
-        return self._parse_idea_response(response)
 
-    def _get_system_message(self) -> str:
-        return """You are a creative Web3 product strategist for the Mossland ecosystem.
+_IDEA_SYSTEM_MESSAGE = """You are a creative Web3 product strategist for the Mossland ecosystem.
 
 Mossland is a blockchain-based metaverse project with:
 - MOC Token (Mossland Coin) - the native cryptocurrency
@@ -142,8 +194,7 @@ Good examples:
 - Analytics dashboards
 - Reward distribution tools"""
 
-    def _get_idea_prompt(self) -> str:
-        return """Generate ONE innovative micro Web3 service idea for the Mossland ecosystem.
+_IDEA_PROMPT = """Generate ONE innovative micro Web3 service idea for the Mossland ecosystem.
 
 Provide a structured response with these exact sections (in ENGLISH first, then KOREAN translation):
 
@@ -210,10 +261,130 @@ Now provide the KOREAN translation of ALL sections above:
 
 Be specific and practical. Focus on something that can actually be built quickly."""
 
-    def _parse_idea_response(self, response: str) -> dict:
+
+def _utc_stamp() -> str:
+    """Current UTC time for the "Generated:" line of issue bodies."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M")
+
+
+class IdeaGenerator:
+    """
+    Generates new idea issues for the backlog.
+
+    Creates GitHub Issues with structured idea content
+    following Mossland ecosystem focus.
+    """
+
+    def __init__(
+        self,
+        github: GitHubClient,
+        claude: ClaudeProvider | None = None,
+        dry_run: bool = False,
+    ):
+        self.github = github
+        self._claude = claude
+        self.dry_run = dry_run
+
+    @property
+    def claude(self) -> ClaudeProvider:
+        if self._claude is None:
+            self._claude = create_claude_provider(dry_run=self.dry_run)
+        return self._claude
+
+    def generate_ideas(self, count: int = 1) -> list[GitHubIssue]:
+        """
+        Generate new idea issues.
+
+        Args:
+            count: Number of ideas to generate.
+
+        Returns:
+            List of created GitHubIssue objects.
+        """
+        created = []
+        if count <= 0:
+            return created
+
+        # One timestamp for the whole batch
+        generated_at = datetime.now(timezone.utc)
+        _ = self.claude  # resolve the lazy provider before workers share it
+        with ThreadPoolExecutor(max_workers=min(count, _IDEA_WORKERS)) as executor:
+            futures = [
+                executor.submit(self._generate_and_create_one, i, count, generated_at)
+                for i in range(count)
+            ]
+
+        for i, future in enumerate(futures):
+            try:
+                issue = future.result()
+            except Exception as e:
+                logger.error(f"Failed to generate idea {i + 1}: {e}")
+                continue
+            if issue is not None:
+                created.append(issue)
+
+        return created
+
+    async def generate_ideas_async(self, count: int = 1) -> list[GitHubIssue]:
+        """
+        Generate new idea issues without blocking the running event loop.
+
+        The provider and GitHub clients are synchronous, so the batch runs on a
+        worker thread (where generate_ideas fans out as usual).
+
+        Args:
+            count: Number of ideas to generate.
+
+        Returns:
+            List of created GitHubIssue objects.
+        """
+        return await asyncio.to_thread(self.generate_ideas, count)
+
+    def _generate_and_create_one(
+        self, i: int, count: int, generated_at: datetime | None = None
+    ) -> GitHubIssue | None:
+        """Generate one idea and create its issue (None in dry-run mode)."""
+        logger.info(f"Generating idea {i + 1}/{count}")
+
+        # Generate idea content
+        idea = self._generate_idea_content(generated_at=generated_at)
+
+        if self.dry_run:
+            logger.info(f"[DRY RUN] Would create idea: {idea['title']}")
+            return None
+
+        # Create GitHub Issue
+        issue = self.github.create_issue(
+            title=f"[IDEA] {idea['title']}",
+            body=idea["body"],
+            labels=[
+                Labels.TYPE_IDEA,
+                Labels.STATUS_BACKLOG,
+                Labels.GENERATED_BY_ORCHESTRATOR,
+            ],
+        )
+
+        logger.info(f"Created idea issue #{issue.number}: {idea['title']}")
+        return issue
+
+    def _generate_idea_content(self, generated_at: datetime | None = None) -> dict:
+        """Generate structured idea content using Claude."""
+        response = self.claude.chat(
+            user_message=_IDEA_PROMPT,
+            system_message=_IDEA_SYSTEM_MESSAGE,
+            cache_system=True,
+        )
+
+        # Parse response
+        return self._parse_idea_response(response, generated_at=generated_at)
+
+    def _parse_idea_response(self, response: str, generated_at: datetime | None = None) -> dict:
         """Parse Claude's response into structured idea."""
+        generated_at = generated_at or datetime.now(timezone.utc)
+        sections = _parse_sections(response)
+
         # Extract title
-        title_match = re.search(r"##\s*Title\s*\n+(.+?)(?=\n\n|\n##)", response, re.DOTALL)
+        title_match = _TITLE_RE.search(response)
         title = title_match.group(1).strip() if title_match else "Untitled Idea"
 
         # Clean title
@@ -221,99 +392,104 @@ Be specific and practical. Focus on something that can actually be built quickly
         if len(title) > 80:
             title = title[:77] + "..."
 
-        # Extract Korean title
-        korean_title = self._extract_section(response, "제목", "문제")
-        if korean_title == "(Not provided)":
-            korean_title = ""
-        else:
-            korean_title = korean_title.replace("#", "").strip()
-
         # Build body with all sections (English + Korean)
-        body = f"""## Overview
+        blocks = [
+            *_render_sections(sections, _IDEA_LAYOUT_EN),
+            *_render_korean(sections, _IDEA_LAYOUT_KO),
+            "---",
+            f"*Generated by Agentic Orchestrator on {generated_at.strftime('%Y-%m-%d %H:%M')} UTC*",
+            "**To promote this idea to planning:** Add the `promote:to-plan` label.",
+        ]
+        body = "\n\n".join(blocks) + "\n"
 
-{self._extract_section(response, "Problem", "Target User")}
+        return {"title": title, "body": body}
 
-## Target User
 
-{self._extract_section(response, "Target User", "Why Mossland")}
+_TREND_SYSTEM_MESSAGE = """You are a creative Web3 product strategist who capitalizes on current trends.
 
-## Why Mossland
+You generate SMALL, FOCUSED micro-service ideas that:
+1. Directly leverage or relate to trending topics
+2. Can be built as an MVP in 1-2 weeks
+3. Have clear value proposition tied to the trend
+4. Are technically feasible with Web3 technologies
+5. Could optionally integrate with Mossland ecosystem (MOC token) but not required
 
-{self._extract_section(response, "Why Mossland", "MVP Scope")}
+Focus on:
+- Timely opportunities from the trend
+- Clear user needs emerging from the trend
+- Practical Web3 implementations
+- Quick time-to-market for trend relevance"""
 
-## MVP Scope
+_IDEA_SEPARATOR = "--- IDEA SEPARATOR ---"
+# Each batched idea opens with the number of the trend it answers
+_TREND_NUMBER_RE = re.compile(r"^##\s*Trend Number:\s*(\d+)[ \t]*\n?", re.MULTILINE)
 
-{self._extract_section(response, "MVP Scope", "Technical Approach")}
+_TREND_IDEA_INSTRUCTIONS = """---
 
-## Technical Approach
+Provide a structured response with these exact sections (in ENGLISH first, then KOREAN translation):
 
-{self._extract_section(response, "Technical Approach", "Risks")}
+## Title
+A short, descriptive name (3-6 words) that reflects the trend
 
-## Risks
+## Trend Connection
+How does this idea capitalize on the current trend? (2-3 sentences)
 
-{self._extract_section(response, "Risks", "Success Metrics")}
+## Problem
+What specific problem does this solve? (2-3 sentences)
 
-## Success Metrics
+## Target User
+Who will use this? What's their main need? (2-3 sentences)
+
+## MVP Scope
+What's the minimum viable product? List 3-5 core features:
+- Feature 1
+- Feature 2
+- Feature 3
 
-{self._extract_section(response, "Success Metrics", "한국어 번역")}
+## Technical Approach
+Brief technical overview (2-3 sentences mentioning key Web3 technologies)
 
----
+## Risks
+Top 2-3 risks and challenges:
+- Risk 1
+- Risk 2
 
-# 🇰🇷 한국어 (Korean)
+## Success Metrics
+How do we measure success? List 2-3 metrics:
+- Metric 1
+- Metric 2
 
-## 개요
+---
 
-{self._extract_section(response, "문제", "대상 사용자")}
+## 한국어 번역 (Korean Translation)
 
-## 대상 사용자
+Now provide the KOREAN translation of ALL sections above:
 
-{self._extract_section(response, "대상 사용자", "왜 모스랜드인가")}
+## 제목
+(Title in Korean)
 
-## 왜 모스랜드인가
+## 트렌드 연결
+(Trend Connection in Korean)
 
-{self._extract_section(response, "왜 모스랜드인가", "MVP 범위")}
+## 문제
+(Problem in Korean)
 
-## MVP 범위
+## 대상 사용자
+(Target User in Korean)
 
-{self._extract_section(response, "MVP 범위", "기술적 접근")}
+## MVP 범위
+(MVP Scope in Korean)
 
 ## 기술적 접근
-
-{self._extract_section(response, "기술적 접근", "위험 요소")}
+(Technical Approach in Korean)
 
 ## 위험 요소
-
-{self._extract_section(response, "위험 요소", "성공 지표")}
+(Risks in Korean)
 
 ## 성공 지표
+(Success Metrics in Korean)
 
-{self._extract_section(response, "성공 지표", None)}
-
----
-
-*Generated by Agentic Orchestrator on {datetime.now().strftime("%Y-%m-%d %H:%M")} UTC*
-
-**To promote this idea to planning:** Add the `promote:to-plan` label.
-"""
-
-        return {"title": title, "body": body}
-
-    def _extract_section(
-        self,
-        text: str,
-        section: str,
-        next_section: str | None,
-    ) -> str:
-        """Extract content between two section headers."""
-        if next_section:
-            pattern = rf"##\s*{section}\s*\n+(.*?)(?=##\s*{next_section})"
-        else:
-            pattern = rf"##\s*{section}\s*\n+(.*?)$"
-
-        match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
-        if match:
-            return match.group(1).strip()
-        return "(Not provided)"
+Be specific, practical, and timely. Focus on something that can be built quickly while the trend is hot."""
 
 
 class TrendBasedIdeaGenerator:
@@ -448,38 +624,39 @@ class TrendBasedIdeaGenerator:
             logger.warning("No significant trends found")
             return created
 
-        for i, trend in enumerate(top_trends):
+        _ = self.claude  # resolve the lazy provider before workers share it
+        generated_at = datetime.now(timezone.utc)
+
+        # One completion for all trends; any idea missing from it is generated on its own
+        ideas: list[dict | None] = [None] * len(top_trends)
+        if len(top_trends) > 1:
             try:
-                logger.info(f"Generating trend-based idea {i + 1}/{count} for: {trend.topic}")
+                ideas = self._generate_ideas_from_trends_batch(top_trends, generated_at)
+            except Exception as e:
+                logger.warning(f"Batched trend idea generation failed, generating one by one: {e}")
 
-                # Generate idea content
-                idea = self._generate_idea_from_trend(trend)
+        with ThreadPoolExecutor(max_workers=min(len(top_trends), _IDEA_WORKERS)) as executor:
+            futures = [
+                executor.submit(
+                    self._generate_and_create_from_trend, i, count, trend, idea, generated_at
+                )
+                for i, (trend, idea) in enumerate(zip(top_trends, ideas, strict=True))
+            ]
 
-                if self.dry_run:
-                    logger.info(f"[DRY RUN] Would create trend-based idea: {idea['title']}")
+        for i, (trend, future) in enumerate(zip(top_trends, futures, strict=True)):
+            try:
+                issue = future.result()
+                if issue is None:
                     continue
 
-                # Create GitHub Issue with trend label
-                issue = self.github.create_issue(
-                    title=f"[IDEA] {idea['title']}",
-                    body=idea["body"],
-                    labels=[
-                        Labels.TYPE_IDEA,
-                        Labels.STATUS_BACKLOG,
-                        Labels.GENERATED_BY_ORCHESTRATOR,
-                        Labels.SOURCE_TREND,
-                    ],
-                )
-
                 created.append(issue)
-                logger.info(f"Created trend-based idea #{issue.number}: {idea['title']}")
 
-                # Link idea to trend
+                # Link idea to trend (the link index is read-modify-write, so not in workers)
                 link = TrendIdeaLink(
                     idea_issue_number=issue.number,
                     trend_topic=trend.topic,
                     trend_category=trend.category,
-                    analysis_date=datetime.utcnow(),
+                    analysis_date=generated_at,
                 )
                 self.storage.link_idea_to_trend(link)
 
@@ -489,6 +666,55 @@ class TrendBasedIdeaGenerator:
 
         return created
 
+    async def generate_trend_based_ideas_async(
+        self,
+        count: int = 2,
+        analyses: dict[str, TrendAnalysis] | None = None,
+    ) -> list[GitHubIssue]:
+        """
+        Generate trend-based ideas without blocking the running event loop.
+
+        Args:
+            count: Number of trend-based ideas to generate.
+            analyses: Optional pre-computed trend analyses.
+
+        Returns:
+            List of created GitHubIssue objects.
+        """
+        return await asyncio.to_thread(self.generate_trend_based_ideas, count, analyses)
+
+    def _generate_and_create_from_trend(
+        self,
+        i: int,
+        count: int,
+        trend: Trend,
+        idea: dict | None = None,
+        generated_at: datetime | None = None,
+    ) -> GitHubIssue | None:
+        """Create the issue for a trend-based idea, generating it if not given (None in dry-run)."""
+        if idea is None:
+            logger.info(f"Generating trend-based idea {i + 1}/{count} for: {trend.topic}")
+            idea = self._generate_idea_from_trend(trend, generated_at=generated_at)
+
+        if self.dry_run:
+            logger.info(f"[DRY RUN] Would create trend-based idea: {idea['title']}")
+            return None
+
+        # Create GitHub Issue with trend label
+        issue = self.github.create_issue(
+            title=f"[IDEA] {idea['title']}",
+            body=idea["body"],
+            labels=[
+                Labels.TYPE_IDEA,
+                Labels.STATUS_BACKLOG,
+                Labels.GENERATED_BY_ORCHESTRATOR,
+                Labels.SOURCE_TREND,
+            ],
+        )
+
+        logger.info(f"Created trend-based idea #{issue.number}: {idea['title']}")
+        return issue
+
     def _get_top_trends(
         self,
         analyses: dict[str, TrendAnalysis],
@@ -499,54 +725,89 @@ class TrendBasedIdeaGenerator:
 
         Prioritizes 24h trends, then supplements with weekly/monthly.
         """
-        all_trends = []
-
-        # Priority order: 24h > 1w > 1m
-        for period in ["24h", "1w", "1m"]:
-            if period in analyses:
-                all_trends.extend(analyses[period].trends)
+        # Priority order: 24h > 1w > 1m; the position breaks score ties the same way
+        all_trends = itertools.chain.from_iterable(
+            analyses[period].trends for period in ("24h", "1w", "1m") if period in analyses
+        )
+        ranked = [(-trend.score, position, trend) for position, trend in enumerate(all_trends)]
+        heapq.heapify(ranked)
 
-        # Sort by score and deduplicate by topic
+        # Pop by score only until enough distinct topics are found
         seen_topics = set()
         unique_trends = []
-        for trend in sorted(all_trends, key=lambda t: t.score, reverse=True):
-            topic_lower = trend.topic.lower()
-            if topic_lower not in seen_topics:
-                seen_topics.add(topic_lower)
+        while ranked and len(unique_trends) < count:
+            _, _, trend = heapq.heappop(ranked)
+            topic = trend.topic_fold
+            if topic not in seen_topics:
+                seen_topics.add(topic)
                 unique_trends.append(trend)
-                if len(unique_trends) >= count:
-                    break
 
         return unique_trends
 
-    def _generate_idea_from_trend(self, trend: Trend) -> dict:
+    def _generate_idea_from_trend(self, trend: Trend, generated_at: datetime | None = None) -> dict:
         """Generate idea content based on a trend."""
-        prompt = self._get_trend_idea_prompt(trend)
-
-        response = self.claude.chat(
-            user_message=prompt,
-            system_message=self._get_trend_system_message(),
-        )
+        response = self._chat(self._get_trend_idea_prompt(trend))
+        return self._parse_trend_idea_response(response, trend, generated_at=generated_at)
 
-        return self._parse_trend_idea_response(response, trend)
-
-    def _get_trend_system_message(self) -> str:
-        return """You are a creative Web3 product strategist who capitalizes on current trends.
+    def _generate_ideas_from_trends_batch(
+        self, trends: list[Trend], generated_at: datetime | None = None
+    ) -> list[dict | None]:
+        """
+        Generate one idea per trend with a single completion.
 
-You generate SMALL, FOCUSED micro-service ideas that:
-1. Directly leverage or relate to trending topics
-2. Can be built as an MVP in 1-2 weeks
-3. Have clear value proposition tied to the trend
-4. Are technically feasible with Web3 technologies
-5. Could optionally integrate with Mossland ecosystem (MOC token) but not required
+        Each idea names the number of the trend it answers, so a skipped or
+        merged idea cannot shift later ideas onto the wrong trend. Trends
+        without a complete, numbered idea (e.g. it was cut off) get None.
+        """
+        prompt = (
+            f"Based on these {len(trends)} trending topics, generate ONE innovative "
+            "micro Web3 service idea for EACH trend.\n\n"
+            + "\n".join(
+                f"Trend Number {number}:\n{self._describe_trend(trend)}"
+                for number, trend in enumerate(trends, 1)
+            )
+            + "\n"
+            + _TREND_IDEA_INSTRUCTIONS
+            + "\n\nAnswer for each trend, using the full structure above for every idea. "
+            "Start each idea with a line ## Trend Number: <n> naming the trend it answers, "
+            f"and put a line containing only {_IDEA_SEPARATOR} between ideas."
+        )
+        response = self._chat(prompt)
+
+        chunks: dict[int, str] = {}
+        for chunk in response.split(_IDEA_SEPARATOR):
+            tag = _TREND_NUMBER_RE.search(chunk)
+            if tag and _TITLE_RE.search(chunk):
+                chunks.setdefault(int(tag.group(1)), _TREND_NUMBER_RE.sub("", chunk, count=1))
+
+        ideas: list[dict | None] = []
+        for number, trend in enumerate(trends, 1):
+            chunk = chunks.get(number)
+            ideas.append(
+                self._parse_trend_idea_response(chunk, trend, generated_at=generated_at)
+                if chunk is not None
+                else None
+            )
+        return ideas
 
-Focus on:
-- Timely opportunities from the trend
-- Clear user needs emerging from the trend
-- Practical Web3 implementations
-- Quick time-to-market for trend relevance"""
+    def _chat(self, prompt: str) -> str:
+        """Chat with the trend system message."""
+        # Not cached: a reused response would file a duplicate [IDEA] issue
+        return self.claude.chat(
+            user_message=prompt,
+            system_message=_TREND_SYSTEM_MESSAGE,
+            cache_system=True,
+        )
 
     def _get_trend_idea_prompt(self, trend: Trend) -> str:
+        return (
+            "Based on this trending topic, generate ONE innovative micro Web3 service idea.\n\n"
+            + self._describe_trend(trend)
+            + "\n"
+            + _TREND_IDEA_INSTRUCTIONS
+        )
+
+    def _describe_trend(self, trend: Trend) -> str:
         headlines = "\n".join(f"- {h}" for h in trend.sample_headlines[:5])
         keywords = ", ".join(trend.keywords[:8])
         idea_seeds = (
@@ -555,9 +816,7 @@ Focus on:
             else "None provided"
         )
 
-        return f"""Based on this trending topic, generate ONE innovative micro Web3 service idea.
-
-## Trend: {trend.topic}
+        return f"""## Trend: {trend.topic}
 **Category:** {trend.category}
 **Score:** {trend.score}/10
 **Why trending:** {trend.summary}
@@ -570,78 +829,17 @@ Focus on:
 
 **Potential Ideas (for inspiration):**
 {idea_seeds}
+"""
 
----
-
-Provide a structured response with these exact sections (in ENGLISH first, then KOREAN translation):
-
-## Title
-A short, descriptive name (3-6 words) that reflects the trend
-
-## Trend Connection
-How does this idea capitalize on the current trend? (2-3 sentences)
-
-## Problem
-What specific problem does this solve? (2-3 sentences)
-
-## Target User
-Who will use this? What's their main need? (2-3 sentences)
-
-## MVP Scope
-What's the minimum viable product? List 3-5 core features:
-- Feature 1
-- Feature 2
-- Feature 3
-
-## Technical Approach
-Brief technical overview (2-3 sentences mentioning key Web3 technologies)
-
-## Risks
-Top 2-3 risks and challenges:
-- Risk 1
-- Risk 2
-
-## Success Metrics
-How do we measure success? List 2-3 metrics:
-- Metric 1
-- Metric 2
-
----
-
-## 한국어 번역 (Korean Translation)
-
-Now provide the KOREAN translation of ALL sections above:
-
-## 제목
-(Title in Korean)
-
-## 트렌드 연결
-(Trend Connection in Korean)
-
-## 문제
-(Problem in Korean)
-
-## 대상 사용자
-(Target User in Korean)
-
-## MVP 범위
-(MVP Scope in Korean)
-
-## 기술적 접근
-(Technical Approach in Korean)
-
-## 위험 요소
-(Risks in Korean)
-
-## 성공 지표
-(Success Metrics in Korean)
-
-Be specific, practical, and timely. Focus on something that can be built quickly while the trend is hot."""
-
-    def _parse_trend_idea_response(self, response: str, trend: Trend) -> dict:
+    def _parse_trend_idea_response(
+        self, response: str, trend: Trend, generated_at: datetime | None = None
+    ) -> dict:
         """Parse Claude's response into structured idea."""
+        generated_at = generated_at or datetime.now(timezone.utc)
+        sections = _parse_sections(response)
+
         # Extract title
-        title_match = re.search(r"##\s*Title\s*\n+(.+?)(?=\n\n|\n##)", response, re.DOTALL)
+        title_match = _TITLE_RE.search(response)
         title = title_match.group(1).strip() if title_match else f"Trend-Based: {trend.topic[:50]}"
 
         # Clean title
@@ -650,138 +848,141 @@ Be specific, practical, and timely. Focus on something that can be built quickly
             title = title[:77] + "..."
 
         # Build body with trend context (English + Korean)
-        body = f"""## Trend Source
-
-**Topic:** {trend.topic}
-**Category:** {trend.category}
-**Score:** {trend.score}/10
-**Keywords:** {", ".join(trend.keywords[:5])}
-
----
-
-## Trend Connection
-
-{self._extract_section(response, "Trend Connection", "Problem")}
-
-## Problem
-
-{self._extract_section(response, "Problem", "Target User")}
-
-## Target User
-
-{self._extract_section(response, "Target User", "MVP Scope")}
-
-## MVP Scope
-
-{self._extract_section(response, "MVP Scope", "Technical Approach")}
+        blocks = [
+            "## Trend Source",
+            f"**Topic:** {trend.topic}\n"
+            f"**Category:** {trend.category}\n"
+            f"**Score:** {trend.score}/10\n"
+            f"**Keywords:** {', '.join(trend.keywords[:5])}",
+            "---",
+            *_render_sections(sections, _TREND_IDEA_LAYOUT_EN),
+            *_render_korean(sections, _TREND_IDEA_LAYOUT_KO),
+            "---",
+            f"*Generated by Agentic Orchestrator (Trend-Based) on {generated_at.strftime('%Y-%m-%d %H:%M')} UTC*",
+            f"**Source Trend:** {trend.topic} ({trend.time_period})",
+            "**To promote this idea to planning:** Add the `promote:to-plan` label.",
+        ]
+        body = "\n\n".join(blocks) + "\n"
 
-## Technical Approach
+        return {"title": title, "body": body}
 
-{self._extract_section(response, "Technical Approach", "Risks")}
+    def get_trend_status(self, days: int = 7) -> dict:
+        """
+        Get trend analysis status for recent days.
 
-## Risks
+        Args:
+            days: Number of days to look back.
 
-{self._extract_section(response, "Risks", "Success Metrics")}
+        Returns:
+            Dictionary with trend status information.
+        """
+        recent = self.storage.get_recent_analyses(days=days)
+        links = self.storage.get_all_idea_links()
 
-## Success Metrics
+        return {
+            "analyses_available": len(recent),
+            "total_ideas_from_trends": len(links),
+            "recent_trends": [
+                {
+                    "date": (
+                        list(analysis.values())[0].date.strftime("%Y-%m-%d") if analysis else None
+                    ),
+                    "periods": list(analysis.keys()),
+                    "total_trends": sum(len(a.trends) for a in analysis.values()),
+                }
+                for analysis in recent[:5]
+            ],
+            "idea_links": [
+                {
+                    "issue": link.idea_issue_number,
+                    "trend": link.trend_topic,
+                    "category": link.trend_category,
+                }
+                for link in links[-10:]  # Last 10 links
+            ],
+        }
 
-{self._extract_section(response, "Success Metrics", "한국어 번역")}
 
----
+# Static plan template, sent as the (cached) system prompt ahead of the idea
+_PLAN_SYSTEM_MESSAGE = """You are an expert product manager and software architect. Create detailed, actionable planning documents.
 
-# 🇰🇷 한국어 (Korean)
+For the idea you are given, create a comprehensive planning document with these sections:
 
-## 트렌드 연결
+## 1. Product Requirements Document (PRD)
 
-{self._extract_section(response, "트렌드 연결", "문제")}
+### 1.1 Executive Summary
+Brief overview (2-3 sentences)
 
-## 문제
+### 1.2 Problem Statement
+Detailed problem description
 
-{self._extract_section(response, "문제", "대상 사용자")}
+### 1.3 Goals and Success Metrics
+- Primary goal
+- Key metrics
 
-## 대상 사용자
+### 1.4 User Stories
+Write 3-5 user stories in format: "As a [user], I want [action] so that [benefit]"
 
-{self._extract_section(response, "대상 사용자", "MVP 범위")}
+### 1.5 Functional Requirements
+List core features with priorities (Must Have / Should Have / Nice to Have)
 
-## MVP 범위
+### 1.6 Non-Functional Requirements
+Performance, security, scalability considerations
 
-{self._extract_section(response, "MVP 범위", "기술적 접근")}
+## 2. Architecture
 
-## 기술적 접근
+### 2.1 System Overview
+High-level architecture description
 
-{self._extract_section(response, "기술적 접근", "위험 요소")}
+### 2.2 Technology Stack
+| Layer | Technology | Justification |
+|-------|------------|---------------|
 
-## 위험 요소
+### 2.3 Component Design
+Key components and their responsibilities
 
-{self._extract_section(response, "위험 요소", "성공 지표")}
+### 2.4 Data Model
+Core entities and relationships
 
-## 성공 지표
+### 2.5 API Design
+Key endpoints (if applicable)
 
-{self._extract_section(response, "성공 지표", None)}
+## 3. Task Breakdown
 
----
+### Phase 1: Setup
+- [ ] Task 1 (Effort: S/M/L)
+- [ ] Task 2
 
-*Generated by Agentic Orchestrator (Trend-Based) on {datetime.now().strftime("%Y-%m-%d %H:%M")} UTC*
+### Phase 2: Core Development
+- [ ] Task 3
+- [ ] Task 4
 
-**Source Trend:** {trend.topic} ({trend.time_period})
+### Phase 3: Integration & Testing
+- [ ] Task 5
+- [ ] Task 6
 
-**To promote this idea to planning:** Add the `promote:to-plan` label.
-"""
+## 4. Acceptance Criteria
 
-        return {"title": title, "body": body}
+### Feature 1
+- [ ] Criterion 1
+- [ ] Criterion 2
 
-    def _extract_section(
-        self,
-        text: str,
-        section: str,
-        next_section: str | None,
-    ) -> str:
-        """Extract content between two section headers."""
-        if next_section:
-            pattern = rf"##\s*{section}\s*\n+(.*?)(?=##\s*{next_section})"
-        else:
-            pattern = rf"##\s*{section}\s*\n+(.*?)$"
+### Feature 2
+- [ ] Criterion 1
 
-        match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
-        if match:
-            return match.group(1).strip()
-        return "(Not provided)"
+## 5. Risks and Mitigations
 
-    def get_trend_status(self, days: int = 7) -> dict:
-        """
-        Get trend analysis status for recent days.
+| Risk | Probability | Impact | Mitigation |
+|------|-------------|--------|------------|
 
-        Args:
-            days: Number of days to look back.
+## 6. Timeline Estimate
 
-        Returns:
-            Dictionary with trend status information.
-        """
-        recent = self.storage.get_recent_analyses(days=days)
-        links = self.storage.get_all_idea_links()
+- Phase 1: X days
+- Phase 2: X days
+- Phase 3: X days
+- **Total: X days**
 
-        return {
-            "analyses_available": len(recent),
-            "total_ideas_from_trends": len(links),
-            "recent_trends": [
-                {
-                    "date": (
-                        list(analysis.values())[0].date.strftime("%Y-%m-%d") if analysis else None
-                    ),
-                    "periods": list(analysis.keys()),
-                    "total_trends": sum(len(a.trends) for a in analysis.values()),
-                }
-                for analysis in recent[:5]
-            ],
-            "idea_links": [
-                {
-                    "issue": link.idea_issue_number,
-                    "trend": link.trend_topic,
-                    "category": link.trend_category,
-                }
-                for link in links[-10:]  # Last 10 links
-            ],
-        }
+Be specific and practical. Focus on MVP scope that can be built in 1-2 weeks."""
 
 
 class PlanGenerator:
@@ -805,6 +1006,8 @@ class PlanGenerator:
         dry_run: bool = False,
         enable_debate: bool = True,
         debate_max_rounds: int = 5,
+        batch_plans: bool = False,
+        batch_max_wait: float = 100.0,
     ):
         self.github = github
         self._claude = claude
@@ -813,6 +1016,16 @@ class PlanGenerator:
         self.dry_run = dry_run
         self.enable_debate = enable_debate
         self.debate_max_rounds = debate_max_rounds
+        self.batch_plans = batch_plans
+        # The batch is awaited while the orchestrator lock is held, so it must
+        # finish (or be cancelled) well before the lock can be taken as stale
+        self.batch_max_wait = batch_max_wait
+
+        # Open plans by referenced idea number, built once per polling cycle
+        self._planned_ideas: dict[int, list[GitHubIssue]] | None = None
+
+        # (monotonic time checked, result) of the last provider availability probe
+        self._availability_cache: tuple[float, bool] | None = None
 
     @property
     def claude(self) -> ClaudeProvider:
@@ -841,14 +1054,31 @@ class PlanGenerator:
         return self._gemini
 
     def _all_providers_available(self) -> bool:
-        """Check if all providers are available for debate mode."""
+        """Check if all providers are available for debate mode.
+
+        The result is reused for _AVAILABILITY_TTL seconds so a batch of plans
+        probes the providers once rather than once per plan.
+        """
+        now = time.monotonic()
+        if self._availability_cache is not None:
+            checked_at, available = self._availability_cache
+            if now - checked_at < _AVAILABILITY_TTL:
+                return available
+
         try:
             claude_ok = self.claude is not None and self.claude.is_available()
             openai_ok = self.openai is not None and self.openai.is_available()
             gemini_ok = self.gemini is not None and self.gemini.is_available()
-            return claude_ok and openai_ok and gemini_ok
+            available = claude_ok and openai_ok and gemini_ok
         except Exception:
-            return False
+            available = False
+
+        self._availability_cache = (now, available)
+        return available
+
+    def invalidate_availability_cache(self) -> None:
+        """Forget the last provider availability check."""
+        self._availability_cache = None
 
     def _get_providers_dict(self) -> dict[str, BaseProvider]:
         """Get providers as a dictionary for debate session."""
@@ -910,6 +1140,11 @@ class PlanGenerator:
         This is the fallback mode when debate mode is disabled or
         not all providers are available.
         """
+        # The content would be discarded, so dry runs skip the LLM call too
+        if self.dry_run:
+            logger.info(f"[DRY RUN] Would create plan for idea #{idea_issue.number}")
+            return None
+
         # Track created artifacts for rollback
         created_plan: GitHubIssue | None = None
 
@@ -917,10 +1152,6 @@ class PlanGenerator:
             # Generate plan content
             plan_content = self._generate_plan_content(idea_issue)
 
-            if self.dry_run:
-                logger.info(f"[DRY RUN] Would create plan for idea #{idea_issue.number}")
-                return None
-
             # Step 1: Create plan issue
             plan_title = idea_issue.title.replace("[IDEA]", "[PLAN]")
             created_plan = self.github.create_issue(
@@ -934,18 +1165,15 @@ class PlanGenerator:
             )
             logger.debug(f"Created plan issue #{created_plan.number}")
 
-            # Step 2: Update idea issue status
-            self.github.mark_idea_as_planned(idea_issue.number)
-            logger.debug(f"Marked idea #{idea_issue.number} as planned")
+            # Step 2: Update idea issue status, then its cross-reference comment
+            self._mark_idea_as_planned(
+                idea_issue,
+                f"Planning document created: #{created_plan.number}\n\n"
+                f"This idea has been promoted to the planning phase.",
+            )
 
-            # Step 3: Add cross-reference comments (non-critical, don't rollback for these)
+            # Step 3: Add cross-reference comment (non-critical, don't rollback for this)
             try:
-                self.github.add_comment(
-                    idea_issue.number,
-                    f"Planning document created: #{created_plan.number}\n\n"
-                    f"This idea has been promoted to the planning phase.",
-                )
-
                 self.github.add_comment(
                     created_plan.number,
                     f"This plan was generated from idea #{idea_issue.number}.\n\n"
@@ -953,9 +1181,10 @@ class PlanGenerator:
                 )
             except Exception as comment_err:
                 # Comments are non-critical, just log warning
-                logger.warning(f"Failed to add cross-reference comments: {comment_err}")
+                logger.warning(f"Failed to add cross-reference comment: {comment_err}")
 
             logger.info(f"Created plan issue #{created_plan.number}")
+            self._record_plan(idea_issue.number, created_plan)
             return created_plan
 
         except Exception as e:
@@ -968,16 +1197,15 @@ class PlanGenerator:
                         f"Rolling back: closing plan issue #{created_plan.number} "
                         f"due to error: {e}"
                     )
-                    self.github.update_issue(
+                    self.github.close_with_error(
                         created_plan.number,
-                        state="closed",
                         labels=[Labels.TYPE_PLAN, "rollback:failed"],
-                    )
-                    self.github.add_comment(
-                        created_plan.number,
-                        f"This plan was automatically closed due to an error during creation.\n\n"
-                        f"Error: {e}\n\n"
-                        f"The original idea #{idea_issue.number} may need to be re-promoted.",
+                        error_text=(
+                            f"This plan was automatically closed due to an error during creation.\n\n"
+                            f"Error: {e}\n\n"
+                            f"The original idea #{idea_issue.number} may need to be re-promoted."
+                        ),
+                        original_body=created_plan.body,
                     )
                 except Exception as rollback_err:
                     logger.error(f"Failed to rollback plan issue: {rollback_err}")
@@ -995,115 +1223,145 @@ class PlanGenerator:
 
             raise
 
-    def _generate_plan_content(self, idea_issue: GitHubIssue) -> str:
-        """Generate detailed planning content."""
-        prompt = f"""Based on the following idea, create a detailed planning document.
-
-# Idea: {idea_issue.title}
-
-{idea_issue.body}
-
----
-
-Create a comprehensive planning document with these sections:
-
-## 1. Product Requirements Document (PRD)
-
-### 1.1 Executive Summary
-Brief overview (2-3 sentences)
-
-### 1.2 Problem Statement
-Detailed problem description
-
-### 1.3 Goals and Success Metrics
-- Primary goal
-- Key metrics
-
-### 1.4 User Stories
-Write 3-5 user stories in format: "As a [user], I want [action] so that [benefit]"
-
-### 1.5 Functional Requirements
-List core features with priorities (Must Have / Should Have / Nice to Have)
-
-### 1.6 Non-Functional Requirements
-Performance, security, scalability considerations
-
-## 2. Architecture
+    def _mark_idea_as_planned(self, idea_issue: GitHubIssue, comment: str) -> None:
+        """
+        Label the idea as planned, then post its cross-reference comment.
 
-### 2.1 System Overview
-High-level architecture description
+        A label failure is raised so the caller rolls back; the comment is
+        only posted once the label has landed, so a rolled-back plan leaves
+        no comment on the idea. A comment failure is only logged.
+        """
+        self.github.mark_idea_as_planned(idea_issue.number)
+        logger.debug(f"Marked idea #{idea_issue.number} as planned")
 
-### 2.2 Technology Stack
-| Layer | Technology | Justification |
-|-------|------------|---------------|
+        try:
+            self.github.add_comment(idea_issue.number, comment)
+        except Exception as comment_err:
+            logger.warning(f"Failed to add cross-reference comment: {comment_err}")
 
-### 2.3 Component Design
-Key components and their responsibilities
+    def _generate_plan_content(self, idea_issue: GitHubIssue) -> str:
+        """Generate detailed planning content."""
+        prompt = self._plan_prompt(idea_issue)
+        response = self._chat_cached(idea_issue.number, prompt)
 
-### 2.4 Data Model
-Core entities and relationships
+        # Add metadata
+        body = f"""# Planning Document
 
-### 2.5 API Design
-Key endpoints (if applicable)
+**Source Idea:** #{idea_issue.number}
+**Generated:** {_utc_stamp()} UTC
 
-## 3. Task Breakdown
+---
 
-### Phase 1: Setup
-- [ ] Task 1 (Effort: S/M/L)
-- [ ] Task 2
+{response}
 
-### Phase 2: Core Development
-- [ ] Task 3
-- [ ] Task 4
+---
 
-### Phase 3: Integration & Testing
-- [ ] Task 5
-- [ ] Task 6
+**To promote this plan to development:** Add the `promote:to-dev` label.
+"""
 
-## 4. Acceptance Criteria
+        return body
 
-### Feature 1
-- [ ] Criterion 1
-- [ ] Criterion 2
+    @staticmethod
+    def _plan_prompt(idea_issue: GitHubIssue) -> str:
+        return f"""Based on the following idea, create a detailed planning document.
 
-### Feature 2
-- [ ] Criterion 1
+# Idea: {idea_issue.title}
 
-## 5. Risks and Mitigations
+{idea_issue.body}"""
 
-| Risk | Probability | Impact | Mitigation |
-|------|-------------|--------|------------|
+    @staticmethod
+    def _plan_digest(prompt: str) -> str:
+        return hashlib.sha256(f"{_PLAN_SYSTEM_MESSAGE}\0{prompt}".encode()).hexdigest()
 
-## 6. Timeline Estimate
+    def _cached_plan_response(self, idea_number: int, digest: str) -> str | None:
+        cached = get_cache().get(CacheKeys.LLM_PLAN.format(idea_number=idea_number))
+        if isinstance(cached, dict) and cached.get("digest") == digest:
+            return cached["response"]
+        return None
 
-- Phase 1: X days
-- Phase 2: X days
-- Phase 3: X days
-- **Total: X days**
+    def _store_plan_response(self, idea_number: int, digest: str, response: str) -> None:
+        cache = get_cache()
+        cache.set(
+            CacheKeys.LLM_PLAN.format(idea_number=idea_number),
+            {"digest": digest, "response": response},
+            ttl=cache.config.llm_response_ttl,
+        )
 
-Be specific and practical. Focus on MVP scope that can be built in 1-2 weeks."""
+    def _chat_cached(self, idea_number: int, prompt: str) -> str:
+        """Chat with the plan system message, reusing the last response for an unchanged idea."""
+        # A retry after a failed rollback sends the same prompt again; only the
+        # latest response per idea is kept so forget_cached_plan can drop it
+        digest = self._plan_digest(prompt)
+        response = self._cached_plan_response(idea_number, digest)
+        if response is not None:
+            logger.info(f"Reusing cached plan response for idea #{idea_number}")
+            return response
 
         response = self.claude.chat(
             user_message=prompt,
-            system_message="You are an expert product manager and software architect. Create detailed, actionable planning documents.",
+            system_message=_PLAN_SYSTEM_MESSAGE,
+            cache_system=True,
         )
+        if not self.dry_run:
+            self._store_plan_response(idea_number, digest, response)
+        return response
 
-        # Add metadata
-        body = f"""# Planning Document
+    def prefetch_plan_contents(self, ideas: list[GitHubIssue]) -> int:
+        """
+        Generate plan content for several ideas in one Message Batches job.
 
-**Source Idea:** #{idea_issue.number}
-**Generated:** {datetime.now().strftime("%Y-%m-%d %H:%M")} UTC
+        Responses are stored in the plan response cache, so generate_plan_from_idea
+        picks each one up as if it had been generated on its own, and a crash
+        later in the cycle does not pay for them again. Only simple-mode plans
+        in API mode are batched; ideas without a response, including all of
+        them when the batch is cancelled after batch_max_wait, are generated
+        normally afterwards.
 
----
+        Args:
+            ideas: Promoted ideas about to be planned.
 
-{response}
+        Returns:
+            Number of plan responses prefetched.
+        """
+        if not self.batch_plans or self.dry_run or len(ideas) < 2:
+            return 0
+        if self.enable_debate and self._all_providers_available():
+            return 0
+        if self.claude.mode != "api":
+            return 0
 
----
+        pending = []
+        for idea in ideas:
+            if self._find_existing_plan_for_idea(idea.number):
+                continue
+            prompt = self._plan_prompt(idea)
+            digest = self._plan_digest(prompt)
+            if self._cached_plan_response(idea.number, digest) is None:
+                pending.append((idea.number, prompt, digest))
+
+        # A single plan is faster as a normal request
+        if len(pending) < 2:
+            return 0
+
+        logger.info(f"Generating {len(pending)} plans in one message batch")
+        responses = self.claude.chat_batch(
+            [prompt for _, prompt, _ in pending],
+            system_message=_PLAN_SYSTEM_MESSAGE,
+            cache_system=True,
+            poll_interval=min(30.0, self.batch_max_wait / 10),
+            max_wait=self.batch_max_wait,
+        )
 
-**To promote this plan to development:** Add the `promote:to-dev` label.
-"""
+        prefetched = 0
+        for (idea_number, _, digest), response in zip(pending, responses, strict=True):
+            if response:
+                self._store_plan_response(idea_number, digest, response)
+                prefetched += 1
+        return prefetched
 
-        return body
+    def forget_cached_plan(self, idea_number: int) -> None:
+        """Drop the cached plan response for an idea so the next plan is generated afresh."""
+        get_cache().delete(CacheKeys.LLM_PLAN.format(idea_number=idea_number))
 
     def _generate_plan_with_debate(self, idea_issue: GitHubIssue) -> GitHubIssue | None:
         """
@@ -1113,6 +1371,11 @@ Be specific and practical. Focus on MVP scope that can be built in 1-2 weeks."""
         (Founder, VC, Accelerator, Founder Friend) and debate the plan
         through multiple rounds.
         """
+        # Skip the debate entirely; its result would be discarded
+        if self.dry_run:
+            logger.info(f"[DRY RUN] Would create plan from debate for idea #{idea_issue.number}")
+            return None
+
         created_plan: GitHubIssue | None = None
 
         try:
@@ -1134,12 +1397,6 @@ Be specific and practical. Focus on MVP scope that can be built in 1-2 weeks."""
                 f"reason: {debate_result.termination_reason}"
             )
 
-            if self.dry_run:
-                logger.info(
-                    f"[DRY RUN] Would create plan from debate for idea #{idea_issue.number}"
-                )
-                return None
-
             # Build plan content with debate result
             plan_content = self._format_debate_plan(idea_issue, debate_result)
 
@@ -1159,35 +1416,28 @@ Be specific and practical. Focus on MVP scope that can be built in 1-2 weeks."""
             # Update debate record with plan issue number
             debate_result.record.plan_issue_number = created_plan.number
 
-            # Add discussion record as comment
-            discussion_comment = debate_result.format_discussion_record()
-            self.github.add_comment(created_plan.number, discussion_comment)
+            # Add cross-reference and discussion record as one comment
+            self.github.add_comment(
+                created_plan.number,
+                f"This plan was generated from idea #{idea_issue.number}.\n\n"
+                f"**Generation method:** Multi-agent debate ({debate_result.total_rounds} rounds)\n"
+                f"**Termination reason:** {debate_result.termination_reason}\n\n"
+                f"**To promote this plan to development:** Add the `promote:to-dev` label.\n\n"
+                f"---\n\n"
+                f"{debate_result.format_discussion_record()}",
+            )
             logger.debug(f"Added discussion record to plan #{created_plan.number}")
 
-            # Update idea issue status
-            self.github.mark_idea_as_planned(idea_issue.number)
-            logger.debug(f"Marked idea #{idea_issue.number} as planned")
-
-            # Add cross-reference comments
-            try:
-                self.github.add_comment(
-                    idea_issue.number,
-                    f"Planning document created: #{created_plan.number}\n\n"
-                    f"This idea has been promoted to the planning phase through "
-                    f"a {debate_result.total_rounds}-round multi-agent debate.",
-                )
-
-                self.github.add_comment(
-                    created_plan.number,
-                    f"This plan was generated from idea #{idea_issue.number}.\n\n"
-                    f"**Generation method:** Multi-agent debate ({debate_result.total_rounds} rounds)\n"
-                    f"**Termination reason:** {debate_result.termination_reason}\n\n"
-                    f"**To promote this plan to development:** Add the `promote:to-dev` label.",
-                )
-            except Exception as comment_err:
-                logger.warning(f"Failed to add cross-reference comments: {comment_err}")
+            # Update idea issue status alongside its cross-reference comment
+            self._mark_idea_as_planned(
+                idea_issue,
+                f"Planning document created: #{created_plan.number}\n\n"
+                f"This idea has been promoted to the planning phase through "
+                f"a {debate_result.total_rounds}-round multi-agent debate.",
+            )
 
             logger.info(f"Created plan issue #{created_plan.number} via debate")
+            self._record_plan(idea_issue.number, created_plan)
             return created_plan
 
         except Exception as e:
@@ -1197,16 +1447,15 @@ Be specific and practical. Focus on MVP scope that can be built in 1-2 weeks."""
             if created_plan is not None:
                 try:
                     logger.warning(f"Rolling back: closing plan issue #{created_plan.number}")
-                    self.github.update_issue(
+                    self.github.close_with_error(
                         created_plan.number,
-                        state="closed",
                         labels=[Labels.TYPE_PLAN, "rollback:failed"],
-                    )
-                    self.github.add_comment(
-                        created_plan.number,
-                        f"This plan was automatically closed due to an error during debate.\n\n"
-                        f"Error: {e}\n\n"
-                        f"The original idea #{idea_issue.number} may need to be re-promoted.",
+                        error_text=(
+                            f"This plan was automatically closed due to an error during debate.\n\n"
+                            f"Error: {e}\n\n"
+                            f"The original idea #{idea_issue.number} may need to be re-promoted."
+                        ),
+                        original_body=created_plan.body,
                     )
                 except Exception as rollback_err:
                     logger.error(f"Failed to rollback plan issue: {rollback_err}")
@@ -1229,7 +1478,7 @@ Be specific and practical. Focus on MVP scope that can be built in 1-2 weeks."""
         body = f"""# Planning Document
 
 **Source Idea:** #{idea_issue.number}
-**Generated:** {datetime.now().strftime("%Y-%m-%d %H:%M")} UTC
+**Generated:** {_utc_stamp()} UTC
 **Generation Method:** Multi-Agent Debate ({debate_result.total_rounds} rounds)
 
 ---
@@ -1242,6 +1491,54 @@ Be specific and practical. Focus on MVP scope that can be built in 1-2 weeks."""
 """
         return body
 
+    def refresh_planned_idea_index(self, plans: list[GitHubIssue] | None = None) -> None:
+        """
+        Index open plan issues by the idea numbers they reference.
+
+        Fetches open plans once so that checks for many promoted ideas in a
+        polling cycle do not each query GitHub. Call clear_planned_idea_index()
+        when the cycle ends; without an index every check queries GitHub.
+
+        Args:
+            plans: All open plans, if the caller already fetched them.
+        """
+        if plans is None:
+            try:
+                plans = self._search_open_plans()
+            except Exception as e:
+                logger.warning(f"Failed to index existing plans, checking per idea: {e}")
+                self._planned_ideas = None
+                return
+
+        planned: dict[int, list[GitHubIssue]] = {}
+        for plan in plans:
+            for idea_number in {int(n) for n in _SOURCE_IDEA_RE.findall(plan.body or "")}:
+                planned.setdefault(idea_number, []).append(plan)
+        self._planned_ideas = planned
+
+    def unplanned_ideas(self, ideas: list[GitHubIssue]) -> list[GitHubIssue]:
+        """
+        Drop ideas that the per-cycle index shows already have an open plan.
+
+        Without an index, ideas are returned unchanged and each is still
+        checked when its plan is generated.
+        """
+        if self._planned_ideas is None:
+            return ideas
+        return [idea for idea in ideas if idea.number not in self._planned_ideas]
+
+    def clear_planned_idea_index(self) -> None:
+        """Drop the per-cycle plan index."""
+        self._planned_ideas = None
+
+    def _search_open_plans(self) -> list[GitHubIssue]:
+        # Open plans only - rejected plans are closed
+        return self.github.search_issues(
+            labels=[Labels.TYPE_PLAN],
+            state="open",
+            per_page=100,
+        )
+
     def _find_existing_plan_for_idea(self, idea_number: int) -> list[GitHubIssue]:
         """
         Find existing OPEN plan issues that reference a specific idea.
@@ -1255,29 +1552,24 @@ Be specific and practical. Focus on MVP scope that can be built in 1-2 weeks."""
         Returns:
             List of open plan issues that reference this idea.
         """
-        try:
-            # Search for OPEN plan issues only (closed/rejected plans are ignored)
-            plans = self.github.search_issues(
-                labels=[Labels.TYPE_PLAN],
-                state="open",  # Only open plans - rejected plans are closed
-            )
+        if self._planned_ideas is not None:
+            return self._planned_ideas.get(idea_number, [])
 
-            # Filter plans that reference this idea in their body
-            matching_plans = []
-            source_patterns = [
-                f"Source Idea: #{idea_number}",
-                f"Source Idea:** #{idea_number}",
-                f"idea #{idea_number}",
+        try:
+            return [
+                plan
+                for plan in self._search_open_plans()
+                if str(idea_number) in _SOURCE_IDEA_RE.findall(plan.body or "")
             ]
-            for plan in plans:
-                if any(pattern in plan.body for pattern in source_patterns):
-                    matching_plans.append(plan)
-
-            return matching_plans
         except Exception as e:
             logger.warning(f"Failed to search for existing plans: {e}")
             return []
 
+    def _record_plan(self, idea_number: int, plan: GitHubIssue) -> None:
+        """Add a newly created plan to the per-cycle index, if one is active."""
+        if self._planned_ideas is not None:
+            self._planned_ideas.setdefault(idea_number, []).append(plan)
+
 
 class DevScaffolder:
     """
@@ -1298,6 +1590,9 @@ class DevScaffolder:
         self.dry_run = dry_run
         self._git: GitHelper | None = None
 
+        # Project directory name by plan number, read from projects/ on first use
+        self._plan_projects: dict[int, str] | None = None
+
     @property
     def git(self) -> GitHelper:
         if self._git is None:
@@ -1345,6 +1640,8 @@ class DevScaffolder:
             # Create project structure
             project_dir = get_project_dir(project_id, self.base_path)
             self._create_project_structure(project_dir, plan_issue, project_id)
+            if self._plan_projects is not None:
+                self._plan_projects[plan_issue.number] = project_dir.name
 
             # Commit changes
             self.git.add(all=True)
@@ -1397,8 +1694,9 @@ class DevScaffolder:
             ensure_dir(d)
 
         # Extract idea number from plan body
-        idea_ref = re.search(r"Source Idea.*?#(\d+)", plan_issue.body)
+        idea_ref = _SCAFFOLD_SOURCE_IDEA_RE.search(plan_issue.body)
         idea_number = idea_ref.group(1) if idea_ref else "unknown"
+        created_at = datetime.now()
 
         # Save plan document
         write_markdown(
@@ -1409,7 +1707,7 @@ class DevScaffolder:
                 "source_issue": plan_issue.number,
                 "source_idea": idea_number,
                 "project_id": project_id,
-                "created_at": datetime.now().isoformat(),
+                "created_at": created_at.isoformat(),
             },
         )
 
@@ -1443,7 +1741,7 @@ class DevScaffolder:
 
 ## Development
 
-Development was initiated on {datetime.now().strftime("%Y-%m-%d")}.
+Development was initiated on {created_at.strftime("%Y-%m-%d")}.
 
 See `02_planning/PLAN.md` for detailed requirements and tasks.
 """
@@ -1471,33 +1769,53 @@ See `02_planning/PLAN.md` for detailed requirements and tasks.
             Project ID if found, None otherwise.
         """
         try:
-            projects_dir = self.base_path / "projects"
-            if not projects_dir.exists():
-                return None
-
-            # Search through project directories
-            for project_path in projects_dir.iterdir():
-                if not project_path.is_dir():
-                    continue
-
-                # Check PLAN.md or README.md for plan reference
-                plan_md = project_path / "02_planning" / "PLAN.md"
-                readme_md = project_path / "README.md"
-
-                for check_file in [plan_md, readme_md]:
-                    if check_file.exists():
-                        content = check_file.read_text()
-                        if (
-                            f"#{plan_number}" in content
-                            or f"source_issue: {plan_number}" in content
-                        ):
-                            return project_path.name
+            if self._plan_projects is None:
+                self._plan_projects = self._index_projects()
 
+            project_name = self._plan_projects.get(plan_number)
+            if project_name and (self.base_path / "projects" / project_name).is_dir():
+                return project_name
             return None
         except Exception as e:
             logger.warning(f"Failed to search for existing projects: {e}")
             return None
 
+    def _index_projects(self) -> dict[int, str]:
+        """Map plan numbers to the project directories scaffolded from them."""
+        index: dict[int, str] = {}
+        projects_dir = self.base_path / "projects"
+        if not projects_dir.exists():
+            return index
+
+        # DirEntry carries the file type from the directory listing, so no stat per entry
+        with os.scandir(projects_dir) as entries:
+            project_paths = sorted(Path(entry.path) for entry in entries if entry.is_dir())
+
+        for project_path in project_paths:
+            # PLAN.md records the plan in its frontmatter, README.md in its Source list
+            for check_file in (
+                project_path / "02_planning" / "PLAN.md",
+                project_path / "README.md",
+            ):
+                plan_number = self._read_plan_reference(check_file)
+                if plan_number is not None:
+                    index.setdefault(plan_number, project_path.name)
+                    break
+        return index
+
+    @staticmethod
+    def _read_plan_reference(check_file: Path) -> int | None:
+        """Return the plan number a project file refers to, reading only up to it."""
+        if not check_file.exists():
+            return None
+        # The reference sits in the header, so stop at the first matching line
+        with check_file.open(encoding="utf-8") as f:
+            for line in f:
+                match = _PROJECT_PLAN_RE.search(line)
+                if match:
+                    return int(match.group(1) or match.group(2))
+        return None
+
 
 class BacklogOrchestrator:
     """
@@ -1556,9 +1874,12 @@ class BacklogOrchestrator:
     @property
     def plan_generator(self) -> PlanGenerator:
         if self._plan_generator is None:
+            lock_timeout = self.config.get("orchestrator", "lock_timeout_seconds", default=300)
             self._plan_generator = PlanGenerator(
                 github=self.github,
                 dry_run=self.dry_run,
+                batch_plans=bool(self.config.get("budget", "batch_plans", default=False)),
+                batch_max_wait=lock_timeout / 3,
             )
         return self._plan_generator
 
@@ -1576,27 +1897,50 @@ class BacklogOrchestrator:
         """
         Acquire execution lock to prevent concurrent runs.
 
-        Includes stale lock detection:
+        The lock contents are written to a private temp file first and then
+        published with os.link, which fails atomically if the lock exists. No
+        other process can see a half-written lock and take it for malformed,
+        so stale lock detection only runs on a complete, existing lock:
         - Checks if lock holder process is still alive
         - Checks if lock has exceeded timeout
         """
-        import fcntl
-        import os
-
         ensure_dir(self._lock_file.parent)
 
-        # Check for stale lock before attempting to acquire
-        self._cleanup_stale_lock()
+        try:
+            fd, tmp_name = tempfile.mkstemp(
+                prefix=f"{self._lock_file.name}.", dir=self._lock_file.parent
+            )
+        except OSError as e:
+            logger.warning(f"Failed to create lock file: {e}")
+            return False
 
+        lock_fd = os.fdopen(fd, "w")
         try:
-            self._lock_fd = open(self._lock_file, "w")
-            fcntl.flock(self._lock_fd.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
-            self._lock_fd.write(f"{os.getpid()}\n{datetime.now().isoformat()}")
-            self._lock_fd.flush()
-            return True
-        except OSError:
-            logger.warning("Another orchestrator instance is running")
+            lock_fd.write(f"{os.getpid()}\n{datetime.now().isoformat()}")
+            lock_fd.flush()
+            if fcntl is not None:
+                fcntl.flock(lock_fd.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+            for attempt in range(2):
+                try:
+                    os.link(tmp_name, self._lock_file)
+                except FileExistsError:
+                    if attempt == 0:
+                        # Remove the lock if its holder is gone, then retry once
+                        self._cleanup_stale_lock()
+                    continue
+                self._lock_fd = lock_fd
+                return True
+        except OSError as e:
+            logger.warning(f"Failed to create lock file: {e}")
+            lock_fd.close()
             return False
+        finally:
+            os.unlink(tmp_name)
+
+        lock_fd.close()
+        logger.warning("Another orchestrator instance is running")
+        return False
 
     def _cleanup_stale_lock(self) -> None:
         """Remove stale lock if process is dead or timeout exceeded."""
@@ -1645,8 +1989,6 @@ class BacklogOrchestrator:
 
     def _is_process_alive(self, pid: int) -> bool:
         """Check if a process with the given PID is still running."""
-        import os
-
         try:
             # Sending signal 0 checks if process exists without actually signaling
             os.kill(pid, 0)
@@ -1660,11 +2002,10 @@ class BacklogOrchestrator:
 
     def release_lock(self) -> None:
         """Release execution lock."""
-        import fcntl
-
         if hasattr(self, "_lock_fd") and self._lock_fd:
             try:
-                fcntl.flock(self._lock_fd.fileno(), fcntl.LOCK_UN)
+                if fcntl is not None:
+                    fcntl.flock(self._lock_fd.fileno(), fcntl.LOCK_UN)
                 self._lock_fd.close()
                 self._lock_file.unlink(missing_ok=True)
             except Exception:
@@ -1742,15 +2083,25 @@ class BacklogOrchestrator:
                     logger.error(f"Trend-based idea generation failed: {e}")
                     results["errors"].append(f"Trend ideas: {e}")
 
+            # Rejected plans, the plan index and plan promotions are all read
+            # from one fetch of open plans
+            open_plans = self._fetch_open_plans()
+
             # 3. Process rejected plans FIRST (before promotions)
             # This ensures rejected plans reset their ideas before promotion processing
             try:
-                rejected_plans = self.github.find_rejected_plans()
+                if open_plans is not None:
+                    rejected_plans = [p for p in open_plans if p.has_label(Labels.REJECT_PLAN)]
+                else:
+                    rejected_plans = self.github.find_rejected_plans()
                 for plan in rejected_plans[:max_promotions]:
                     try:
                         result = self._process_rejected_plan(plan)
                         if result:
                             results["plans_rejected"] += 1
+                            if open_plans is not None:
+                                # Now closed
+                                open_plans = [p for p in open_plans if p.number != plan.number]
                     except Exception as e:
                         logger.error(f"Rejected plan processing failed for #{plan.number}: {e}")
                         results["errors"].append(f"Reject plan #{plan.number}: {e}")
@@ -1761,6 +2112,17 @@ class BacklogOrchestrator:
             # 4. Process idea promotions (including newly reset ideas from rejected plans)
             try:
                 promoted_ideas = self.github.find_ideas_to_promote()
+                if promoted_ideas:
+                    # One plan search for the whole batch instead of one per idea
+                    self.plan_generator.refresh_planned_idea_index(open_plans)
+                    # Already-planned ideas would only be skipped, so don't let them
+                    # take promotion slots or batch requests
+                    promoted_ideas = self.plan_generator.unplanned_ideas(promoted_ideas)
+                    self.plan_generator.invalidate_availability_cache()
+                    try:
+                        self.plan_generator.prefetch_plan_contents(promoted_ideas[:max_promotions])
+                    except Exception as e:
+                        logger.warning(f"Batched plan generation failed, planning one by one: {e}")
                 for idea in promoted_ideas[:max_promotions]:
                     try:
                         plan = self.plan_generator.generate_plan_from_idea(idea)
@@ -1772,10 +2134,15 @@ class BacklogOrchestrator:
             except Exception as e:
                 logger.error(f"Finding promoted ideas failed: {e}")
                 results["errors"].append(f"Find promoted ideas: {e}")
+            finally:
+                self.plan_generator.clear_planned_idea_index()
 
             # 4. Process plan promotions
             try:
-                promoted_plans = self.github.find_plans_to_promote()
+                if open_plans is not None:
+                    promoted_plans = [p for p in open_plans if p.has_label(Labels.PROMOTE_TO_DEV)]
+                else:
+                    promoted_plans = self.github.find_plans_to_promote()
                 for plan in promoted_plans[:max_promotions]:
                     try:
                         project_id = self.dev_scaffolder.scaffold_from_plan(plan)
@@ -1810,6 +2177,17 @@ class BacklogOrchestrator:
         finally:
             self.release_lock()
 
+    def _fetch_open_plans(self) -> list[GitHubIssue] | None:
+        """All open plans, or None if they could not be fetched in one page."""
+        try:
+            plans = self.github.find_open_plans(limit=_OPEN_PLANS_LIMIT)
+        except Exception as e:
+            logger.warning(f"Failed to fetch open plans, searching per step: {e}")
+            return None
+        if len(plans) >= _OPEN_PLANS_LIMIT:
+            return None
+        return plans
+
     def setup_labels(self) -> None:
         """Ensure all required labels exist in the repository."""
         logger.info("Setting up labels...")
@@ -1870,15 +2248,14 @@ class BacklogOrchestrator:
                 "closing plan without resetting idea"
             )
             # Still close the plan but can't reset the idea
-            self.github.update_issue(
+            self.github.close_with_error(
                 plan_issue.number,
-                state="closed",
                 labels=[Labels.TYPE_PLAN, "rejected", "orphan"],
-            )
-            self.github.add_comment(
-                plan_issue.number,
-                "This plan was rejected but the source idea could not be found.\n\n"
-                "The plan has been closed. Please manually re-promote the original idea if needed.",
+                error_text=(
+                    "This plan was rejected but the source idea could not be found.\n\n"
+                    "The plan has been closed. Please manually re-promote the original idea if needed."
+                ),
+                original_body=plan_issue.body,
             )
             return True
 
@@ -1887,6 +2264,8 @@ class BacklogOrchestrator:
             plan_issue_number=plan_issue.number,
             idea_issue_number=idea_number,
         )
+        # The rejected plan must not be served again from the response cache
+        self.plan_generator.forget_cached_plan(idea_number)
 
         # Add comments explaining what happened
         self.github.add_comment(
@@ -1918,18 +2297,9 @@ class BacklogOrchestrator:
         Returns:
             Idea issue number or None if not found
         """
-        import re
-
         # Look for patterns like "Source Idea: #123" or "idea #123"
-        patterns = [
-            r"Source Idea:\s*#(\d+)",
-            r"\*\*Source Idea:\*\*\s*#(\d+)",
-            r"from idea #(\d+)",
-            r"idea #(\d+)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, plan_issue.body, re.IGNORECASE)
+        for pattern in _REJECTED_PLAN_IDEA_RES:
+            match = pattern.search(plan_issue.body)
             if match:
                 return int(match.group(1))
 
@@ -34,6 +34,9 @@ class CacheKeys:
     DEBATE_SESSION = "debate:session:{session_id}"
     DEBATE_ACTIVE = "debate:active"
 
+    # LLM responses
+    LLM_PLAN = "llm:plan:{idea_number}"
+
     # Budget
     BUDGET_TODAY = "budget:today"
     BUDGET_MONTH = "budget:month"
@@ -46,6 +49,13 @@ class CacheKeys:
     SYSTEM_STATUS = "system:status"
     SYSTEM_METRICS = "system:metrics"
 
+    # API responses
+    API_ADAPTERS = "api:adapters"
+    API_SIGNALS_TIMELINE = "api:signals:timeline:{period}"
+    API_LIST_TOTAL = "api:total:{name}"
+    API_TABLE_VERSION = "api:version:{name}"
+    API_PIPELINE_LIVE = "api:pipeline:live"
+
     # Pub/Sub channels
     CHANNEL_SIGNALS = "channel:signals"
     CHANNEL_DEBATES = "channel:debates"
@@ -58,8 +68,16 @@ class CacheConfig:
     default_ttl: int = 300  # 5 minutes
     signals_ttl: int = 900  # 15 minutes
     trends_ttl: int = 3600  # 1 hour
+    llm_response_ttl: int = 86400  # 1 day for responses to identical prompts
     budget_ttl: int = 60  # 1 minute
     agent_ttl: int = 30  # 30 seconds
+    status_ttl: int = 30  # 30 seconds
+    pipeline_live_ttl: int = 5  # 5 seconds, shared by all API workers
+    adapters_ttl: int = 300  # 5 minutes
+    timeline_ttl: int = 300  # 5 minutes
+    count_ttl: int = 60  # 1 minute for list totals
+    version_ttl: int = 5  # 5 seconds for ETag table versions
+    local_response_ttl: int = 2  # per-process copy of hot polled responses
 
 
 class InMemoryCache:
@@ -118,6 +136,11 @@ class InMemoryCache:
             self._pubsub_handlers[channel] = []
         self._pubsub_handlers[channel].append(handler)
 
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._cache.clear()
+
     def cleanup_expired(self):
         """Remove expired entries."""
         with self._lock:
@@ -399,13 +422,13 @@ class RedisCache:
     def flush(self):
         """Clear all cache (use with caution!)."""
         if self._use_fallback:
-            self._fallback._cache.clear()
+            self._fallback.clear()
             return
 
         try:
             self._redis.flushdb()
         except Exception:
-            self._fallback._cache.clear()
+            self._fallback.clear()
 
 
 # Global cache instance
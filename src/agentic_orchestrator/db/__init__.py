@@ -21,6 +21,7 @@ from .models import (
     APIUsage,
     SystemLog,
     AgentState,
+    PipelineStats,
 )
 from .repositories import (
     SignalRepository,
@@ -31,6 +32,7 @@ from .repositories import (
     ProjectRepository,
     APIUsageRepository,
     SystemLogRepository,
+    PipelineStatsRepository,
 )
 
 __all__ = [
@@ -52,6 +54,7 @@ __all__ = [
     "APIUsage",
     "SystemLog",
     "AgentState",
+    "PipelineStats",
     # Repositories
     "SignalRepository",
     "TrendRepository",
@@ -61,4 +64,5 @@ __all__ = [
     "ProjectRepository",
     "APIUsageRepository",
     "SystemLogRepository",
+    "PipelineStatsRepository",
 ]
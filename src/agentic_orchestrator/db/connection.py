@@ -41,12 +41,12 @@ class Database:
     def _init_engine(self):
         """Initialize the database engine based on URL type."""
         if self.url.startswith("postgresql"):
-            # PostgreSQL with connection pooling
+            # PostgreSQL with connection pooling, sized for the API threadpool
             self.engine = create_engine(
                 self.url,
                 poolclass=QueuePool,
-                pool_size=5,
-                max_overflow=10,
+                pool_size=int(os.getenv("DB_POOL_SIZE", "10")),
+                max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "20")),
                 pool_timeout=30,
                 pool_recycle=1800,
                 echo=os.getenv("DB_ECHO", "false").lower() == "true"
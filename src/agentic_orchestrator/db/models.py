@@ -22,9 +22,10 @@ from sqlalchemy import (
     Index,
     JSON,
     Enum as SQLEnum,
+    text,
 )
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 import enum
 
 
@@ -135,6 +136,19 @@ class Signal(Base):
     __table_args__ = (
         Index("idx_signals_source_category", "source", "category"),
         Index("idx_signals_collected_score", "collected_at", "score"),
+        # Newest-first feeds; INCLUDE lets Postgres answer them from the index alone
+        Index(
+            "idx_signals_collected_id",
+            "collected_at",
+            "id",
+            postgresql_include=["source", "score", "title"],
+        ),
+        # Full-text index for keyword lookups (Postgres only)
+        Index(
+            "idx_signals_title_fts",
+            text("to_tsvector('simple', title)"),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
     )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -178,6 +192,13 @@ class Trend(Base):
     # Relationships
     ideas = relationship("Idea", back_populates="source_trend")
 
+    # Composite indexes match the keyset orderings in TrendRepository
+    __table_args__ = (
+        Index("idx_trends_latest", "analyzed_at", "score", "id"),
+        Index("idx_trends_period_latest", "period", "analyzed_at", "score", "id"),
+        Index("idx_trends_category_score", "category", "score", "id"),
+    )
+
     def to_dict(self) -> Dict[str, Any]:
         analysis = self.analysis_data or {}
         return {
@@ -230,6 +251,13 @@ class Idea(Base):
     debate_sessions = relationship("DebateSession", back_populates="idea", foreign_keys="DebateSession.idea_id")
     plans = relationship("Plan", back_populates="idea")
 
+    __table_args__ = (
+        Index("idx_ideas_created_id", "created_at", "id"),
+        Index("idx_ideas_status_created", "status", "created_at", "id"),
+        # max(updated_at) versions the /ideas ETag
+        Index("idx_ideas_updated", "updated_at"),
+    )
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "id": self.id,
@@ -268,6 +296,8 @@ class DebateSession(Base):
     ideas_generated = Column(JSON)  # List of ideas generated during debate
     total_tokens = Column(Integer, default=0)
     total_cost = Column(Float, default=0.0)
+    # Kept in step by DebateRepository.add_message, so listings never count messages
+    message_count = Column(Integer, nullable=False, default=0, server_default="0")
     extra_metadata = Column("metadata", JSON)
     started_at = Column(DateTime, default=datetime.utcnow)
     completed_at = Column(DateTime)
@@ -277,7 +307,17 @@ class DebateSession(Base):
     idea = relationship("Idea", back_populates="debate_sessions", foreign_keys=[idea_id])
     messages = relationship("DebateMessage", back_populates="session", order_by="DebateMessage.created_at")
 
-    def to_dict(self) -> Dict[str, Any]:
+    __table_args__ = (
+        Index("idx_debates_started_id", "started_at", "id"),
+        Index("idx_debates_status_started", "status", "started_at", "id"),
+        Index("idx_debates_phase_started", "phase", "started_at", "id"),
+        # max(completed_at) versions the /debates ETag
+        Index("idx_debates_completed", "completed_at"),
+    )
+
+    def to_dict(self, message_count: Optional[int] = None) -> Dict[str, Any]:
+        if message_count is None:
+            message_count = self.message_count or 0
         return {
             "id": self.id,
             "idea_id": self.idea_id,
@@ -296,7 +336,7 @@ class DebateSession(Base):
             "total_cost": self.total_cost,
             "started_at": self.started_at.isoformat() if self.started_at else None,
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
-            "message_count": len(self.messages) if self.messages else 0,
+            "message_count": message_count,
         }
 
 
@@ -348,12 +388,13 @@ class Plan(Base):
     version = Column(Integer, default=1)
     status = Column(String(20), default="draft", index=True)
 
-    # Document sections
-    prd_content = Column(Text)
-    architecture_content = Column(Text)
-    user_research_content = Column(Text)
-    business_model_content = Column(Text)
-    project_plan_content = Column(Text)
+    # Document sections; only the plan detail reads them, so they load
+    # together on first access or with undefer_group("documents")
+    prd_content = deferred(Column(Text), group="documents")
+    architecture_content = deferred(Column(Text), group="documents")
+    user_research_content = deferred(Column(Text), group="documents")
+    business_model_content = deferred(Column(Text), group="documents")
+    project_plan_content = deferred(Column(Text), group="documents")
     final_plan = Column(Text)
     final_plan_ko = Column(Text)  # Korean translation
 
@@ -369,6 +410,13 @@ class Plan(Base):
     idea = relationship("Idea", back_populates="plans")
     projects = relationship("Project", back_populates="plan")
 
+    __table_args__ = (
+        Index("idx_plans_created_id", "created_at", "id"),
+        Index("idx_plans_status_created", "status", "created_at", "id"),
+        # max(updated_at) versions the /plans ETag
+        Index("idx_plans_updated", "updated_at"),
+    )
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "id": self.id,
@@ -404,6 +452,11 @@ class Project(Base):
     # Relationships
     plan = relationship("Plan", back_populates="projects")
 
+    __table_args__ = (
+        Index("idx_projects_created_id", "created_at", "id"),
+        Index("idx_projects_status_created", "status", "created_at", "id"),
+    )
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "id": self.id,
@@ -508,3 +561,17 @@ class AgentState(Base):
             "total_messages": self.total_messages,
             "total_tokens": self.total_tokens,
         }
+
+
+class PipelineStats(Base):
+    """Periodically refreshed rollup of pipeline stage counts.
+
+    A single ``current`` row is rewritten by the API's background refresher,
+    so polling ``/pipeline/live`` reads one row instead of counting tables.
+    """
+
+    __tablename__ = "pipeline_stats"
+
+    id = Column(String(20), primary_key=True)
+    counts = Column(JSON, nullable=False)  # {stage: {"total": n, "recent": n}}
+    computed_at = Column(DateTime, nullable=False)
@@ -0,0 +1,85 @@
+"""
+Keyset (seek) pagination helpers for Agentic Orchestrator.
+
+List queries are ordered descending on an indexed column plus the primary
+key. A cursor is an opaque base64(JSON) token holding the ordering values of
+the last row of a page, so the next page is fetched with
+``WHERE (col, id) < (:col, :id)`` instead of an ever-growing OFFSET.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+from sqlalchemy import desc, tuple_
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode ordering values of the last row into an opaque cursor."""
+    payload = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: Sequence[Any]) -> List[Any]:
+    """Decode a cursor into values typed for the given ordering columns."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError) as e:
+        raise InvalidCursorError(f"Malformed cursor: {cursor}") from e
+
+    if not isinstance(values, list) or len(values) != len(columns):
+        raise InvalidCursorError(f"Cursor does not match ordering: {cursor}")
+
+    return [_decode_value(column, value) for column, value in zip(columns, values, strict=True)]
+
+
+def _decode_value(column: Any, value: Any) -> Any:
+    """Coerce one cursor value to its column's Python type.
+
+    NULL is rejected: ``(col, id) < (NULL, ...)`` is never true, so such a
+    cursor would silently end pagination instead of seeking.
+    """
+    if value is None or isinstance(value, (bool, dict, list)):
+        raise InvalidCursorError(f"Invalid cursor value: {value!r}")
+
+    python_type = column.type.python_type
+    try:
+        if python_type is datetime:
+            return datetime.fromisoformat(value)
+        if python_type is str and not isinstance(value, str):
+            raise TypeError(f"expected a string, got {type(value).__name__}")
+        return python_type(value)
+    except (TypeError, ValueError) as e:
+        raise InvalidCursorError(f"Invalid cursor value for {column.key}: {value!r}") from e
+
+
+def apply_keyset(query, columns: Sequence[Any], after_cursor: Optional[str] = None):
+    """Order a query descending on ``columns`` and seek past ``after_cursor``."""
+    if after_cursor:
+        values = decode_cursor(after_cursor, columns)
+        query = query.filter(tuple_(*columns) < tuple_(*values))
+    return query.order_by(*[desc(c) for c in columns])
+
+
+def split_page(
+    rows: Sequence[Any],
+    columns: Sequence[Any],
+    limit: int,
+) -> Tuple[List[Any], Optional[str]]:
+    """Split a ``limit + 1`` fetch into the page and the cursor for the next one.
+
+    The extra row only signals that more data exists; the cursor is None on
+    the last page, so callers can derive ``has_more`` without a COUNT(*).
+    """
+    page = list(rows[:limit])
+    if len(rows) <= limit or not page:
+        return page, None
+    last = page[-1]
+    return page, encode_cursor([getattr(last, c.key) for c in columns])
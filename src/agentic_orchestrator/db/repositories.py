@@ -5,10 +5,13 @@ Provides data access layer for all models with common CRUD operations
 and specialized queries.
 """
 
+import os
 from datetime import datetime, timedelta, date
-from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import func, desc, and_, or_
+from typing import List, Optional, Dict, Any, Tuple
+from sqlalchemy.orm import Session, raiseload, selectinload, undefer_group
+from sqlalchemy import func, desc, and_, or_, text, select, update, lambda_stmt, case, true, literal
+
+from .pagination import apply_keyset
 
 from .models import (
     Signal,
@@ -21,19 +24,78 @@ from .models import (
     APIUsage,
     SystemLog,
     AgentState,
+    PipelineStats,
 )
 
 
 class BaseRepository:
     """Base repository with common operations."""
 
+    # With DB_RAISELOAD=true (dev/tests), list queries refuse lazy relationship
+    # loads so a serializer can't silently reintroduce an N+1 query
+    strict_loading: bool = os.getenv("DB_RAISELOAD", "false").lower() == "true"
+
+    # Postgres tables estimated at this many rows or more report the planner's
+    # pg_class.reltuples as their unfiltered total instead of a COUNT(*) scan
+    count_estimate_threshold: int = int(os.getenv("COUNT_ESTIMATE_THRESHOLD", "100000"))
+
     def __init__(self, session: Session):
         self.session = session
 
+    def _row_estimates(self, tables) -> Dict[str, int]:
+        """Planner row estimates for tables large enough to report them.
+
+        Only Postgres keeps them; tables below the threshold, or never
+        analyzed (reltuples is -1), are left out so callers count exactly.
+        """
+        if self.session.get_bind().dialect.name != "postgresql":
+            return {}
+        rows = self.session.execute(
+            text(
+                "SELECT relname, reltuples::bigint FROM pg_class "
+                "WHERE relname = ANY(:names) AND relkind IN ('r', 'p') "
+                "AND pg_table_is_visible(oid)"
+            ),
+            {"names": list(tables)},
+        )
+        return {name: n for name, n in rows if n >= self.count_estimate_threshold}
+
+    def count_estimate(self, model) -> int:
+        """Count a table's rows, using the planner estimate for large tables."""
+        estimate = self._row_estimates([model.__tablename__]).get(model.__tablename__)
+        if estimate is not None:
+            return estimate
+        return self.session.query(func.count()).select_from(model).scalar() or 0
+
+    def _list_query(self, model):
+        """Start a list query, with lazy relationship loads disabled in strict mode."""
+        query = self.session.query(model)
+        if self.strict_loading:
+            query = query.options(raiseload("*"))
+        return query
+
+    def _fetch_page(self, query, offset: int, limit: int) -> list:
+        """Run a list query for one page of rows."""
+        return query.offset(offset).limit(limit).all()
+
+    def _fetch_first_page(self, query, limit: int) -> Tuple[list, int]:
+        """Run a list query for its first page, returning ``(rows, total)``.
+
+        The total comes from ``count(*) OVER ()`` in the same statement
+        instead of a second COUNT round-trip. It counts every row the query
+        matches, which is the list total only because there is no cursor or
+        offset to skip past.
+        """
+        rows = query.add_columns(func.count().over()).limit(limit).all()
+        return [row[0] for row in rows], (rows[0][1] if rows else 0)
+
 
 class SignalRepository(BaseRepository):
     """Repository for Signal operations."""
 
+    # Keyset ordering for paginated listings (highest score first)
+    RECENT_ORDER = (Signal.score, Signal.id)
+
     def create(self, signal_data: Dict[str, Any]) -> Signal:
         """Create a new signal."""
         signal = Signal(**signal_data)
@@ -50,7 +112,7 @@ class SignalRepository(BaseRepository):
 
     def get_by_id(self, signal_id: str) -> Optional[Signal]:
         """Get signal by ID."""
-        return self.session.query(Signal).filter(Signal.id == signal_id).first()
+        return self.session.get(Signal, signal_id)
 
     def _build_recent_query(
         self,
@@ -62,7 +124,7 @@ class SignalRepository(BaseRepository):
         """Build base query for recent signals with filters."""
         since = datetime.utcnow() - timedelta(hours=hours)
 
-        query = self.session.query(Signal).filter(
+        query = self._list_query(Signal).filter(
             Signal.collected_at >= since,
             Signal.score >= min_score
         )
@@ -81,11 +143,26 @@ class SignalRepository(BaseRepository):
         offset: int = 0,
         source: Optional[str] = None,
         category: Optional[str] = None,
-        min_score: float = 0.0
+        min_score: float = 0.0,
+        after_cursor: Optional[str] = None,
     ) -> List[Signal]:
         """Get recent signals with optional filters and SQL-level pagination."""
         query = self._build_recent_query(hours, source, category, min_score)
-        return query.order_by(desc(Signal.score)).offset(offset).limit(limit).all()
+        query = apply_keyset(query, self.RECENT_ORDER, after_cursor)
+        return self._fetch_page(query, offset, limit)
+
+    def get_recent_with_total(
+        self,
+        hours: int = 24,
+        limit: int = 100,
+        source: Optional[str] = None,
+        category: Optional[str] = None,
+        min_score: float = 0.0,
+    ) -> Tuple[List[Signal], int]:
+        """Get the first page of recent signals and the total match count."""
+        query = self._build_recent_query(hours, source, category, min_score)
+        query = apply_keyset(query, self.RECENT_ORDER)
+        return self._fetch_first_page(query, limit)
 
     def count_recent_filtered(
         self,
@@ -109,6 +186,87 @@ class SignalRepository(BaseRepository):
 
         return query.scalar() or 0
 
+    def get_timeline(
+        self,
+        start: datetime,
+        buckets: int,
+        step: str = "hour",
+    ) -> List[Tuple[datetime, int]]:
+        """Count signals per hour/day bucket, gap-filled in SQL.
+
+        Returns exactly ``buckets`` (bucket_start, count) rows in order,
+        including empty buckets. Postgres generates the series with
+        generate_series; other dialects use a recursive CTE.
+        """
+        if self.session.get_bind().dialect.name == "postgresql":
+            sql = text("""
+                WITH buckets AS (
+                    SELECT generate_series(
+                        CAST(:start AS timestamp),
+                        CAST(:start AS timestamp) + (:n - 1) * CAST(:step AS interval),
+                        CAST(:step AS interval)
+                    ) AS bucket
+                )
+                SELECT b.bucket, COUNT(s.id) AS count
+                FROM buckets b
+                LEFT JOIN signals s
+                    ON s.collected_at >= b.bucket
+                    AND s.collected_at < b.bucket + CAST(:step AS interval)
+                GROUP BY b.bucket
+                ORDER BY b.bucket
+            """)
+            params = {"start": start, "n": buckets, "step": f"1 {step}"}
+        else:
+            sql = text("""
+                WITH RECURSIVE buckets(bucket, n) AS (
+                    SELECT datetime(:start), 1
+                    UNION ALL
+                    SELECT datetime(bucket, :step), n + 1 FROM buckets WHERE n < :n
+                )
+                SELECT b.bucket, COUNT(s.id) AS count
+                FROM buckets b
+                LEFT JOIN signals s
+                    ON s.collected_at >= b.bucket
+                    AND s.collected_at < datetime(b.bucket, :step)
+                GROUP BY b.bucket
+                ORDER BY b.bucket
+            """)
+            params = {
+                "start": start.strftime("%Y-%m-%d %H:%M:%S"),
+                "n": buckets,
+                "step": f"+1 {step}",
+            }
+
+        rows = self.session.execute(sql, params).all()
+        return [
+            (datetime.fromisoformat(b) if isinstance(b, str) else b, count)
+            for b, count in rows
+        ]
+
+    def search_titles(self, keywords: List[str], limit: int = 5) -> List[Any]:
+        """Find the highest-scoring signals whose title matches any keyword.
+
+        Postgres uses the GIN full-text index on the title; other dialects
+        fall back to substring matching. Returns (id, title, score, source) rows.
+        """
+        keywords = [kw.replace('"', " ").strip() for kw in keywords]
+        keywords = [kw for kw in keywords if kw]
+        if not keywords:
+            return []
+
+        query = self.session.query(Signal.id, Signal.title, Signal.score, Signal.source)
+        if self.session.get_bind().dialect.name == "postgresql":
+            # Must match the idx_signals_title_fts expression exactly
+            tsvector = func.to_tsvector(text("'simple'"), Signal.title)
+            tsquery = func.websearch_to_tsquery(
+                text("'simple'"), " or ".join(f'"{kw}"' for kw in keywords)
+            )
+            query = query.filter(tsvector.op("@@")(tsquery))
+        else:
+            query = query.filter(or_(*[Signal.title.ilike(f"%{kw}%") for kw in keywords]))
+
+        return query.order_by(desc(Signal.score)).limit(limit).all()
+
     def get_by_source(self, source: str, limit: int = 50) -> List[Signal]:
         """Get signals by source."""
         return (
@@ -172,6 +330,10 @@ class SignalRepository(BaseRepository):
 class TrendRepository(BaseRepository):
     """Repository for Trend operations."""
 
+    # Keyset orderings for paginated listings
+    LATEST_ORDER = (Trend.analyzed_at, Trend.score, Trend.id)
+    SCORE_ORDER = (Trend.score, Trend.id)
+
     def create(self, trend_data: Dict[str, Any]) -> Trend:
         """Create a new trend."""
         trend = Trend(**trend_data)
@@ -181,45 +343,83 @@ class TrendRepository(BaseRepository):
 
     def get_by_id(self, trend_id: str) -> Optional[Trend]:
         """Get trend by ID."""
-        return self.session.query(Trend).filter(Trend.id == trend_id).first()
+        return self.session.get(Trend, trend_id)
 
-    def get_latest(self, period: str = "24h", limit: int = 10) -> List[Trend]:
+    def get_latest(
+        self,
+        period: str = "24h",
+        limit: int = 10,
+        offset: int = 0,
+        after_cursor: Optional[str] = None,
+    ) -> List[Trend]:
         """Get latest trends for a period."""
+        query = self._list_query(Trend).filter(Trend.period == period)
+        query = apply_keyset(query, self.LATEST_ORDER, after_cursor)
+        return self._fetch_page(query, offset, limit)
+
+    def get_latest_with_total(
+        self, period: str = "24h", limit: int = 10
+    ) -> Tuple[List[Trend], int]:
+        """Get the first page of latest trends for a period and their count."""
+        query = self._list_query(Trend).filter(Trend.period == period)
+        return self._fetch_first_page(apply_keyset(query, self.LATEST_ORDER), limit)
+
+    def get_by_category(
+        self,
+        category: str,
+        limit: int = 10,
+        offset: int = 0,
+        after_cursor: Optional[str] = None,
+    ) -> List[Trend]:
+        """Get trends by category."""
+        query = self._list_query(Trend).filter(Trend.category == category)
+        query = apply_keyset(query, self.SCORE_ORDER, after_cursor)
+        return self._fetch_page(query, offset, limit)
+
+    def get_by_category_with_total(
+        self, category: str, limit: int = 10
+    ) -> Tuple[List[Trend], int]:
+        """Get the first page of trends in a category and their count."""
+        query = self._list_query(Trend).filter(Trend.category == category)
+        return self._fetch_first_page(apply_keyset(query, self.SCORE_ORDER), limit)
+
+    def get_all(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        after_cursor: Optional[str] = None,
+    ) -> List[Trend]:
+        """Get all trends regardless of period."""
+        query = apply_keyset(self._list_query(Trend), self.LATEST_ORDER, after_cursor)
+        return self._fetch_page(query, offset, limit)
+
+    def count_all(self) -> int:
+        """Get total count of all trends."""
+        return self.count_estimate(Trend)
+
+    def count_by_period(self, period: str) -> int:
+        """Count trends for a period."""
         return (
-            self.session.query(Trend)
+            self.session.query(func.count(Trend.id))
             .filter(Trend.period == period)
-            .order_by(desc(Trend.analyzed_at), desc(Trend.score))
-            .limit(limit)
-            .all()
+            .scalar() or 0
         )
 
-    def get_by_category(self, category: str, limit: int = 10) -> List[Trend]:
-        """Get trends by category."""
+    def count_by_category(self, category: str) -> int:
+        """Count trends in a category."""
         return (
-            self.session.query(Trend)
+            self.session.query(func.count(Trend.id))
             .filter(Trend.category == category)
-            .order_by(desc(Trend.score))
-            .limit(limit)
-            .all()
-        )
-
-    def get_all(self, limit: int = 100) -> List[Trend]:
-        """Get all trends regardless of period."""
-        return (
-            self.session.query(Trend)
-            .order_by(desc(Trend.analyzed_at), desc(Trend.score))
-            .limit(limit)
-            .all()
+            .scalar() or 0
         )
 
-    def count_all(self) -> int:
-        """Get total count of all trends."""
-        return self.session.query(func.count(Trend.id)).scalar() or 0
-
 
 class IdeaRepository(BaseRepository):
     """Repository for Idea operations."""
 
+    # Keyset ordering for paginated listings (newest first)
+    LIST_ORDER = (Idea.created_at, Idea.id)
+
     def create(self, idea_data: Dict[str, Any]) -> Idea:
         """Create a new idea."""
         idea = Idea(**idea_data)
@@ -227,19 +427,21 @@ class IdeaRepository(BaseRepository):
         self.session.flush()
         return idea
 
-    def get_by_id(self, idea_id: str) -> Optional[Idea]:
-        """Get idea by ID."""
-        return self.session.query(Idea).filter(Idea.id == idea_id).first()
+    def get_by_id(self, idea_id: str, options: Optional[List[Any]] = None) -> Optional[Idea]:
+        """Get idea by ID, with optional loader ``options`` for its relationships."""
+        return self.session.get(Idea, idea_id, options=options)
 
-    def get_by_status(self, status: str, limit: int = 50) -> List[Idea]:
+    def get_by_status(
+        self,
+        status: str,
+        limit: int = 50,
+        offset: int = 0,
+        after_cursor: Optional[str] = None,
+    ) -> List[Idea]:
         """Get ideas by status."""
-        return (
-            self.session.query(Idea)
-            .filter(Idea.status == status)
-            .order_by(desc(Idea.created_at))
-            .limit(limit)
-            .all()
-        )
+        query = self._list_query(Idea).filter(Idea.status == status)
+        query = apply_keyset(query, self.LIST_ORDER, after_cursor)
+        return query.offset(offset).limit(limit).all()
 
     def get_pending(self, limit: int = 50) -> List[Idea]:
         """Get pending ideas."""
@@ -284,7 +486,7 @@ class IdeaRepository(BaseRepository):
 
     def count_all(self) -> int:
         """Count all ideas."""
-        return self.session.query(func.count(Idea.id)).scalar() or 0
+        return self.count_estimate(Idea)
 
     def count_recent(self, days: int = 30) -> int:
         """Count recent ideas."""
@@ -295,20 +497,23 @@ class IdeaRepository(BaseRepository):
             .scalar() or 0
         )
 
-    def get_all(self, limit: int = 100, offset: int = 0) -> List[Idea]:
+    def get_all(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        after_cursor: Optional[str] = None,
+    ) -> List[Idea]:
         """Get all ideas with pagination."""
-        return (
-            self.session.query(Idea)
-            .order_by(desc(Idea.created_at))
-            .offset(offset)
-            .limit(limit)
-            .all()
-        )
+        query = apply_keyset(self._list_query(Idea), self.LIST_ORDER, after_cursor)
+        return query.offset(offset).limit(limit).all()
 
 
 class DebateRepository(BaseRepository):
     """Repository for Debate operations."""
 
+    # Keyset ordering for paginated listings (most recently started first)
+    LIST_ORDER = (DebateSession.started_at, DebateSession.id)
+
     def create_session(self, session_data: Dict[str, Any]) -> DebateSession:
         """Create a new debate session."""
         debate = DebateSession(**session_data)
@@ -317,19 +522,21 @@ class DebateRepository(BaseRepository):
         return debate
 
     def add_message(self, message_data: Dict[str, Any]) -> DebateMessage:
-        """Add a message to a debate session."""
+        """Add a message to a debate session and bump its message_count."""
         message = DebateMessage(**message_data)
         self.session.add(message)
         self.session.flush()
+        # Incremented in SQL so concurrent writers can't lose an update
+        self.session.execute(
+            update(DebateSession)
+            .where(DebateSession.id == message.session_id)
+            .values(message_count=DebateSession.message_count + 1)
+        )
         return message
 
     def get_session_by_id(self, session_id: str) -> Optional[DebateSession]:
         """Get debate session by ID."""
-        return (
-            self.session.query(DebateSession)
-            .filter(DebateSession.id == session_id)
-            .first()
-        )
+        return self.session.get(DebateSession, session_id)
 
     def get_sessions_by_idea(self, idea_id: str) -> List[DebateSession]:
         """Get all debate sessions for an idea."""
@@ -340,14 +547,41 @@ class DebateRepository(BaseRepository):
             .all()
         )
 
+    def get_sessions_for_idea(
+        self,
+        idea_id: str,
+        source_session_id: Optional[str] = None,
+        with_messages: bool = False,
+    ) -> List[DebateSession]:
+        """Get an idea's source debate session and linked sessions in one query.
+
+        The source session (if any) comes first, followed by sessions linked
+        via ``idea_id`` newest first. ``with_messages`` loads every session's
+        messages with one extra IN query.
+        """
+        query = self.session.query(DebateSession)
+        if with_messages:
+            query = query.options(selectinload(DebateSession.messages))
+        if not source_session_id:
+            return query.filter(DebateSession.idea_id == idea_id).order_by(
+                desc(DebateSession.created_at)
+            ).all()
+        is_source = DebateSession.id == source_session_id
+        return (
+            query.filter(or_(is_source, DebateSession.idea_id == idea_id))
+            .order_by(case((is_source, 0), else_=1), desc(DebateSession.created_at))
+            .all()
+        )
+
     def get_session_messages(self, session_id: str) -> List[DebateMessage]:
         """Get all messages for a debate session."""
-        return (
-            self.session.query(DebateMessage)
-            .filter(DebateMessage.session_id == session_id)
+        # lambda_stmt caches the statement construction, not just the SQL string
+        stmt = lambda_stmt(
+            lambda: select(DebateMessage)
+            .where(DebateMessage.session_id == session_id)
             .order_by(DebateMessage.created_at)
-            .all()
         )
+        return list(self.session.execute(stmt).scalars())
 
     def get_active_sessions(self) -> List[DebateSession]:
         """Get all active debate sessions."""
@@ -399,19 +633,31 @@ class DebateRepository(BaseRepository):
         offset: int = 0,
         status: Optional[str] = None,
         phase: Optional[str] = None,
+        after_cursor: Optional[str] = None,
     ) -> List[DebateSession]:
         """Get all debate sessions with optional filters."""
-        query = self.session.query(DebateSession)
+        query = self._sessions_query(status, phase)
+        query = apply_keyset(query, self.LIST_ORDER, after_cursor)
+        return self._fetch_page(query, offset, limit)
+
+    def get_all_sessions_with_total(
+        self,
+        limit: int = 50,
+        status: Optional[str] = None,
+        phase: Optional[str] = None,
+    ) -> Tuple[List[DebateSession], int]:
+        """Get the first page of debate sessions and the total match count."""
+        query = apply_keyset(self._sessions_query(status, phase), self.LIST_ORDER)
+        return self._fetch_first_page(query, limit)
+
+    def _sessions_query(self, status: Optional[str], phase: Optional[str]):
+        """Build the filtered list query behind :meth:`get_all_sessions`."""
+        query = self._list_query(DebateSession)
         if status:
             query = query.filter(DebateSession.status == status)
         if phase:
             query = query.filter(DebateSession.phase == phase)
-        return (
-            query.order_by(desc(DebateSession.started_at))
-            .offset(offset)
-            .limit(limit)
-            .all()
-        )
+        return query
 
     def count_sessions(
         self,
@@ -444,6 +690,9 @@ class DebateRepository(BaseRepository):
 class PlanRepository(BaseRepository):
     """Repository for Plan operations."""
 
+    # Keyset ordering for paginated listings (newest first)
+    LIST_ORDER = (Plan.created_at, Plan.id)
+
     def create(self, plan_data: Dict[str, Any]) -> Plan:
         """Create a new plan."""
         plan = Plan(**plan_data)
@@ -451,9 +700,10 @@ class PlanRepository(BaseRepository):
         self.session.flush()
         return plan
 
-    def get_by_id(self, plan_id: str) -> Optional[Plan]:
-        """Get plan by ID."""
-        return self.session.query(Plan).filter(Plan.id == plan_id).first()
+    def get_by_id(self, plan_id: str, with_documents: bool = False) -> Optional[Plan]:
+        """Get plan by ID; ``with_documents`` also loads the deferred document sections."""
+        options = [undefer_group("documents")] if with_documents else None
+        return self.session.get(Plan, plan_id, options=options)
 
     def get_by_idea(self, idea_id: str) -> List[Plan]:
         """Get all plans for an idea."""
@@ -464,6 +714,18 @@ class PlanRepository(BaseRepository):
             .all()
         )
 
+    def get_summaries_by_idea(self, idea_id: str) -> List[Any]:
+        """Get (id, title, version, status) rows for an idea's plans, newest first.
+
+        Skips the large document columns that ``get_by_idea`` loads.
+        """
+        return (
+            self.session.query(Plan.id, Plan.title, Plan.version, Plan.status)
+            .filter(Plan.idea_id == idea_id)
+            .order_by(desc(Plan.version))
+            .all()
+        )
+
     def get_latest_by_idea(self, idea_id: str) -> Optional[Plan]:
         """Get the latest plan for an idea."""
         return (
@@ -473,15 +735,22 @@ class PlanRepository(BaseRepository):
             .first()
         )
 
-    def get_by_status(self, status: str, limit: int = 50) -> List[Plan]:
+    def get_by_status(
+        self,
+        status: str,
+        limit: int = 50,
+        offset: int = 0,
+        after_cursor: Optional[str] = None,
+    ) -> List[Plan]:
         """Get plans by status."""
-        return (
-            self.session.query(Plan)
-            .filter(Plan.status == status)
-            .order_by(desc(Plan.created_at))
-            .limit(limit)
-            .all()
-        )
+        query = self._list_query(Plan).filter(Plan.status == status)
+        query = apply_keyset(query, self.LIST_ORDER, after_cursor)
+        return self._fetch_page(query, offset, limit)
+
+    def get_by_status_with_total(self, status: str, limit: int = 50) -> Tuple[List[Plan], int]:
+        """Get the first page of plans with a status and their count."""
+        query = self._list_query(Plan).filter(Plan.status == status)
+        return self._fetch_first_page(apply_keyset(query, self.LIST_ORDER), limit)
 
     def update_status(self, plan_id: str, status: str) -> Optional[Plan]:
         """Update plan status."""
@@ -494,7 +763,7 @@ class PlanRepository(BaseRepository):
 
     def count_all(self) -> int:
         """Count all plans."""
-        return self.session.query(func.count(Plan.id)).scalar() or 0
+        return self.count_estimate(Plan)
 
     def count_by_status(self, status: str) -> int:
         """Count plans by status."""
@@ -504,15 +773,15 @@ class PlanRepository(BaseRepository):
             .scalar() or 0
         )
 
-    def get_all(self, limit: int = 100, offset: int = 0) -> List[Plan]:
+    def get_all(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        after_cursor: Optional[str] = None,
+    ) -> List[Plan]:
         """Get all plans with pagination."""
-        return (
-            self.session.query(Plan)
-            .order_by(desc(Plan.created_at))
-            .offset(offset)
-            .limit(limit)
-            .all()
-        )
+        query = apply_keyset(self._list_query(Plan), self.LIST_ORDER, after_cursor)
+        return self._fetch_page(query, offset, limit)
 
 
 class ProjectRepository(BaseRepository):
@@ -527,7 +796,7 @@ class ProjectRepository(BaseRepository):
 
     def get_by_id(self, project_id: str) -> Optional[Project]:
         """Get project by ID."""
-        return self.session.query(Project).filter(Project.id == project_id).first()
+        return self.session.get(Project, project_id)
 
     def get_by_plan(self, plan_id: str) -> Optional[Project]:
         """Get project by plan ID."""
@@ -538,14 +807,27 @@ class ProjectRepository(BaseRepository):
             .first()
         )
 
-    def get_by_status(self, status: str, limit: int = 50) -> List[Project]:
+    def get_by_status(
+        self,
+        status: str,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> List[Project]:
         """Get projects by status."""
+        return self._fetch_page(self._status_query(status), offset, limit)
+
+    def get_by_status_with_total(
+        self, status: str, limit: int = 50
+    ) -> Tuple[List[Project], int]:
+        """Get the first page of projects with a status and their count."""
+        return self._fetch_first_page(self._status_query(status), limit)
+
+    def _status_query(self, status: str):
+        """Build the ordered list query behind :meth:`get_by_status`."""
         return (
-            self.session.query(Project)
+            self._list_query(Project)
             .filter(Project.status == status)
             .order_by(desc(Project.created_at))
-            .limit(limit)
-            .all()
         )
 
     def update_status(
@@ -573,7 +855,7 @@ class ProjectRepository(BaseRepository):
 
     def count_all(self) -> int:
         """Count all projects."""
-        return self.session.query(func.count(Project.id)).scalar() or 0
+        return self.count_estimate(Project)
 
     def count_by_status(self, status: str) -> int:
         """Count projects by status."""
@@ -586,7 +868,7 @@ class ProjectRepository(BaseRepository):
     def get_all(self, limit: int = 100, offset: int = 0) -> List[Project]:
         """Get all projects with pagination."""
         return (
-            self.session.query(Project)
+            self._list_query(Project)
             .order_by(desc(Project.created_at))
             .offset(offset)
             .limit(limit)
@@ -813,7 +1095,7 @@ class AgentStateRepository(BaseRepository):
 
     def get_or_create(self, agent_id: str, name: str, handle: Optional[str] = None) -> AgentState:
         """Get or create an agent state."""
-        state = self.session.query(AgentState).filter(AgentState.id == agent_id).first()
+        state = self.session.get(AgentState, agent_id)
         if not state:
             state = AgentState(id=agent_id, name=name, handle=handle)
             self.session.add(state)
@@ -822,7 +1104,7 @@ class AgentStateRepository(BaseRepository):
 
     def update_status(self, agent_id: str, status: str, current_task: Optional[str] = None) -> Optional[AgentState]:
         """Update agent status."""
-        state = self.session.query(AgentState).filter(AgentState.id == agent_id).first()
+        state = self.session.get(AgentState, agent_id)
         if state:
             state.status = status
             state.current_task = current_task
@@ -834,7 +1116,7 @@ class AgentStateRepository(BaseRepository):
 
     def increment_stats(self, agent_id: str, messages: int = 0, tokens: int = 0) -> Optional[AgentState]:
         """Increment agent statistics."""
-        state = self.session.query(AgentState).filter(AgentState.id == agent_id).first()
+        state = self.session.get(AgentState, agent_id)
         if state:
             state.total_messages += messages
             state.total_tokens += tokens
@@ -853,3 +1135,79 @@ class AgentStateRepository(BaseRepository):
     def get_all(self) -> List[AgentState]:
         """Get all agent states."""
         return self.session.query(AgentState).order_by(AgentState.name).all()
+
+
+class PipelineStatsRepository(BaseRepository):
+    """Repository for the pipeline stage count rollup."""
+
+    SNAPSHOT_ID = "current"
+
+    @staticmethod
+    def _stage_counts(timestamp, since: datetime, estimate: Optional[int] = None):
+        """Single-row subquery with a table's total and rows since ``since``.
+
+        Given a planner ``estimate`` for the total, only the window is counted,
+        as a range scan on the timestamp index.
+        """
+        if estimate is not None:
+            return select(
+                literal(estimate).label("total"),
+                func.count().label("recent"),
+            ).select_from(timestamp.table).where(timestamp >= since).subquery()
+        return select(
+            func.count().label("total"),
+            func.count(case((timestamp >= since, 1))).label("recent"),
+        ).select_from(timestamp.table).subquery()
+
+    def compute_counts(self, now: Optional[datetime] = None) -> Dict[str, Dict[str, int]]:
+        """Count every stage's total and recent rows in one round-trip.
+
+        Each table is scanned once with its window applied as a conditional
+        count: signals in the last hour, trends and ideas since midnight,
+        plans and projects over the last 7 days. Totals of large Postgres
+        tables come from planner estimates (see ``count_estimate``).
+        """
+        now = now or datetime.utcnow()
+        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        last_7d = now - timedelta(days=7)
+
+        windows = {
+            "signals": (Signal.collected_at, now - timedelta(hours=1)),
+            "trends": (Trend.analyzed_at, today),
+            "ideas": (Idea.created_at, today),
+            "plans": (Plan.created_at, last_7d),
+            "projects": (Project.created_at, last_7d),
+        }
+        estimates = self._row_estimates(ts.table.name for ts, _ in windows.values())
+        stages = {
+            name: self._stage_counts(ts, since, estimates.get(ts.table.name))
+            for name, (ts, since) in windows.items()
+        }
+        subqueries = list(stages.values())
+        joined = subqueries[0]
+        for subquery in subqueries[1:]:
+            joined = joined.join(subquery, true())
+
+        row = self.session.execute(
+            select(*[c for subquery in subqueries for c in subquery.c]).select_from(joined)
+        ).one()
+        values = iter(row)
+        return {
+            name: {"total": next(values) or 0, "recent": next(values) or 0}
+            for name in stages
+        }
+
+    def get_current(self) -> Optional[PipelineStats]:
+        """Get the latest snapshot, if one has been written."""
+        return self.session.get(PipelineStats, self.SNAPSHOT_ID)
+
+    def refresh(self, now: Optional[datetime] = None) -> PipelineStats:
+        """Recompute the counts and overwrite the current snapshot."""
+        now = now or datetime.utcnow()
+        snapshot = self.session.merge(PipelineStats(
+            id=self.SNAPSHOT_ID,
+            counts=self.compute_counts(now),
+            computed_at=now,
+        ))
+        self.session.flush()
+        return snapshot
@@ -10,6 +10,7 @@ This module orchestrates the entire debate flow:
 
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 from ..providers.base import BaseProvider
@@ -54,10 +55,8 @@ class DebateSession:
     The debate follows this flow:
     1. Founder creates initial plan from idea
     2. For each round:
-       a. VC provides feedback
-       b. Accelerator provides feedback
-       c. Founder Friend provides feedback
-       d. Founder reflects on feedback and updates plan
+       a. VC, Accelerator and Founder Friend provide feedback (concurrently)
+       b. Founder reflects on feedback and updates plan
     3. Check termination conditions
     4. Repeat until satisfied or max rounds reached
     """
@@ -134,10 +133,16 @@ class DebateSession:
                 # In subsequent rounds, plan update happens after reflection
                 round_data.initial_plan = self.current_plan
 
-            # Phase 2: Get feedback from all reviewers
+            # Phase 2: Get feedback from all reviewers (independent, so concurrently)
+            feedback_roles = get_feedback_roles()
+            with ThreadPoolExecutor(max_workers=len(feedback_roles)) as executor:
+                futures = [
+                    executor.submit(self._run_feedback, role, assignment) for role in feedback_roles
+                ]
+            feedbacks = [future.result() for future in futures]
+
             feedback_responses = {}
-            for role in get_feedback_roles():
-                feedback = self._run_feedback(role, assignment)
+            for role, feedback in zip(feedback_roles, feedbacks, strict=True):
                 feedback_responses[role] = feedback
 
                 # Add to round data
@@ -4,6 +4,7 @@ GitHub API client for Issues and Labels management.
 Handles all GitHub API interactions for the backlog-based workflow.
 """
 
+import sys
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -17,32 +18,36 @@ logger = get_logger(__name__)
 
 # Label constants
 class Labels:
-    """Standard labels for the orchestrator workflow."""
+    """Standard labels for the orchestrator workflow.
+
+    Names are interned, as are label names parsed from API responses, so
+    membership checks such as GitHubIssue.has_label match on identity.
+    """
 
     # Type labels
-    TYPE_IDEA = "type:idea"
-    TYPE_PLAN = "type:plan"
+    TYPE_IDEA = sys.intern("type:idea")
+    TYPE_PLAN = sys.intern("type:plan")
 
     # Status labels
-    STATUS_BACKLOG = "status:backlog"
-    STATUS_PLANNED = "status:planned"
-    STATUS_IN_DEV = "status:in-dev"
-    STATUS_DONE = "status:done"
+    STATUS_BACKLOG = sys.intern("status:backlog")
+    STATUS_PLANNED = sys.intern("status:planned")
+    STATUS_IN_DEV = sys.intern("status:in-dev")
+    STATUS_DONE = sys.intern("status:done")
 
     # Promotion labels (human action)
-    PROMOTE_TO_PLAN = "promote:to-plan"
-    PROMOTE_TO_DEV = "promote:to-dev"
+    PROMOTE_TO_PLAN = sys.intern("promote:to-plan")
+    PROMOTE_TO_DEV = sys.intern("promote:to-dev")
 
     # Rejection labels (human action)
-    REJECT_PLAN = "reject:plan"
+    REJECT_PLAN = sys.intern("reject:plan")
 
     # Processing markers
-    GENERATED_BY_ORCHESTRATOR = "generated:by-orchestrator"
-    PROCESSED_TO_PLAN = "processed:to-plan"
-    PROCESSED_TO_DEV = "processed:to-dev"
+    GENERATED_BY_ORCHESTRATOR = sys.intern("generated:by-orchestrator")
+    PROCESSED_TO_PLAN = sys.intern("processed:to-plan")
+    PROCESSED_TO_DEV = sys.intern("processed:to-dev")
 
     # Source markers
-    SOURCE_TREND = "source:trend"
+    SOURCE_TREND = sys.intern("source:trend")
 
     # All labels with descriptions for setup
     ALL_LABELS = {
@@ -99,7 +104,7 @@ class GitHubIssue:
             title=data["title"],
             body=data.get("body") or "",
             state=data["state"],
-            labels=[label["name"] for label in data.get("labels", [])],
+            labels=[sys.intern(label["name"]) for label in data.get("labels", [])],
             created_at=data["created_at"],
             updated_at=data["updated_at"],
             html_url=data["html_url"],
@@ -353,6 +358,31 @@ class GitHubClient:
         )
         return response
 
+    def close_with_error(
+        self,
+        issue_number: int,
+        labels: list[str],
+        error_text: str,
+        original_body: str,
+    ) -> GitHubIssue:
+        """
+        Close an issue, replace its labels and explain why in a single PATCH.
+
+        The explanation is appended to the issue body instead of posted as a
+        separate comment, so failure paths cost one API call rather than two.
+
+        Args:
+            issue_number: Issue number.
+            labels: Replace all labels.
+            error_text: Explanation appended below the original body.
+            original_body: Current body of the issue.
+
+        Returns:
+            Updated GitHubIssue.
+        """
+        body = f"{original_body.rstrip()}\n\n---\n\n{error_text}" if original_body else error_text
+        return self.update_issue(issue_number, body=body, state="closed", labels=labels)
+
     # Search operations
 
     def search_issues(
@@ -431,6 +461,14 @@ class GitHubClient:
             per_page=limit,
         )
 
+    def find_open_plans(self, limit: int = 100) -> list[GitHubIssue]:
+        """Find all open plans, whatever their status or promotion labels."""
+        return self.search_issues(
+            labels=[Labels.TYPE_PLAN],
+            state="open",
+            per_page=limit,
+        )
+
     # Label management
 
     def ensure_labels_exist(self) -> None:
@@ -265,8 +265,8 @@ class ProjectScaffold:
             return None
 
         try:
-            from ..db.models import Plan
-            plan = self.db_session.query(Plan).filter(Plan.id == plan_id).first()
+            from ..db.repositories import PlanRepository
+            plan = PlanRepository(self.db_session).get_by_id(plan_id, with_documents=True)
             if plan:
                 return {
                     "id": plan.id,
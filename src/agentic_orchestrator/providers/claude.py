@@ -11,6 +11,7 @@ to full Claude Code capabilities.
 
 import os
 import subprocess
+import time
 from pathlib import Path
 from typing import Any
 
@@ -180,6 +181,7 @@ class ClaudeProvider(BaseProvider):
     API_MODELS = {
         "opus": "claude-opus-4-5-20251101",
         "sonnet": "claude-sonnet-4-20250514",
+        "haiku": "claude-haiku-4-5-20251001",
     }
 
     def __init__(
@@ -393,7 +395,7 @@ class ClaudeProvider(BaseProvider):
                 "max_tokens": kwargs.get("max_tokens", 4096),
             }
             if system:
-                create_kwargs["system"] = system
+                create_kwargs["system"] = self._system_param(system, kwargs.get("cache_system"))
 
             response = self.api_client.messages.create(**create_kwargs)
 
@@ -425,6 +427,14 @@ class ClaudeProvider(BaseProvider):
             self._handle_api_error(e, model)
             raise
 
+    @staticmethod
+    def _system_param(system: str, cache_system: bool = False) -> str | list[dict]:
+        """API system parameter, optionally with a prompt-cache breakpoint."""
+        if cache_system:
+            # Cache breakpoint after the system prompt so the prefix is reused
+            return [{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}]
+        return system
+
     def _handle_api_error(self, error: Exception, model: str) -> None:
         """Handle API errors."""
         error_str = str(error).lower()
@@ -474,6 +484,112 @@ class ClaudeProvider(BaseProvider):
             model=model,
         )
 
+    def chat(
+        self,
+        user_message: str,
+        system_message: str | None = None,
+        cache_system: bool = False,
+    ) -> str:
+        """
+        Simple chat interface.
+
+        Args:
+            user_message: User's message.
+            system_message: Optional system message.
+            cache_system: Mark the system message for Anthropic prompt caching
+                (API mode only). Use for system messages that repeat verbatim.
+
+        Returns:
+            Assistant's response content.
+        """
+        if not cache_system:
+            return super().chat(user_message, system_message=system_message)
+
+        messages = []
+        if system_message:
+            messages.append(Message(role="system", content=system_message))
+        messages.append(Message(role="user", content=user_message))
+
+        response = self.complete(messages, cache_system=True)
+        return response.content
+
+    def chat_batch(
+        self,
+        user_messages: list[str],
+        system_message: str | None = None,
+        cache_system: bool = False,
+        max_tokens: int = 4096,
+        poll_interval: float = 30.0,
+        max_wait: float = 3600.0,
+    ) -> list[str | None]:
+        """
+        Answer independent prompts in one Message Batches API job (API mode only).
+
+        Batches are billed at half price but can take minutes to finish, so
+        use this only for work that can wait.
+
+        Args:
+            user_messages: One user message per request.
+            system_message: Optional system message shared by all requests.
+            cache_system: Mark the system message for prompt caching.
+            max_tokens: Maximum tokens to generate per request.
+            poll_interval: Seconds between batch status checks.
+            max_wait: Seconds to wait before cancelling the batch.
+
+        Returns:
+            Responses in request order; None where a request did not succeed
+            or the batch was cancelled after max_wait.
+        """
+        if self.dry_run:
+            return [
+                self._dry_run_response([Message(role="user", content=message)]).content
+                for message in user_messages
+            ]
+        if self.mode != "api":
+            raise ProviderError("Message batches require API mode", provider=self.provider_name)
+
+        params: dict[str, Any] = {
+            "model": self.API_MODELS.get(self.model, self.model),
+            "max_tokens": max_tokens,
+        }
+        if system_message:
+            params["system"] = self._system_param(system_message, cache_system)
+        requests = [
+            {
+                "custom_id": str(i),
+                "params": {**params, "messages": [{"role": "user", "content": message}]},
+            }
+            for i, message in enumerate(user_messages)
+        ]
+
+        responses: list[str | None] = [None] * len(user_messages)
+        try:
+            batches = self.api_client.messages.batches
+            batch = batches.create(requests=requests)
+            deadline = time.monotonic() + max_wait
+            while batch.processing_status != "ended":
+                if time.monotonic() >= deadline:
+                    logger.warning(
+                        f"Message batch {batch.id} not done after {max_wait}s, cancelling"
+                    )
+                    batches.cancel(batch.id)
+                    return responses
+                time.sleep(poll_interval)
+                batch = batches.retrieve(batch.id)
+
+            for entry in batches.results(batch.id):
+                if entry.result.type == "succeeded":
+                    responses[int(entry.custom_id)] = "".join(
+                        block.text
+                        for block in entry.result.message.content
+                        if hasattr(block, "text")
+                    )
+        except Exception as e:
+            self._handle_api_error(e, self.model)
+            raise
+
+        return responses
+
     async def generate(
         self,
         prompt: str,
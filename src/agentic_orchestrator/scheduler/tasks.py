@@ -161,7 +161,12 @@ async def _signal_collect_async():
 
 def signal_collect():
     """Collect signals from all adapters."""
-    asyncio.run(_signal_collect_async())
+    from ..adapters.twitter import shutdown_parse_pool
+
+    try:
+        asyncio.run(_signal_collect_async())
+    finally:
+        shutdown_parse_pool()
 
 
 async def _analyze_trends_async():
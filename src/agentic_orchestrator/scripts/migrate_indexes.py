@@ -0,0 +1,87 @@
+"""
+Migration script to create indexes declared on the models in an existing database.
+
+``Base.metadata.create_all`` only creates indexes together with new tables, so
+indexes added to ``__table_args__`` later never reach an existing database.
+This script creates any that are missing; it is safe to run repeatedly.
+Dialect-specific indexes (e.g. Postgres GIN) are skipped on other databases.
+On Postgres indexes are built with CREATE INDEX CONCURRENTLY so writes to
+the live tables are not blocked while they build.
+
+Usage:
+    PYTHONPATH=./src python -m agentic_orchestrator.scripts.migrate_indexes
+"""
+
+import logging
+import sys
+
+from sqlalchemy import inspect
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s [%(levelname)s] %(name)s: %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+
+def migrate_indexes(engine) -> int:
+    """Create missing model indexes. Returns the number of indexes created."""
+    from ..db.models import Base
+
+    inspector = inspect(engine)
+    tables = [t for t in Base.metadata.tables.values() if inspector.has_table(t.name)]
+    before = {t.name: {ix["name"] for ix in inspector.get_indexes(t.name)} for t in tables}
+
+    concurrently = engine.dialect.name == "postgresql"
+    bind = engine
+    if concurrently:
+        # CONCURRENTLY cannot run inside a transaction block
+        bind = engine.connect().execution_options(isolation_level="AUTOCOMMIT")
+
+    try:
+        for table in tables:
+            for index in sorted(table.indexes, key=lambda ix: ix.name):
+                if index.name not in before[table.name]:
+                    # Conditional (ddl_if) indexes are skipped on other dialects
+                    if concurrently:
+                        options = index.dialect_options["postgresql"]
+                        options["concurrently"] = True
+                        try:
+                            index.create(bind=bind, checkfirst=True)
+                        finally:
+                            options["concurrently"] = False
+                    else:
+                        index.create(bind=bind, checkfirst=True)
+    finally:
+        if concurrently:
+            bind.close()
+
+    inspector = inspect(engine)
+    created = 0
+    for table in tables:
+        for name in sorted({ix["name"] for ix in inspector.get_indexes(table.name)} - before[table.name]):
+            logger.info(f"Created index {name} on {table.name}")
+            created += 1
+
+    return created
+
+
+def main():
+    """Run the index migration against the configured database."""
+    from ..db import get_database
+
+    db = get_database()
+    logger.info(f"Migrating indexes on {db.engine.url.render_as_string(hide_password=True)}")
+
+    try:
+        created = migrate_indexes(db.engine)
+    except Exception as e:
+        logger.error(f"Index migration failed: {e}")
+        sys.exit(1)
+
+    logger.info(f"Index migration complete: {created} created")
+
+
+if __name__ == "__main__":
+    main()
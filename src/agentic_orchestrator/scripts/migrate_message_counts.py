@@ -0,0 +1,70 @@
+"""
+Migration script to add and backfill debate_sessions.message_count.
+
+``Base.metadata.create_all`` does not add columns to existing tables, so
+databases created before the column existed need it added here. The count
+is then recomputed for every session from debate_messages; after that,
+DebateRepository.add_message keeps it current. Safe to run repeatedly.
+
+Usage:
+    PYTHONPATH=./src python -m agentic_orchestrator.scripts.migrate_message_counts
+"""
+
+import logging
+import sys
+
+from sqlalchemy import inspect, text
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s [%(levelname)s] %(name)s: %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+
+def migrate_message_counts(engine) -> int:
+    """Add the message_count column if missing and backfill it.
+
+    Returns the number of sessions whose count changed.
+    """
+    columns = {c["name"] for c in inspect(engine).get_columns("debate_sessions")}
+
+    with engine.begin() as conn:
+        if "message_count" not in columns:
+            conn.execute(text(
+                "ALTER TABLE debate_sessions "
+                "ADD COLUMN message_count INTEGER NOT NULL DEFAULT 0"
+            ))
+            logger.info("Added debate_sessions.message_count")
+
+        result = conn.execute(text(
+            "UPDATE debate_sessions SET message_count = ("
+            " SELECT count(*) FROM debate_messages"
+            " WHERE debate_messages.session_id = debate_sessions.id"
+            ") WHERE message_count <> ("
+            " SELECT count(*) FROM debate_messages"
+            " WHERE debate_messages.session_id = debate_sessions.id"
+            ")"
+        ))
+        return result.rowcount
+
+
+def main():
+    """Run the message count migration against the configured database."""
+    from ..db import get_database
+
+    db = get_database()
+    logger.info(f"Migrating message counts on {db.engine.url.render_as_string(hide_password=True)}")
+
+    try:
+        updated = migrate_message_counts(db.engine)
+    except Exception as e:
+        logger.error(f"Message count migration failed: {e}")
+        sys.exit(1)
+
+    logger.info(f"Message count migration complete: {updated} sessions updated")
+
+
+if __name__ == "__main__":
+    main()
@@ -23,6 +23,7 @@ from ..adapters.threads import ThreadsAdapter
 from ..db.connection import db
 from ..db.models import Signal
 from ..db.repositories import SignalRepository
+from ..cache import CacheKeys, get_cache
 from .scorer import SignalScorer
 
 logger = logging.getLogger(__name__)
@@ -407,6 +408,14 @@ class SignalAggregator:
                 except Exception as e:
                     logger.error(f"Error saving signal: {e}")
 
+        if saved_count:
+            # Drop cached API counters and notify listeners of the new rows
+            cache = get_cache()
+            cache.delete(CacheKeys.SYSTEM_STATUS)
+            cache.delete(CacheKeys.API_SIGNALS_TIMELINE.format(period="24h"))
+            cache.delete(CacheKeys.API_SIGNALS_TIMELINE.format(period="7d"))
+            cache.publish(CacheKeys.CHANNEL_SIGNALS, {"saved": saved_count})
+
         return saved_count
 
     async def get_recent_signals(
@@ -6,6 +6,7 @@ to FeedItem objects for trend analysis.
 """
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from email.utils import parsedate_to_datetime
 from typing import Any
@@ -107,10 +108,21 @@ class FeedFetcher:
         success_feeds: list[tuple[str, int]] = []
 
         logger.info(f"Starting to fetch {len(self.feed_configs)} configured feeds...")
-
-        for feed_config in self.feed_configs:
+        if not self.feed_configs:
+            return all_items
+
+        # Feeds are network-bound, so fetch them concurrently on the shared client;
+        # results are still collected in config order
+        max_workers = self.config.get("trends", "fetch", "max_workers", default=8)
+        _ = self.client
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(self.feed_configs))) as executor:
+            futures = [
+                executor.submit(self.fetch_feed, feed_config) for feed_config in self.feed_configs
+            ]
+
+        for feed_config, future in zip(self.feed_configs, futures, strict=True):
             try:
-                items = self.fetch_feed(feed_config)
+                items = future.result()
                 all_items.extend(items)
                 success_feeds.append((feed_config.name, len(items)))
                 logger.info(f"  ✓ {feed_config.name}: {len(items)} items")
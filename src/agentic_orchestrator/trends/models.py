@@ -6,6 +6,7 @@ Defines dataclasses for feed items, trends, and analysis results.
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
 
 
 @dataclass
@@ -66,6 +67,11 @@ class Trend:
         if self.idea_seeds is None:
             self.idea_seeds = []
 
+    @cached_property
+    def topic_fold(self) -> str:
+        """Case-folded topic for case-insensitive comparison (computed once)."""
+        return self.topic.casefold()
+
 
 @dataclass
 class TrendAnalysis:
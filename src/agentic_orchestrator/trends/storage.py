@@ -255,31 +255,47 @@ class TrendStorage:
         total_articles = frontmatter.get("total_articles", 0)
 
         # Parse each period section
-        period_patterns = {
-            "24h": r"## 24-Hour Trends\n(.*?)(?=## |$)",
-            "1w": r"## Weekly Trends\n(.*?)(?=## |$)",
-            "1m": r"## Monthly Trends\n(.*?)(?=## |$)",
+        period_labels = {
+            "24h": "24-Hour Trends",
+            "1w": "Weekly Trends",
+            "1m": "Monthly Trends",
         }
 
-        for period, pattern in period_patterns.items():
-            match = re.search(pattern, content, re.DOTALL)
-            if not match:
+        for period, label in period_labels.items():
+            section = self._period_section(content, label)
+            if section is None:
                 continue
 
-            section = match.group(1)
             trends = self._parse_trends_section(section, period)
 
             analyses[period] = TrendAnalysis(
                 date=date,
                 period=period,
                 trends=trends,
-                raw_article_count=total_articles // len(period_patterns),
+                raw_article_count=total_articles // len(period_labels),
                 sources_analyzed=sources,
                 categories_analyzed=categories,
             )
 
         return analyses
 
+    def _period_section(self, content: str, label: str) -> str | None:
+        """
+        Get the body of a ``## label`` section, up to the next ``## `` header.
+
+        Headers are fixed strings, so plain substring search is enough. Only
+        level-2 headers at the start of a line end the section; the ``### ``
+        trend headers inside it do not.
+        """
+        marker = f"\n## {label}\n"
+        start = content.find(marker)
+        if start < 0:
+            return None
+        start += len(marker)
+
+        end = content.find("\n## ", start)
+        return content[start:] if end < 0 else content[start : end + 1]
+
     def _parse_trends_section(
         self,
         section: str,
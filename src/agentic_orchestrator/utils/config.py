@@ -133,6 +133,11 @@ class Config:
         """Get the Claude fallback model."""
         return self.get("models", "claude", "fallback", default="sonnet")
 
+    @property
+    def claude_model_fast(self) -> str:
+        """Get the Claude model for short, low-complexity calls."""
+        return self.get("models", "claude", "fast", default="haiku")
+
     @property
     def openai_model(self) -> str:
         """Get the OpenAI model to use."""
@@ -68,20 +68,21 @@ def write_markdown(
     ensure_parent(path)
 
     # Build frontmatter
-    frontmatter = ""
+    parts = []
     if metadata or title:
-        frontmatter = "---\n"
+        parts.append("---\n")
         if title:
-            frontmatter += f"title: {title}\n"
+            parts.append(f"title: {title}\n")
         if metadata:
             for key, value in metadata.items():
                 if isinstance(value, datetime):
                     value = value.isoformat()
-                frontmatter += f"{key}: {value}\n"
-        frontmatter += "---\n\n"
+                parts.append(f"{key}: {value}\n")
+        parts.append("---\n\n")
 
     # Build full content
-    full_content = frontmatter + content
+    parts.append(content)
+    full_content = "".join(parts)
 
     # Write file
     mode = "a" if append else "w"
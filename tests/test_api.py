@@ -1,21 +1,33 @@
 """Tests for FastAPI endpoints."""
 
+import json
+
 import pytest
 from datetime import datetime, timedelta
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, inspect as sa_inspect
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
-from agentic_orchestrator.api.main import app, get_session
+from agentic_orchestrator.api import main as api_main
+from agentic_orchestrator.api.main import app, get_now, get_session
+from agentic_orchestrator.cache import CacheKeys, get_cache
+from agentic_orchestrator.db.repositories import (
+    BaseRepository,
+    DebateRepository,
+    PipelineStatsRepository,
+    PlanRepository,
+    SignalRepository,
+)
 from agentic_orchestrator.db.models import (
     Base,
     Signal,
     Trend,
     Idea,
     DebateSession,
-    DebateMessage,
     Plan,
+    Project,
     APIUsage,
     SystemLog,
 )
@@ -26,8 +38,11 @@ TEST_DATABASE_URL = "sqlite:///:memory:"
 
 
 @pytest.fixture(scope="function")
-def test_db():
+def test_db(monkeypatch):
     """Create a test database with fresh tables for each test."""
+    # Fail on lazy relationship loads in list endpoints (N+1 guard)
+    monkeypatch.setattr(BaseRepository, "strict_loading", True)
+
     engine = create_engine(
         TEST_DATABASE_URL,
         connect_args={"check_same_thread": False},
@@ -44,6 +59,8 @@ def test_db():
             session.close()
 
     app.dependency_overrides[get_session] = override_get_session
+    get_cache().flush()
+    api_main._local_responses.clear()
 
     session = TestingSessionLocal()
     yield session
@@ -163,25 +180,22 @@ def sample_debates(test_db, sample_ideas):
     test_db.add(session)
     test_db.commit()
 
-    # Add messages
-    messages = [
-        DebateMessage(
-            session_id=session.id,
-            agent_id="agent1",
-            agent_name="Founder",
-            message_type="propose",
-            content="I propose we build this.",
-        ),
-        DebateMessage(
-            session_id=session.id,
-            agent_id="agent2",
-            agent_name="VC",
-            message_type="support",
-            content="I support this proposal.",
-        ),
-    ]
-    for msg in messages:
-        test_db.add(msg)
+    # Add messages through the repository so message_count is kept in step
+    repo = DebateRepository(test_db)
+    repo.add_message({
+        "session_id": session.id,
+        "agent_id": "agent1",
+        "agent_name": "Founder",
+        "message_type": "propose",
+        "content": "I propose we build this.",
+    })
+    repo.add_message({
+        "session_id": session.id,
+        "agent_id": "agent2",
+        "agent_name": "VC",
+        "message_type": "support",
+        "content": "I support this proposal.",
+    })
     test_db.commit()
 
     return [session]
@@ -246,6 +260,41 @@ class TestStatusEndpoint:
         assert "stats" in data
         assert "agents_active" in data["stats"]
 
+    def test_status_counts(self, client, sample_signals, sample_plans):
+        """Test status counters come back from the combined count query."""
+        data = client.get("/status").json()
+        assert data["components"]["database"]["status"] == "healthy"
+        assert data["stats"]["signals_today"] == 3
+        assert data["stats"]["ideas_generated"] == 2
+        assert data["stats"]["plans_created"] == 1
+        assert data["stats"]["debates_today"] == 0
+
+    def test_status_uses_request_clock(self, client, sample_signals):
+        """Test status counts and timestamp share the injected request time."""
+        tomorrow = datetime.utcnow() + timedelta(days=1)
+        app.dependency_overrides[get_now] = lambda: tomorrow
+        data = client.get("/status").json()
+        assert data["timestamp"] == tomorrow.isoformat()
+        assert data["stats"]["signals_today"] == 0
+
+    def test_day_start_rolls_over(self):
+        """Test the cached day floor follows the request clock across midnight."""
+        late = datetime(2026, 3, 1, 23, 59, 59)
+        assert api_main._day_start(late) == datetime(2026, 3, 1)
+        assert api_main._day_start(late + timedelta(seconds=2)) == datetime(2026, 3, 2)
+
+    def test_status_served_from_local_cache(self, client, test_db, sample_signals):
+        """Test repeat polls within the TTL skip Redis and the database."""
+        first = client.get("/status").json()
+        get_cache().flush()
+        test_db.add(Signal(source="rss", category="ai", title="Another", score=1.0))
+        test_db.commit()
+
+        before = client.get("/cache/stats").json()
+        assert client.get("/status").json() == first
+        after = client.get("/cache/stats").json()
+        assert after["hits"] == before["hits"] + 1
+
 
 class TestSignalsEndpoint:
     """Tests for /signals endpoint."""
@@ -274,6 +323,124 @@ class TestSignalsEndpoint:
         assert len(data["signals"]) == 2
         assert data["limit"] == 2
 
+    def test_get_signals_conditional_get(self, client, sample_signals):
+        """Test a matching If-None-Match is answered with 304."""
+        now = datetime.utcnow()
+        app.dependency_overrides[get_now] = lambda: now
+        response = client.get("/signals?limit=2")
+        etag = response.headers["ETag"]
+        assert response.headers["Cache-Control"] == "public, max-age=30"
+
+        cached = client.get("/signals?limit=2", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.headers["ETag"] == etag
+
+        other = client.get("/signals?limit=3", headers={"If-None-Match": etag})
+        assert other.status_code == 200
+        assert other.headers["ETag"] != etag
+
+    def test_get_signals_etag_changes_as_window_moves(self, client, sample_signals):
+        """Test a windowed list is revalidated once the version bucket rolls over."""
+        now = datetime.utcnow()
+        app.dependency_overrides[get_now] = lambda: now
+        etag = client.get("/signals").headers["ETag"]
+
+        app.dependency_overrides[get_now] = lambda: now + timedelta(minutes=1)
+        response = client.get("/signals", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    def test_get_signals_etag_changes_with_data(self, client, test_db, sample_signals):
+        """Test new rows produce a new ETag once the version cache expires."""
+        etag = client.get("/signals").headers["ETag"]
+        test_db.add(Signal(
+            source="rss",
+            category="crypto",
+            title="Later signal",
+            score=5.0,
+            collected_at=datetime.utcnow() + timedelta(minutes=1),
+        ))
+        test_db.commit()
+        get_cache().flush()
+
+        response = client.get("/signals", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    def test_etag_versions_read_indexed_columns(self):
+        """Test every column behind a table version leads an index, so max() seeks."""
+        for columns in api_main._ETAG_SOURCES.values():
+            for column in columns:
+                leading = {
+                    getattr(index.expressions[0], "name", None)
+                    for index in column.table.indexes
+                }
+                assert column.name in leading, f"{column.table.name}.{column.name}"
+
+    def test_get_signals_total_from_window_count(self, client, test_db, sample_signals):
+        """Test a first page reads its total from count(*) OVER () in one query."""
+        rows, total = SignalRepository(test_db).get_recent_with_total(limit=2)
+        assert len(rows) == 2
+        assert total == 3
+
+        data = client.get("/signals?limit=1").json()
+        assert data["total"] == 3
+        assert get_cache().get(CacheKeys.API_LIST_TOTAL.format(name="signals:24:None:None:0.0")) == 3
+
+    def test_get_signals_cursor_pagination(self, client, sample_signals):
+        """Test walking signals page by page with next_cursor."""
+        first = client.get("/signals?limit=2").json()
+        assert first["next_cursor"]
+        assert first["has_more"] is True
+
+        second = client.get(f"/signals?limit=2&cursor={first['next_cursor']}").json()
+        assert len(second["signals"]) == 1
+        assert second["next_cursor"] is None
+        assert second["has_more"] is False
+
+        ids = [s["id"] for s in first["signals"] + second["signals"]]
+        assert len(set(ids)) == 3
+
+    def test_get_signals_timeline_hourly(self, client, test_db, sample_signals):
+        """Test hourly timeline returns 24 gap-filled buckets."""
+        test_db.add(Signal(
+            source="rss",
+            category="ai",
+            title="Older signal",
+            score=5.0,
+            collected_at=datetime.utcnow() - timedelta(hours=3),
+        ))
+        test_db.commit()
+
+        response = client.get("/signals/timeline?period=24h")
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["slots"]) == 24
+        assert data["slots"][-1]["hour"] == datetime.utcnow().hour
+        assert data["slots"][-1]["count"] == 3
+        assert data["slots"][-4]["count"] == 1
+        assert data["total"] == 4
+
+    def test_get_signals_timeline_daily(self, client, sample_signals):
+        """Test daily timeline returns 7 buckets ending today."""
+        data = client.get("/signals/timeline?period=7d").json()
+        assert len(data["slots"]) == 7
+        assert data["slots"][-1]["count"] == 3
+        assert data["total"] == 3
+
+    def test_get_signals_invalid_cursor(self, client, sample_signals):
+        """Test that a malformed cursor is rejected."""
+        response = client.get("/signals?cursor=not-a-cursor")
+        assert response.status_code == 400
+
+    @pytest.mark.parametrize("values", [["abc", {"x": 1}], [None, "sig-1"], [1.5, 2]])
+    def test_get_signals_cursor_with_mistyped_values(self, client, sample_signals, values):
+        """Test that cursor values not matching the ordering columns are rejected."""
+        from agentic_orchestrator.db.pagination import encode_cursor
+
+        response = client.get(f"/signals?cursor={encode_cursor(values)}")
+        assert response.status_code == 400
+
     def test_get_signals_filter_by_source(self, client, sample_signals):
         """Test filtering signals by source."""
         response = client.get("/signals?source=rss")
@@ -327,6 +494,16 @@ class TestTrendsEndpoint:
         assert len(data["trends"]) == 1
         assert data["trends"][0]["category"] == "crypto"
 
+    def test_get_trends_period_offset(self, client, sample_trends):
+        """Test that period listings page in SQL and report the full total."""
+        first = client.get("/trends?period=24h&limit=1").json()
+        response = client.get("/trends?period=24h&limit=1&offset=1")
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["trends"]) == 1
+        assert data["trends"][0]["id"] != first["trends"][0]["id"]
+        assert data["total"] == 2
+
 
 class TestIdeasEndpoint:
     """Tests for /ideas endpoint."""
@@ -362,6 +539,43 @@ class TestIdeasEndpoint:
         data = response.json()
         assert data["idea"]["title"] == "DeFi Dashboard"
 
+    def test_get_idea_detail_source_debate_first(self, client, test_db, sample_debates):
+        """Test the source debate is listed first and linked debates are not duplicated."""
+        linked = sample_debates[0]
+        idea = test_db.get(Idea, linked.idea_id)
+        source = DebateSession(phase="divergence", round_number=1, max_rounds=3, status="completed")
+        test_db.add(source)
+        test_db.commit()
+        idea.debate_session_id = source.id
+        test_db.commit()
+
+        response = client.get(f"/ideas/{idea.id}")
+        assert response.status_code == 200
+        debates = response.json()["debates"]
+        assert [d["id"] for d in debates] == [source.id, linked.id]
+        assert debates[0]["messages"] == []
+        assert len(debates[1]["messages"]) == debates[1]["message_count"]
+
+    def test_get_idea_detail_query_count(self, client, test_db, sample_debates, sample_plans):
+        """Test idea detail loads its plans, debates and messages in three queries."""
+        idea_id = sample_debates[0].idea_id
+        plan_id = sample_plans[0].id
+        test_db.expunge_all()
+        statements = []
+        engine = test_db.get_bind()
+
+        def listener(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            data = client.get(f"/ideas/{idea_id}").json()
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+        assert len(data["debates"][0]["messages"]) == 2
+        assert [p["id"] for p in data["plans"]] == [plan_id]
+        assert len(statements) == 3
+
     def test_get_idea_detail_not_found(self, client):
         """Test getting non-existent idea."""
         response = client.get("/ideas/nonexistent-id")
@@ -369,6 +583,56 @@ class TestIdeasEndpoint:
         data = response.json()
         assert "error" in data
 
+    def test_get_idea_lineage_source_signals(self, client, test_db, sample_signals):
+        """Test lineage returns stored source signals in their recorded order."""
+        ordered_ids = [sample_signals[2].id, sample_signals[0].id, "missing-id"]
+        idea = Idea(
+            title="Lineage Idea",
+            summary="Idea with source signals",
+            source_type="trend_based",
+            status="pending",
+            extra_metadata={"source_signal_ids": ordered_ids},
+        )
+        test_db.add(idea)
+        test_db.commit()
+
+        response = client.get(f"/ideas/{idea.id}/lineage")
+        assert response.status_code == 200
+        data = response.json()
+        assert [s["id"] for s in data["signals"]] == ordered_ids[:2]
+
+    def test_get_idea_lineage_keyword_fallback(self, client, test_db, sample_signals):
+        """Test lineage falls back to keyword title search without source IDs."""
+        idea = Idea(
+            title="Keyword Idea",
+            summary="Idea with keywords only",
+            source_type="trend_based",
+            status="pending",
+            extra_metadata={"keywords": ["Bitcoin", "ETH"]},
+        )
+        test_db.add(idea)
+        test_db.commit()
+
+        data = client.get(f"/ideas/{idea.id}/lineage").json()
+        titles = [s["title"] for s in data["signals"]]
+        assert titles == ["Bitcoin hits new high", "ETH upgrade complete"]
+
+
+    def test_get_idea_lineage_trend_and_plans(self, client, test_db, sample_trends, sample_plans):
+        """Test lineage resolves the trend by title and lists plan summaries."""
+        idea = sample_plans[0].idea
+        idea.title = "Bitcoin Dashboard"
+        test_db.commit()
+        data = client.get(f"/ideas/{idea.id}/lineage").json()
+        assert data["trend"]["name"] == "Bitcoin Rally"
+        assert data["trend"]["signal_count"] == 5
+        assert data["plans"] == [{
+            "id": sample_plans[0].id,
+            "title": "DeFi Dashboard Plan",
+            "version": 1,
+            "status": "draft",
+        }]
+
 
 class TestPlansEndpoint:
     """Tests for /plans endpoint."""
@@ -380,6 +644,33 @@ class TestPlansEndpoint:
         data = response.json()
         assert data["plans"] == []
 
+    def test_get_plans_streamed_with_etag(self, client, sample_plans):
+        """Test the streamed plan list is complete JSON and keeps its ETag."""
+        response = client.get("/plans?limit=1")
+        assert response.status_code == 200
+        assert "ETag" in response.headers
+        assert response.json() == {
+            "plans": [sample_plans[0].to_dict()],
+            "total": 1,
+            "limit": 1,
+            "offset": 0,
+            "next_cursor": None,
+            "has_more": False,
+        }
+
+    def test_plan_documents_deferred_for_lists(self, test_db, sample_plans):
+        """Test list queries skip the document sections and detail loads them."""
+        plan_id = sample_plans[0].id
+        test_db.expunge_all()
+        repo = PlanRepository(test_db)
+        listed = repo.get_all()[0]
+        assert "prd_content" in sa_inspect(listed).unloaded
+
+        test_db.expunge_all()
+        detail = repo.get_by_id(plan_id, with_documents=True)
+        assert "prd_content" not in sa_inspect(detail).unloaded
+        assert detail.prd_content == "Product requirements..."
+
     def test_get_plans_with_data(self, client, sample_plans):
         """Test getting plans with data."""
         response = client.get("/plans")
@@ -395,6 +686,22 @@ class TestPlansEndpoint:
         data = response.json()
         assert data["title"] == "DeFi Dashboard Plan"
         assert "prd_content" in data
+        assert data["created_at"] == sample_plans[0].created_at.isoformat()
+
+
+class TestProjectsEndpoint:
+    """Tests for /projects endpoint."""
+
+    def test_get_projects_by_status(self, client, test_db, sample_plans):
+        """Test a status-filtered page reports the total of every match."""
+        for i in range(3):
+            test_db.add(Project(plan_id=sample_plans[0].id, name=f"proj-{i}", status="ready"))
+        test_db.add(Project(plan_id=sample_plans[0].id, name="other", status="error"))
+        test_db.commit()
+
+        data = client.get("/projects?status=ready&limit=2").json()
+        assert len(data["projects"]) == 2
+        assert data["total"] == 3
 
 
 class TestDebatesEndpoint:
@@ -413,6 +720,43 @@ class TestDebatesEndpoint:
         assert response.status_code == 200
         data = response.json()
         assert len(data["debates"]) == 1
+        assert data["debates"][0]["message_count"] == 2
+
+    def test_debate_list_counts_messages_in_one_query(self, test_db, sample_debates):
+        """Test sessions come back with their stored message counts in a single SELECT."""
+        test_db.expunge_all()
+        statements = []
+        engine = test_db.get_bind()
+
+        def listener(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            debates = DebateRepository(test_db).get_all_sessions()
+            counts = [d.message_count for d in debates]
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+        assert counts == [2]
+        assert len(statements) == 1
+
+    def test_migrate_message_counts_backfills(self, test_db, sample_debates):
+        """Test the migration recomputes counts that drifted from the messages."""
+        from agentic_orchestrator.scripts.migrate_message_counts import migrate_message_counts
+
+        sample_debates[0].message_count = 0
+        test_db.commit()
+        assert migrate_message_counts(test_db.get_bind()) == 1
+        test_db.refresh(sample_debates[0])
+        assert sample_debates[0].message_count == 2
+        assert migrate_message_counts(test_db.get_bind()) == 0
+
+    def test_debate_list_refuses_lazy_loads(self, test_db, sample_debates):
+        """Test strict loading turns an accidental N+1 into an error."""
+        test_db.expunge_all()
+        debates = DebateRepository(test_db).get_all_sessions()
+        with pytest.raises(InvalidRequestError):
+            _ = debates[0].messages
 
     def test_get_debates_filter_by_status(self, client, sample_debates):
         """Test filtering debates by status."""
@@ -432,6 +776,19 @@ class TestDebatesEndpoint:
         assert len(data["messages"]) == 2
 
 
+    def test_stream_debate_messages(self, client, sample_debates):
+        """Test debate messages stream as NDJSON in creation order."""
+        session_id = sample_debates[0].id
+        response = client.get(f"/debates/{session_id}/messages/stream")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [m["agent_name"] for m in lines] == ["Founder", "VC"]
+
+        missing = client.get("/debates/missing/messages/stream")
+        assert missing.status_code == 404
+
+
 class TestUsageEndpoint:
     """Tests for /usage endpoint."""
 
@@ -454,10 +811,145 @@ class TestActivityEndpoint:
         data = response.json()
         assert data["activities"] == []
 
+    def test_get_activity_merges_all_tables(
+        self, client, test_db, sample_signals, sample_trends, sample_debates, sample_plans
+    ):
+        """Test the feed merges every table newest-first and honours limit."""
+        debate = sample_debates[0]
+        debate.status = "completed"
+        debate.ideas_generated = [{"title": "a"}, {"title": "b"}]
+        debate.completed_at = datetime.utcnow() + timedelta(minutes=5)
+        test_db.commit()
+
+        response = client.get("/activity?limit=50")
+        assert response.status_code == 200
+        data = response.json()
+        # 3 signals + 2 trends + 2 ideas + debate start/complete + 1 plan
+        assert data["total"] == 10
+        assert data["activities"][0]["message"] == "Debate completed: completed - 2 ideas generated"
+        assert {a["type"] for a in data["activities"]} == {"trend", "idea", "debate", "plan"}
+
+        response = client.get("/activity?limit=3")
+        assert len(response.json()["activities"]) == 3
+
+    def test_get_activity_without_orjson(self, client, sample_debates, monkeypatch):
+        """Test the stdlib fallback encodes the same payload."""
+        expected = client.get("/activity").json()
+        monkeypatch.setattr(api_main, "ORJSON_AVAILABLE", False)
+        response = client.get("/activity")
+        assert response.status_code == 200
+        assert response.json() == expected
+        assert expected["total"] >= 1
+
+
+
+class TestPipelineLiveEndpoint:
+    """Tests for /pipeline/live endpoint."""
+
+    def test_pipeline_live_counts(self, client, sample_signals, sample_trends, sample_plans):
+        """Test stage totals and windowed rates from the combined count query."""
+        response = client.get("/pipeline/live")
+        assert response.status_code == 200
+        stages = response.json()["stages"]
+        assert stages["signals"] == {"count": 3, "rate": "+3/hr", "status": "active"}
+        assert stages["trends"]["rate"] == "+2/day"
+        assert stages["ideas"]["count"] == 2
+        assert stages["plans"]["rate"] == "+1/wk"
+        assert stages["projects"] == {"count": 0, "rate": "+0/wk", "status": "idle"}
+        assert response.json()["conversion_rates"]["signals_to_trends"] == 66.7
+
+    def test_pipeline_live_processing_items(self, client, test_db, sample_signals, sample_trends):
+        """Test processing items are grouped by type and limited per type."""
+        sample_trends[1].analyzed_at = datetime.utcnow() - timedelta(minutes=12, seconds=30)
+        test_db.commit()
+
+        processing = client.get("/pipeline/live").json()["processing"]
+        assert [p["type"] for p in processing] == ["SIGNAL"] * 3 + ["TREND"] * 2
+        assert processing[0]["time_ago"] == "just now"
+        assert {p["source"] for p in processing[:3]} == {s.source for s in sample_signals}
+        assert processing[3]["score"] is not None
+        assert processing[4]["time_ago"] == "12m ago"
+
+    def test_pipeline_counts_use_row_estimates(self, test_db, sample_signals, monkeypatch):
+        """Test large tables report the planner estimate and still count their window."""
+        repo = PipelineStatsRepository(test_db)
+        assert repo.count_estimate(Signal) == 3
+        monkeypatch.setattr(repo, "_row_estimates", lambda tables: {"signals": 250000})
+        counts = repo.compute_counts()
+        assert counts["signals"] == {"total": 250000, "recent": 3}
+        assert counts["ideas"] == {"total": 0, "recent": 0}
+
+    def test_pipeline_live_conditional_get(self, client, sample_signals):
+        """Test polls with the current ETag get 304 until the payload changes."""
+        first = client.get("/pipeline/live")
+        assert first.headers["Cache-Control"] == "no-cache"
+        etag = first.headers["ETag"]
+
+        cached = client.get("/pipeline/live", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.headers["ETag"] == etag
+
+        api_main._local_responses.clear()
+        get_cache().flush()
+        app.dependency_overrides[get_now] = lambda: datetime.utcnow() + timedelta(minutes=1)
+        changed = client.get("/pipeline/live", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["ETag"] != etag
+
+    def test_pipeline_live_shared_across_workers(self, client, test_db, sample_signals):
+        """Test a worker with a cold local cache is answered from the shared layer."""
+        first = client.get("/pipeline/live").json()
+        test_db.add(Signal(source="rss", category="ai", title="Another", score=1.0))
+        test_db.commit()
+
+        # Another worker: empty per-process cache, same Redis
+        api_main._local_responses.clear()
+        before = client.get("/cache/stats").json()["shared"]
+        assert client.get("/pipeline/live").json() == first
+        after = client.get("/cache/stats").json()["shared"]
+        assert after["hits"] == before["hits"] + 1
+
+    def test_pipeline_live_uses_in_process_rollup(self, client, test_db, sample_signals, monkeypatch):
+        """Test counts from this process's last refresh skip the snapshot read."""
+        counts = PipelineStatsRepository(test_db).compute_counts()
+        counts["signals"] = {"total": 99, "recent": 9}
+        monkeypatch.setattr(api_main, "_latest_pipeline_stats", (datetime.utcnow(), counts))
+
+        stages = client.get("/pipeline/live").json()["stages"]
+        assert stages["signals"]["count"] == 99
+        assert stages["signals"]["rate"] == "+9/hr"
+
+    def test_pipeline_live_reads_snapshot(self, client, test_db, sample_signals):
+        """Test a fresh rollup snapshot is served and a stale one is ignored."""
+        repo = PipelineStatsRepository(test_db)
+        snapshot = repo.refresh()
+        snapshot.counts = {**snapshot.counts, "signals": {"total": 42, "recent": 7}}
+        test_db.commit()
+
+        stages = client.get("/pipeline/live").json()["stages"]
+        assert stages["signals"]["count"] == 42
+        assert stages["signals"]["rate"] == "+7/hr"
+
+        snapshot.computed_at = datetime.utcnow() - timedelta(hours=1)
+        test_db.commit()
+        api_main._local_responses.clear()
+        get_cache().flush()
+        stages = client.get("/pipeline/live").json()["stages"]
+        assert stages["signals"]["count"] == 3
+
 
 class TestAgentsEndpoint:
     """Tests for /agents endpoint."""
 
+    def test_agents_conditional_get(self, client):
+        """Test the per-phase ETag is stable and a match returns 304."""
+        etag = client.get("/agents").headers["ETag"]
+        assert client.get("/agents?phase=planning").headers["ETag"] != etag
+
+        cached = client.get("/agents", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+
     def test_get_all_agents(self, client):
         """Test getting all agents."""
         response = client.get("/agents")
@@ -501,3 +993,9 @@ class TestAgentsEndpoint:
         assert data["total"] == 10
         for agent in data["agents"]:
             assert agent["phase"] == "planning"
+
+    def test_get_agents_unknown_phase(self, client):
+        """Test an unknown phase returns no agents."""
+        response = client.get("/agents?phase=unknown")
+        assert response.status_code == 200
+        assert response.json() == {"agents": [], "total": 0}
@@ -2,6 +2,7 @@
 
 import os
 import tempfile
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -116,6 +117,21 @@ class TestGitHubIssue:
         assert issue.labels == ["type:idea", "status:backlog"]
         assert issue.user == "testuser"
 
+    def test_from_api_response_interns_labels(self):
+        """Test parsed label names are the interned Labels constants."""
+        api_response = {
+            "number": 1,
+            "title": "API Issue",
+            "body": None,
+            "labels": [{"name": "".join(["type:", "idea"])}],
+            "state": "open",
+            "html_url": "",
+            "created_at": "2024-01-01T00:00:00Z",
+            "updated_at": "2024-01-01T00:00:00Z",
+        }
+        issue = GitHubIssue.from_api_response(api_response)
+        assert issue.labels[0] is Labels.TYPE_IDEA
+
 
 class TestGitHubClient:
     """Test GitHubClient class."""
@@ -164,6 +180,33 @@ class TestGitHubClient:
         with GitHubClient(token="test", owner="test", repo="test") as client:
             assert client is not None
 
+    def test_close_with_error_single_patch(self):
+        """Test close_with_error closes, relabels and explains in one request."""
+        client = GitHubClient(token="test", owner="test", repo="test")
+        response = {
+            "number": 2,
+            "title": "[PLAN] Test",
+            "body": "",
+            "labels": [],
+            "state": "closed",
+            "html_url": "",
+            "created_at": "2024-01-01T00:00:00Z",
+            "updated_at": "2024-01-01T00:00:00Z",
+        }
+        with patch.object(client, "_request", return_value=response) as request:
+            client.close_with_error(2, ["type:plan"], "Error: boom", "Plan body\n")
+        client.close()
+
+        request.assert_called_once()
+        method, path = request.call_args[0]
+        assert method == "PATCH"
+        assert path == "/repos/test/test/issues/2"
+        assert request.call_args[1]["json"] == {
+            "body": "Plan body\n\n---\n\nError: boom",
+            "state": "closed",
+            "labels": ["type:plan"],
+        }
+
 
 class TestBacklogOrchestrator:
     """Test BacklogOrchestrator class."""
@@ -214,6 +257,83 @@ class TestBacklogOrchestrator:
                         assert status["backlog"]["ideas"] == 0
                         assert status["pending_promotion"]["ideas_to_plan"] == 0
 
+    def test_run_cycle_fetches_open_plans_once(self):
+        """Test rejections, the plan index and dev promotions share one open-plan fetch."""
+        from agentic_orchestrator.backlog import BacklogOrchestrator
+
+        def issue(number, labels, body=""):
+            return GitHubIssue(
+                number=number,
+                title=f"#{number}",
+                body=body,
+                labels=labels,
+                state="open",
+                html_url="",
+                created_at="2024-01-01T00:00:00Z",
+                updated_at="2024-01-01T00:00:00Z",
+            )
+
+        rejected = issue(30, [Labels.TYPE_PLAN, Labels.REJECT_PLAN], "**Source Idea:** #1")
+        to_dev = issue(31, [Labels.TYPE_PLAN, Labels.PROMOTE_TO_DEV], "**Source Idea:** #3")
+        planned = issue(32, [Labels.TYPE_PLAN], "**Source Idea:** #2")
+        github = MagicMock(spec=GitHubClient)
+        github.find_open_plans.return_value = [rejected, to_dev, planned]
+        github.find_ideas_to_promote.return_value = [
+            issue(1, [Labels.TYPE_IDEA, Labels.PROMOTE_TO_PLAN]),
+            issue(2, [Labels.TYPE_IDEA, Labels.PROMOTE_TO_PLAN]),
+        ]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            orchestrator = BacklogOrchestrator(base_path=Path(tmpdir), dry_run=True)
+            orchestrator._github = github
+            orchestrator._dev_scaffolder = MagicMock()
+            generator = orchestrator.plan_generator
+            existing = {}
+
+            def generate(idea):
+                existing[idea.number] = generator._find_existing_plan_for_idea(idea.number)
+
+            with (
+                patch.object(orchestrator, "_process_rejected_plan", return_value=True) as reject,
+                patch.object(generator, "generate_plan_from_idea", side_effect=generate),
+            ):
+                results = orchestrator.run_cycle(generate_ideas=False)
+
+        github.find_open_plans.assert_called_once()
+        github.search_issues.assert_not_called()
+        github.find_rejected_plans.assert_not_called()
+        github.find_plans_to_promote.assert_not_called()
+        reject.assert_called_once_with(rejected)
+        # Idea #2 already has an open plan, so it is filtered out before generation
+        assert existing == {1: []}
+        orchestrator._dev_scaffolder.scaffold_from_plan.assert_called_once_with(to_dev)
+        assert results["plans_rejected"] == 1
+
+    @patch.dict(
+        os.environ,
+        {
+            "GITHUB_TOKEN": "test-token",
+            "GITHUB_OWNER": "test-owner",
+            "GITHUB_REPO": "test-repo",
+            "DRY_RUN": "true",
+        },
+    )
+    def test_extract_idea_number_from_plan(self):
+        """Test source idea references are found in order of reliability."""
+        from agentic_orchestrator.backlog import BacklogOrchestrator
+
+        orchestrator = BacklogOrchestrator()
+
+        def plan(body):
+            return MagicMock(body=body)
+
+        assert orchestrator._extract_idea_number_from_plan(plan("**Source Idea:** #12")) == 12
+        assert (
+            orchestrator._extract_idea_number_from_plan(plan("See idea #3\nSource Idea: #9")) == 9
+        )
+        assert orchestrator._extract_idea_number_from_plan(plan("Built FROM IDEA #4")) == 4
+        assert orchestrator._extract_idea_number_from_plan(plan("No reference")) is None
+
 
 class TestIdeaGenerator:
     """Test IdeaGenerator class."""
@@ -237,6 +357,298 @@ class TestIdeaGenerator:
         assert generator.dry_run is True
         github.close()
 
+    def test_parse_idea_response_sections(self):
+        """Test title and section extraction from a generated idea."""
+        from agentic_orchestrator.backlog import IdeaGenerator
+
+        generator = IdeaGenerator(github=MagicMock(), dry_run=True)
+        response = (
+            "## Title\nMoss Wallet (Beta)\n\n"
+            "## Problem\nKeys are hard.\n\n"
+            "## Target User\nNew holders\n\n"
+            "## 성공 지표\n월간 사용자 1000명\n"
+        )
+        parsed = generator._parse_idea_response(response)
+
+        assert parsed["title"] == "Moss Wallet (Beta)"
+        assert "Keys are hard." in parsed["body"]
+        assert "월간 사용자 1000명" in parsed["body"]
+        assert "## Why Mossland\n\n(Not provided)" in parsed["body"]
+
+    def test_parse_idea_response_without_korean(self):
+        """Test a response without the Korean half gets one note, not empty sections."""
+        from agentic_orchestrator.backlog import IdeaGenerator
+
+        generator = IdeaGenerator(github=MagicMock(), dry_run=True)
+        parsed = generator._parse_idea_response("## Title\nMoss Wallet\n\n## Problem\nKeys.\n")
+
+        assert "*(Korean translation not available)*" in parsed["body"]
+        assert "## 개요" not in parsed["body"]
+        assert "## Overview\n\nKeys." in parsed["body"]
+
+    def test_generate_ideas_concurrently(self):
+        """Test ideas are generated concurrently and failures are skipped."""
+        from agentic_orchestrator.backlog import IdeaGenerator
+
+        github = MagicMock()
+        github.create_issue.side_effect = lambda title, body, labels: MagicMock(
+            number=int(title.split()[-1]), title=title
+        )
+        generator = IdeaGenerator(github=github, claude=MagicMock(), dry_run=False)
+        contents = iter([{"title": f"Idea {n}", "body": ""} for n in range(5)])
+
+        def fake_content(generated_at=None):
+            idea = next(contents)
+            if idea["title"] == "Idea 2":
+                raise RuntimeError("provider failed")
+            return idea
+
+        with patch.object(generator, "_generate_idea_content", side_effect=fake_content):
+            created = generator.generate_ideas(count=5)
+
+        assert sorted(issue.number for issue in created) == [0, 1, 3, 4]
+        assert github.create_issue.call_count == 4
+
+    def test_generate_ideas_async_runs_off_loop(self):
+        """Test the async entry point leaves the event loop free while generating."""
+        import asyncio
+        import threading
+
+        from agentic_orchestrator.backlog import IdeaGenerator
+
+        generator = IdeaGenerator(github=MagicMock(), claude=MagicMock(), dry_run=True)
+        threads = []
+
+        def fake_generate(count):
+            threads.append(threading.get_ident())
+            return [MagicMock(number=n) for n in range(count)]
+
+        async def run():
+            with patch.object(generator, "generate_ideas", side_effect=fake_generate):
+                created = await generator.generate_ideas_async(count=2)
+            return created, threading.get_ident()
+
+        created, loop_thread = asyncio.run(run())
+
+        assert [issue.number for issue in created] == [0, 1]
+        assert threads and threads[0] != loop_thread
+
+    def test_parse_sections(self):
+        """Test markdown is split on level-2 headers only."""
+        from agentic_orchestrator.backlog import _parse_sections
+
+        sections = _parse_sections(
+            "intro\n## MVP Scope\n- one\n### Detail\n- two\n## mvp scope\nlater\n## Risks\n"
+        )
+
+        assert sections == {"mvp scope": "- one\n### Detail\n- two", "risks": ""}
+        assert _parse_sections("no headers at all") == {}
+
+
+class TestTrendBasedIdeaGenerator:
+    """Test TrendBasedIdeaGenerator class."""
+
+    def test_identical_trend_prompt_is_not_reused(self):
+        """Test a repeated trend prompt asks the provider again instead of reusing an idea."""
+        from agentic_orchestrator.backlog import TrendBasedIdeaGenerator
+        from agentic_orchestrator.trends import Trend
+
+        claude = MagicMock()
+        claude.chat.return_value = "## Title\nAgent Bounty Board\n\n## Problem\nNo bounties.\n"
+        generator = TrendBasedIdeaGenerator(
+            github=MagicMock(), claude=claude, config={}, dry_run=False
+        )
+        trend = Trend(
+            topic="AI agents on-chain",
+            keywords=["agents"],
+            score=8.5,
+            time_period="24h",
+            sources=["feed"],
+            article_count=3,
+            sample_headlines=["Agents trade"],
+            category="crypto",
+            summary="Agents are trading.",
+        )
+
+        generator._generate_idea_from_trend(trend)
+        generator._generate_idea_from_trend(trend)
+
+        assert claude.chat.call_count == 2
+
+    def test_batched_generation_falls_back_for_missing_ideas(self):
+        """Test one completion covers all trends and a cut-off idea is generated alone."""
+        from agentic_orchestrator.backlog import TrendBasedIdeaGenerator
+        from agentic_orchestrator.cache import get_cache
+
+        get_cache().flush()
+        claude = MagicMock()
+        claude.chat.side_effect = [
+            "## Trend Number: 1\n## Title\nRestake Radar\n\n## Problem\nOpaque yields.\n"
+            "--- IDEA SEPARATOR ---\n## Trend Number: 2\n## Title\nStable",
+            "## Title\nStable Pay Links\n\n## Problem\nHard checkout.\n",
+        ]
+        github = MagicMock()
+        github.create_issue.side_effect = lambda title, body, labels: MagicMock(
+            number=len(github.create_issue.call_args_list), title=title
+        )
+        generator = TrendBasedIdeaGenerator(github=github, claude=claude, config={}, dry_run=False)
+        generator._storage = MagicMock()
+        trends = [
+            MagicMock(
+                topic="Restaking", score=9.0, keywords=[], sample_headlines=[], idea_seeds=[]
+            ),
+            MagicMock(
+                topic="Stablecoins", score=8.0, keywords=[], sample_headlines=[], idea_seeds=[]
+            ),
+        ]
+
+        with patch.object(generator, "_get_top_trends", return_value=trends):
+            created = generator.generate_trend_based_ideas(count=2, analyses={"24h": MagicMock()})
+
+        assert claude.chat.call_count == 2
+        assert "Stablecoins" in claude.chat.call_args.kwargs["user_message"]
+        assert "Restaking" not in claude.chat.call_args.kwargs["user_message"]
+        assert [issue.title for issue in created] == [
+            "[IDEA] Restake Radar",
+            "[IDEA] Stable Pay Links",
+        ]
+        assert generator._storage.link_idea_to_trend.call_count == 2
+        first, second = (c.args[0] for c in generator._storage.link_idea_to_trend.call_args_list)
+        assert first.analysis_date == second.analysis_date
+        assert first.analysis_date.utcoffset() == timedelta(0)
+        get_cache().flush()
+
+    def test_batched_ideas_are_keyed_by_trend_number(self):
+        """Test a skipped idea does not shift later ideas onto the wrong trend."""
+        from agentic_orchestrator.backlog import TrendBasedIdeaGenerator
+        from agentic_orchestrator.cache import get_cache
+
+        get_cache().flush()
+        claude = MagicMock()
+        claude.chat.return_value = (
+            "## Trend Number: 3\n## Title\nStable Pay Links\n\n## Problem\nHard checkout.\n"
+            "--- IDEA SEPARATOR ---\n"
+            "## Title\nUntagged Idea\n\n## Problem\nNo trend.\n"
+            "--- IDEA SEPARATOR ---\n"
+            "## Trend Number: 1\n## Title\nRestake Radar\n\n## Problem\nOpaque yields.\n"
+        )
+        generator = TrendBasedIdeaGenerator(
+            github=MagicMock(), claude=claude, config={}, dry_run=False
+        )
+        trends = [
+            MagicMock(topic=topic, score=8.0, keywords=[], sample_headlines=[], idea_seeds=[])
+            for topic in ("Restaking", "Oracles", "Stablecoins")
+        ]
+
+        ideas = generator._generate_ideas_from_trends_batch(trends)
+
+        assert ideas[0]["title"] == "Restake Radar"
+        assert ideas[1] is None
+        assert ideas[2]["title"] == "Stable Pay Links"
+        assert "**Source Trend:** Stablecoins" in ideas[2]["body"]
+        assert "Trend Number" not in ideas[2]["body"]
+        get_cache().flush()
+
+    def test_get_top_trends_dedupes_by_topic(self):
+        """Test top trends are distinct topics by score, 24h first on ties."""
+        from agentic_orchestrator.backlog import TrendBasedIdeaGenerator
+        from agentic_orchestrator.trends import Trend
+
+        def trend(topic, score):
+            return Trend(
+                topic=topic,
+                keywords=[],
+                score=score,
+                time_period="24h",
+                sources=[],
+                article_count=1,
+                sample_headlines=[],
+                category="crypto",
+                summary="",
+            )
+
+        def trends(*pairs):
+            return MagicMock(trends=[trend(t, s) for t, s in pairs])
+
+        generator = TrendBasedIdeaGenerator(github=MagicMock(), config={}, dry_run=True)
+        analyses = {
+            "1m": trends(("Restaking", 9.0), ("ZK Proofs", 7.0)),
+            "1w": trends(("restaking", 9.5), ("Stablecoins", 7.0)),
+            "24h": trends(("Stablecoins", 7.0), ("AI Agents", 6.0)),
+        }
+
+        top = generator._get_top_trends(analyses, count=3)
+
+        assert [t.topic for t in top] == ["restaking", "Stablecoins", "ZK Proofs"]
+        assert top[1] is analyses["24h"].trends[0]
+        assert trend("STRASSE", 1.0).topic_fold == trend("strasse", 1.0).topic_fold
+
+
+class TestFeedFetcher:
+    """Test FeedFetcher used by trend analysis."""
+
+    def test_fetch_all_feeds_concurrently(self):
+        """Test feeds are fetched concurrently, deduplicated in order, failures skipped."""
+        from agentic_orchestrator.trends import FeedFetcher
+
+        config = MagicMock()
+        config.get.side_effect = lambda *keys, default=None: default
+        fetcher = FeedFetcher(config=config, client=MagicMock())
+        fetcher._feed_configs = [MagicMock(name=n, url=n) for n in ("slow", "broken", "fast")]
+
+        def fetch(feed_config):
+            if feed_config.url == "broken":
+                raise ValueError("Feed parse error")
+            if feed_config.url == "slow":
+                time.sleep(0.05)
+                return [MagicMock(link="a"), MagicMock(link="shared")]
+            return [MagicMock(link="shared"), MagicMock(link="b")]
+
+        with patch.object(fetcher, "fetch_feed", side_effect=fetch):
+            items = fetcher.fetch_all_feeds()
+
+        assert [item.link for item in items] == ["a", "shared", "b"]
+
+
+class TestTrendStorage:
+    """Test TrendStorage persistence used by trend-based ideas."""
+
+    def test_saved_analysis_loads_trends(self, tmp_path):
+        """Test trends survive a save/load round trip for every period."""
+        from agentic_orchestrator.trends import Trend, TrendAnalysis, TrendStorage
+
+        config = MagicMock()
+        config.get.side_effect = lambda *keys, default=None: default
+        storage = TrendStorage(base_path=tmp_path, config=config)
+        date = datetime(2026, 1, 8)
+
+        def analysis(period, *topics):
+            trends = [
+                Trend(
+                    topic=topic,
+                    keywords=["ai"],
+                    score=9.0 - i,
+                    time_period=period,
+                    sources=["feed"],
+                    article_count=3,
+                    sample_headlines=[],
+                    category="ai",
+                    summary="Trending.",
+                )
+                for i, topic in enumerate(topics)
+            ]
+            return TrendAnalysis(date, period, trends, 10, ["feed"])
+
+        storage.save_analysis(
+            {"24h": analysis("24h", "Agents", "Memory"), "1w": analysis("1w", "Coding Models")},
+            date=date,
+        )
+        loaded = storage.load_analysis(date)
+
+        assert [t.topic for t in loaded["24h"].trends] == ["Agents", "Memory"]
+        assert [t.topic for t in loaded["1w"].trends] == ["Coding Models"]
+        assert loaded["24h"].trends[1].keywords == ["ai"]
+
 
 class TestPlanGenerator:
     """Test PlanGenerator class."""
@@ -260,6 +672,162 @@ class TestPlanGenerator:
         assert generator.dry_run is True
         github.close()
 
+    def test_dry_run_skips_generation(self):
+        """Test dry runs return before any LLM call or debate session."""
+        from agentic_orchestrator.backlog import PlanGenerator
+
+        github = MagicMock(spec=GitHubClient)
+        github.search_issues.return_value = []
+        claude = MagicMock()
+        generator = PlanGenerator(github=github, claude=claude, dry_run=True)
+        idea = GitHubIssue(
+            number=7,
+            title="[IDEA] Test Idea",
+            body="Test body",
+            labels=[Labels.TYPE_IDEA, Labels.PROMOTE_TO_PLAN],
+            state="open",
+            html_url="",
+            created_at="2024-01-01T00:00:00Z",
+            updated_at="2024-01-01T00:00:00Z",
+        )
+
+        generator.enable_debate = False
+        assert generator.generate_plan_from_idea(idea) is None
+
+        generator.enable_debate = True
+        with (
+            patch.object(generator, "_all_providers_available", return_value=True),
+            patch("agentic_orchestrator.backlog.create_debate_session") as create_session,
+        ):
+            assert generator.generate_plan_from_idea(idea) is None
+
+        claude.chat.assert_not_called()
+        create_session.assert_not_called()
+        github.create_issue.assert_not_called()
+
+    def test_plan_prompt_caches_static_template(self):
+        """Test the plan template is the cached system prompt and the idea follows it."""
+        from agentic_orchestrator.backlog import PlanGenerator
+        from agentic_orchestrator.cache import get_cache
+
+        get_cache().flush()
+        claude = MagicMock()
+        claude.chat.return_value = "## 1. PRD"
+        generator = PlanGenerator(github=MagicMock(spec=GitHubClient), claude=claude)
+        idea = GitHubIssue(
+            number=7,
+            title="[IDEA] Agent Bounty Board",
+            body="Agents post bounties.",
+            labels=[Labels.TYPE_IDEA],
+            state="open",
+            html_url="",
+            created_at="2024-01-01T00:00:00Z",
+            updated_at="2024-01-01T00:00:00Z",
+        )
+
+        body = generator._generate_plan_content(idea)
+
+        kwargs = claude.chat.call_args.kwargs
+        assert kwargs["cache_system"] is True
+        assert "## 6. Timeline Estimate" in kwargs["system_message"]
+        assert "Agent Bounty Board" not in kwargs["system_message"]
+        assert "Agents post bounties." in kwargs["user_message"]
+        assert "**Source Idea:** #7" in body
+
+    def test_plan_response_cached_until_forgotten(self):
+        """Test an unchanged idea reuses its plan response until it is forgotten."""
+        from agentic_orchestrator.backlog import PlanGenerator
+        from agentic_orchestrator.cache import get_cache
+
+        get_cache().flush()
+        claude = MagicMock()
+        claude.chat.return_value = "## 1. PRD"
+        generator = PlanGenerator(github=MagicMock(spec=GitHubClient), claude=claude)
+        idea = GitHubIssue(
+            number=8,
+            title="[IDEA] Agent Bounty Board",
+            body="Agents post bounties.",
+            labels=[Labels.TYPE_IDEA],
+            state="open",
+            html_url="",
+            created_at="2024-01-01T00:00:00Z",
+            updated_at="2024-01-01T00:00:00Z",
+        )
+
+        generator._generate_plan_content(idea)
+        generator._generate_plan_content(idea)
+        assert claude.chat.call_count == 1
+
+        idea.body = "Agents post and claim bounties."
+        generator._generate_plan_content(idea)
+        assert claude.chat.call_count == 2
+
+        generator.forget_cached_plan(idea.number)
+        generator._generate_plan_content(idea)
+        assert claude.chat.call_count == 3
+        get_cache().flush()
+
+    def test_prefetch_plan_contents_batches_ideas(self):
+        """Test promoted ideas are planned in one batch and then read from the cache."""
+        from agentic_orchestrator.backlog import PlanGenerator
+        from agentic_orchestrator.cache import get_cache
+
+        get_cache().flush()
+        claude = MagicMock(mode="api")
+        claude.chat_batch.return_value = ["## Plan A", None]
+        generator = PlanGenerator(
+            github=MagicMock(spec=GitHubClient),
+            claude=claude,
+            enable_debate=False,
+            batch_plans=True,
+        )
+        generator._planned_ideas = {}
+        ideas = [
+            GitHubIssue(
+                number=n,
+                title=f"[IDEA] Idea {n}",
+                body="Body",
+                labels=[Labels.TYPE_IDEA],
+                state="open",
+                html_url="",
+                created_at="2024-01-01T00:00:00Z",
+                updated_at="2024-01-01T00:00:00Z",
+            )
+            for n in (21, 22)
+        ]
+
+        assert generator.prefetch_plan_contents(ideas) == 1
+        assert len(claude.chat_batch.call_args.args[0]) == 2
+        assert claude.chat_batch.call_args.kwargs["max_wait"] == generator.batch_max_wait
+
+        assert "## Plan A" in generator._generate_plan_content(ideas[0])
+        claude.chat.assert_not_called()
+        generator._generate_plan_content(ideas[1])
+        claude.chat.assert_called_once()
+        get_cache().flush()
+
+    def test_all_providers_available_cached(self):
+        """Test provider availability is probed once until invalidated."""
+        from agentic_orchestrator.backlog import PlanGenerator
+
+        providers = [MagicMock() for _ in range(3)]
+        for provider in providers:
+            provider.is_available.return_value = True
+        generator = PlanGenerator(
+            github=MagicMock(spec=GitHubClient),
+            claude=providers[0],
+            openai=providers[1],
+            gemini=providers[2],
+        )
+
+        assert generator._all_providers_available() is True
+        assert generator._all_providers_available() is True
+        assert all(p.is_available.call_count == 1 for p in providers)
+
+        generator.invalidate_availability_cache()
+        assert generator._all_providers_available() is True
+        assert all(p.is_available.call_count == 2 for p in providers)
+
 
 class TestDevScaffolder:
     """Test DevScaffolder class."""
@@ -399,6 +967,39 @@ class TestPlanGeneratorIdempotency:
 
         github.close()
 
+    def test_planned_idea_index_searches_once(self):
+        """Test the per-cycle plan index answers every idea from one search."""
+        from agentic_orchestrator.backlog import PlanGenerator
+
+        def plan(number, body):
+            return GitHubIssue(
+                number=number,
+                title=f"[PLAN] {number}",
+                body=body,
+                labels=[Labels.TYPE_PLAN],
+                state="open",
+                html_url="",
+                created_at="2024-01-01T00:00:00Z",
+                updated_at="2024-01-01T00:00:00Z",
+            )
+
+        github = MagicMock()
+        github.search_issues.return_value = [
+            plan(20, "**Source Idea:** #1"),
+            plan(21, "Generated from idea #12"),
+        ]
+        generator = PlanGenerator(github=github, dry_run=True)
+
+        generator.refresh_planned_idea_index()
+        assert [p.number for p in generator._find_existing_plan_for_idea(1)] == [20]
+        assert [p.number for p in generator._find_existing_plan_for_idea(12)] == [21]
+        assert generator._find_existing_plan_for_idea(2) == []
+        assert github.search_issues.call_count == 1
+
+        generator.clear_planned_idea_index()
+        assert generator._find_existing_plan_for_idea(1)[0].number == 20
+        assert github.search_issues.call_count == 2
+
 
 class TestDevScaffolderIdempotency:
     """Test DevScaffolder idempotency protection."""
@@ -504,6 +1105,33 @@ class TestDevScaffolderIdempotency:
 
         github.close()
 
+    def test_find_existing_project_uses_index(self):
+        """Test projects are indexed by exact plan number from one directory walk."""
+        from agentic_orchestrator.backlog import DevScaffolder
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base_path = Path(tmpdir)
+            scaffolder = DevScaffolder(github=MagicMock(), base_path=base_path)
+            plan = GitHubIssue(
+                number=12,
+                title="[PLAN] Test Plan",
+                body="**Source Idea:** #1",
+                labels=[Labels.TYPE_PLAN],
+                state="open",
+                html_url="https://github.com/test/repo/issues/12",
+                created_at="2024-01-01T00:00:00Z",
+                updated_at="2024-01-01T00:00:00Z",
+            )
+            scaffolder._create_project_structure(base_path / "projects" / "p-12", plan, "p-12")
+
+            assert scaffolder._find_existing_project_for_plan(12) == "p-12"
+            # Neither the idea reference (#1) nor a prefix of #12 counts
+            assert scaffolder._find_existing_project_for_plan(1) is None
+
+            with patch.object(scaffolder, "_index_projects") as index:
+                assert scaffolder._find_existing_project_for_plan(12) == "p-12"
+            index.assert_not_called()
+
 
 class TestBacklogOrchestratorLockTimeout:
     """Test BacklogOrchestrator lock timeout mechanism."""
@@ -545,6 +1173,30 @@ class TestBacklogOrchestratorLockTimeout:
             # Lock should be removed
             assert not lock_path.exists()
 
+    @patch.dict(
+        os.environ,
+        {
+            "GITHUB_TOKEN": "test-token",
+            "GITHUB_OWNER": "test-owner",
+            "GITHUB_REPO": "test-repo",
+            "DRY_RUN": "true",
+        },
+    )
+    def test_plan_batch_wait_stays_under_lock_timeout(self):
+        """Test the plan batch is cancelled long before the lock could be taken as stale."""
+        from agentic_orchestrator.backlog import BacklogOrchestrator
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            orchestrator = BacklogOrchestrator(base_path=Path(tmpdir))
+
+            def mock_get(*args, **kwargs):
+                if args == ("orchestrator", "lock_timeout_seconds"):
+                    return 120
+                return kwargs.get("default")
+
+            with patch.object(orchestrator.config, "get", side_effect=mock_get):
+                assert orchestrator.plan_generator.batch_max_wait == 40
+
     @patch.dict(
         os.environ,
         {
@@ -639,6 +1291,42 @@ class TestBacklogOrchestratorLockTimeout:
             # Lock should be removed
             assert not lock_path.exists()
 
+    @patch.dict(
+        os.environ,
+        {
+            "GITHUB_TOKEN": "test-token",
+            "GITHUB_OWNER": "test-owner",
+            "GITHUB_REPO": "test-repo",
+            "DRY_RUN": "true",
+        },
+    )
+    def test_acquire_lock_exclusive(self):
+        """Test the lock file is created exclusively and replaced when stale."""
+        from datetime import datetime
+
+        from agentic_orchestrator.backlog import BacklogOrchestrator
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base_path = Path(tmpdir)
+            first = BacklogOrchestrator(base_path=base_path)
+            second = BacklogOrchestrator(base_path=base_path)
+            lock_path = base_path / ".agent" / "orchestrator.lock"
+
+            assert first.acquire_lock() is True
+            assert lock_path.read_text().split("\n")[0] == str(os.getpid())
+            assert second.acquire_lock() is False
+            # The lock is published whole; no temp files are left behind
+            assert [p.name for p in lock_path.parent.iterdir()] == ["orchestrator.lock"]
+
+            first.release_lock()
+            assert not lock_path.exists()
+
+            # A lock left behind by a dead process is replaced
+            lock_path.write_text(f"999999\n{datetime.now().isoformat()}")
+            with patch.object(second, "_is_process_alive", return_value=False):
+                assert second.acquire_lock() is True
+            second.release_lock()
+
     @patch.dict(
         os.environ,
         {
@@ -737,9 +1425,66 @@ class TestPlanGeneratorRollback:
         with pytest.raises(Exception, match="Label update failed"):
             generator.generate_plan_from_idea(idea)
 
-        # Verify rollback was attempted - plan should be closed
-        github.update_issue.assert_called_once()
-        call_args = github.update_issue.call_args
+        # Verify rollback was attempted - plan should be closed in one call
+        github.close_with_error.assert_called_once()
+        call_args = github.close_with_error.call_args
         assert call_args[0][0] == 2  # plan number
-        assert call_args[1]["state"] == "closed"
         assert "rollback:failed" in call_args[1]["labels"]
+        assert call_args[1]["original_body"] == "Plan body"
+        assert all(c.args[0] != 2 for c in github.add_comment.call_args_list)
+        # The idea only gets the failure note, not a link to the rolled-back plan
+        assert all("#2" not in c.args[1] for c in github.add_comment.call_args_list)
+
+    @patch.dict(
+        os.environ,
+        {
+            "GITHUB_TOKEN": "test-token",
+            "GITHUB_OWNER": "test-owner",
+            "GITHUB_REPO": "test-repo",
+        },
+    )
+    def test_idea_comment_failure_keeps_plan(self):
+        """Test a failed cross-reference comment on the idea does not roll back."""
+        from agentic_orchestrator.backlog import PlanGenerator
+
+        github = MagicMock(spec=GitHubClient)
+        created_plan = GitHubIssue(
+            number=2,
+            title="[PLAN] Test",
+            body="Plan body",
+            labels=[Labels.TYPE_PLAN],
+            state="open",
+            html_url="",
+            created_at="2024-01-01T00:00:00Z",
+            updated_at="2024-01-01T00:00:00Z",
+        )
+        github.create_issue.return_value = created_plan
+        github.search_issues.return_value = []
+
+        def add_comment(number, body):
+            if number == 1:
+                raise Exception("Comment failed")
+
+        github.add_comment.side_effect = add_comment
+
+        generator = PlanGenerator(github=github, dry_run=False)
+        generator.enable_debate = False
+        mock_claude = MagicMock()
+        mock_claude.chat.return_value = "## Plan content\nTest plan"
+        generator._claude = mock_claude
+
+        idea = GitHubIssue(
+            number=1,
+            title="[IDEA] Test Idea",
+            body="Test body",
+            labels=[Labels.TYPE_IDEA, Labels.PROMOTE_TO_PLAN],
+            state="open",
+            html_url="",
+            created_at="2024-01-01T00:00:00Z",
+            updated_at="2024-01-01T00:00:00Z",
+        )
+
+        assert generator.generate_plan_from_idea(idea) is created_plan
+        github.mark_idea_as_planned.assert_called_once_with(1)
+        github.close_with_error.assert_not_called()
+        assert [c.args[0] for c in github.add_comment.call_args_list].count(2) == 1
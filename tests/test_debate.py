@@ -420,3 +420,41 @@ class TestDebateFlow:
 
         assert support_msg.references == ["msg-001"]
         assert challenge_msg.references == ["msg-001"]
+
+
+class TestDebateSession:
+    """Tests for the PLAN debate session."""
+
+    def test_feedback_roles_run_concurrently(self):
+        """Reviewer feedback within a round is requested concurrently, in role order."""
+        import threading
+        from unittest.mock import MagicMock
+
+        from agentic_orchestrator.debate.debate_session import DebateSession
+        from agentic_orchestrator.debate.roles import get_feedback_roles, get_role_config
+
+        feedback_prompts = {get_role_config(role).system_prompt for role in get_feedback_roles()}
+        barrier = threading.Barrier(len(feedback_prompts), timeout=5)
+
+        def chat(user_message, system_message=None):
+            if system_message in feedback_prompts:
+                # Only passes once every reviewer call is in flight at the same time
+                barrier.wait()
+                return f"feedback from {system_message[:20]}"
+            return "[PLAN_START]\nPlan\n[PLAN_END]\n**Sufficiently Improved**"
+
+        provider = MagicMock()
+        provider.chat.side_effect = chat
+        session = DebateSession(
+            idea_title="Idea",
+            idea_content="Body",
+            idea_issue_number=1,
+            providers={"claude": provider, "openai": provider, "gemini": provider},
+            max_rounds=1,
+        )
+
+        result = session.run_debate()
+
+        feedbacks = result.record.rounds[0].feedbacks
+        assert [f.role for f in feedbacks] == get_feedback_roles()
+        assert result.final_plan == "Plan"
@@ -1,5 +1,7 @@
 """Tests for LLM provider adapters."""
 
+from unittest.mock import MagicMock
+
 from agentic_orchestrator.providers.base import (
     CompletionResponse,
     Message,
@@ -190,6 +192,8 @@ class TestClaudeProvider:
         """Test API model name mapping."""
         assert "opus" in ClaudeProvider.API_MODELS
         assert "sonnet" in ClaudeProvider.API_MODELS
+        # Aliases pin a dated snapshot so a model release cannot change behavior
+        assert all(name[-8:].isdigit() for name in ClaudeProvider.API_MODELS.values())
 
     def test_chat_method(self):
         """Test simple chat interface."""
@@ -197,3 +201,48 @@ class TestClaudeProvider:
         response = provider.chat("Hello", system_message="Be helpful")
 
         assert "DRY RUN" in response
+
+    def test_chat_cache_system(self):
+        """Test cached system messages are sent with a cache breakpoint."""
+        provider = ClaudeProvider(api_key="test-key", prefer_cli=False)
+        provider._mode = "api"
+        provider._api_client = MagicMock()
+        provider._api_client.messages.create.return_value = MagicMock(
+            content=[MagicMock(text="ok")], usage=None, model="sonnet", stop_reason="end_turn"
+        )
+
+        assert provider.chat("Hello", system_message="Be helpful", cache_system=True) == "ok"
+        system = provider._api_client.messages.create.call_args.kwargs["system"]
+        assert system == [
+            {"type": "text", "text": "Be helpful", "cache_control": {"type": "ephemeral"}}
+        ]
+
+        provider.chat("Hello", system_message="Be helpful")
+        assert provider._api_client.messages.create.call_args.kwargs["system"] == "Be helpful"
+
+    def test_chat_batch(self):
+        """Test chat_batch submits one batch and returns responses in request order."""
+        provider = ClaudeProvider(api_key="test-key", prefer_cli=False)
+        provider._mode = "api"
+        batches = MagicMock()
+        provider._api_client = MagicMock()
+        provider._api_client.messages.batches = batches
+        batches.create.return_value = MagicMock(id="batch-1", processing_status="in_progress")
+        batches.retrieve.return_value = MagicMock(id="batch-1", processing_status="ended")
+
+        def entry(custom_id, result_type, text=""):
+            result = MagicMock(type=result_type)
+            result.message.content = [MagicMock(text=text)]
+            return MagicMock(custom_id=custom_id, result=result)
+
+        batches.results.return_value = [entry("1", "succeeded", "second"), entry("0", "errored")]
+
+        responses = provider.chat_batch(
+            ["first?", "second?"], system_message="Be helpful", cache_system=True, poll_interval=0
+        )
+
+        assert responses == [None, "second"]
+        requests = batches.create.call_args.kwargs["requests"]
+        assert [r["custom_id"] for r in requests] == ["0", "1"]
+        assert requests[1]["params"]["messages"] == [{"role": "user", "content": "second?"}]
+        assert requests[0]["params"]["system"][0]["cache_control"] == {"type": "ephemeral"}
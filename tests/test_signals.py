@@ -1,5 +1,6 @@
 """Tests for signal aggregation and scoring system."""
 
+import httpx
 import pytest
 from datetime import datetime, timedelta
 
@@ -8,6 +9,7 @@ from agentic_orchestrator.adapters.base import (
     AdapterConfig,
     AdapterResult,
 )
+from agentic_orchestrator.adapters.twitter import TwitterAdapter, _parse_feed_entries
 from agentic_orchestrator.signals.scorer import (
     SignalScorer,
     ScoringConfig,
@@ -418,3 +420,113 @@ class TestSignalAggregation:
                 unique.append(signal)
 
         assert len(unique) == 2
+
+
+class TestTwitterAdapter:
+    """Tests for Twitter/X adapter helpers."""
+
+    def test_seen_urls_evict_oldest(self, tmp_path):
+        """Test seen-URL cache is bounded and evicts oldest entries."""
+        adapter = TwitterAdapter(cache_file=tmp_path / "twitter_cache.json")
+        adapter.MAX_SEEN_URLS = 3
+
+        for i in range(5):
+            adapter._remember_url(f"https://nitter.net/a/status/{i}")
+
+        assert list(adapter._seen_urls) == [
+            "https://nitter.net/a/status/2",
+            "https://nitter.net/a/status/3",
+            "https://nitter.net/a/status/4",
+        ]
+
+    def test_seen_urls_persist(self, tmp_path):
+        """Test seen-URL cache survives a new adapter instance."""
+        cache_file = tmp_path / "twitter_cache.json"
+        adapter = TwitterAdapter(cache_file=cache_file)
+        adapter._remember_url("https://nitter.net/a/status/1")
+        adapter._save_cache()
+
+        reloaded = TwitterAdapter(cache_file=cache_file)
+        assert "https://nitter.net/a/status/1" in reloaded._seen_urls
+
+    def test_etags_persist(self, tmp_path):
+        """Test conditional request validators survive a new adapter instance."""
+        cache_file = tmp_path / "twitter_cache.json"
+        adapter = TwitterAdapter(cache_file=cache_file)
+        adapter._etags[("nitter.net", "VitalikButerin")] = ('"abc"', "Mon, 01 Jan 2026 00:00:00 GMT")
+        adapter._save_cache()
+
+        reloaded = TwitterAdapter(cache_file=cache_file)
+        assert reloaded._etags[("nitter.net", "VitalikButerin")] == (
+            '"abc"', "Mon, 01 Jan 2026 00:00:00 GMT"
+        )
+
+    def test_instance_round_robin(self, tmp_path):
+        """Test working instances are rotated evenly."""
+        adapter = TwitterAdapter(cache_file=tmp_path / "twitter_cache.json")
+        adapter._set_working_instances(["a.example", "b.example", "c.example"])
+
+        picks = [next(adapter._instance_cycle) for _ in range(6)]
+        assert sorted(picks[:3]) == ["a.example", "b.example", "c.example"]
+        assert picks[3:] == picks[:3]
+
+    def test_parse_pool_does_not_fork(self):
+        """Test RSS parse workers start from a clean process and can be shut down."""
+        from agentic_orchestrator.adapters import twitter
+
+        pool = twitter._get_parse_pool()
+        try:
+            assert pool._mp_context.get_start_method() != "fork"
+        finally:
+            twitter.shutdown_parse_pool()
+        assert twitter._parse_pool is None
+
+    def test_filter_by_engagement_matches_threshold(self, tmp_path):
+        """Test batch engagement filter keeps tweets meeting the threshold, in order."""
+        adapter = TwitterAdapter(cache_file=tmp_path / "twitter_cache.json")
+        tweets = [
+            {"id": "1", "public_metrics": {"like_count": 5}},
+            {"id": "2", "public_metrics": {"retweet_count": 2}},
+            {"id": "3", "public_metrics": {"like_count": 2, "retweet_count": 1, "reply_count": 4}},
+            {"id": "4", "public_metrics": {"like_count": 1, "reply_count": 1}},
+            {"id": "5"},
+        ]
+
+        passed = adapter._filter_by_engagement(tweets)
+
+        assert [t["id"] for t in passed] == ["1", "2", "3"]
+
+    def test_has_feed_body(self):
+        """Test probe body check uses Content-Length or raw bytes."""
+        assert TwitterAdapter._has_feed_body(
+            httpx.Response(200, headers={"content-length": "500"}, content=b"x" * 500)
+        )
+        assert TwitterAdapter._has_feed_body(httpx.Response(200, content=b"<rss>" * 40))
+        assert not TwitterAdapter._has_feed_body(httpx.Response(200, content=b"<rss/>"))
+
+    def test_parse_feed_entries(self):
+        """Test RSS payload is reduced to plain, picklable entry dicts."""
+        rss = b"""<?xml version="1.0"?><rss version="2.0"><channel><title>t</title>
+        <item><title>First</title><link>https://nitter.net/a/status/1</link>
+        <description>&lt;p&gt;Hello&lt;/p&gt;</description></item>
+        <item><title>Second</title><link>https://nitter.net/a/status/2</link></item>
+        </channel></rss>"""
+
+        entries = _parse_feed_entries(rss, limit=1)
+
+        assert len(entries) == 1
+        assert entries[0]["title"] == "First"
+        assert entries[0]["link"] == "https://nitter.net/a/status/1"
+        assert type(entries[0]) is dict
+
+    def test_analyze_content(self, tmp_path):
+        """Test fused categorization and relevance scoring."""
+        adapter = TwitterAdapter(cache_file=tmp_path / "twitter_cache.json")
+
+        assert adapter._analyze_content("New OpenAI agent for DeFi wallets")[0] == "crypto"
+        assert adapter._analyze_content("Claude ships a new model") == ("ai", 0.0)
+        assert adapter._analyze_content("Rust 2.0 released") == ("tech", 0.0)
+
+        category, relevance = adapter._analyze_content("Mossland metaverse NFT drop")
+        assert category == "crypto"
+        assert relevance == 8.0